@@ -1,13 +1,39 @@
-from .utils import formatting, openai_client, prompts, summary
-from .schemas import (
-    GenerateRequest,
-    ModelSpec,
-    Outline,
-    OutlineRequest,
-    ReasoningEffort,
-    Section,
-)
-from .utils.model_utils import maybe_add_reasoning
+"""Report generation backend.
+
+Attributes are resolved lazily so lightweight entry points (the CLI, payload
+validation) do not pay for the OpenAI SDK or SQLAlchemy unless they use them.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only
+    from .utils import formatting, openai_client, prompts, summary
+    from .schemas import (
+        GenerateRequest,
+        ModelSpec,
+        Outline,
+        OutlineRequest,
+        ReasoningEffort,
+        Section,
+    )
+    from .utils.model_utils import maybe_add_reasoning
+
+_LAZY_ATTRIBUTES = {
+    "formatting": ("backend.utils.formatting", None),
+    "openai_client": ("backend.utils.openai_client", None),
+    "prompts": ("backend.utils.prompts", None),
+    "summary": ("backend.utils.summary", None),
+    "GenerateRequest": ("backend.schemas", "GenerateRequest"),
+    "ModelSpec": ("backend.schemas", "ModelSpec"),
+    "Outline": ("backend.schemas", "Outline"),
+    "OutlineRequest": ("backend.schemas", "OutlineRequest"),
+    "ReasoningEffort": ("backend.schemas", "ReasoningEffort"),
+    "Section": ("backend.schemas", "Section"),
+    "maybe_add_reasoning": ("backend.utils.model_utils", "maybe_add_reasoning"),
+}
 
 __all__ = [
     "formatting",
@@ -22,3 +48,18 @@ __all__ = [
     "Section",
     "maybe_add_reasoning",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,16 +2,37 @@ import asyncio
 import json
 import os
 import uuid
+from contextlib import asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.api.routers import reports, suggestions, topics
+from backend.api.compression import CompressionMiddleware
+from backend.api.dependencies import close_database, get_outline_prefetcher
+from backend.api.routers import outlines, reports, suggestions, topics
+from backend.storage.executor import get_storage_executor
+from backend.utils.metrics import REGISTRY
 
-app = FastAPI(title="Explorer", version="2.0.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    prefetcher = get_outline_prefetcher()
+    if prefetcher is not None:
+        prefetcher.start()
+    try:
+        yield
+    finally:
+        if prefetcher is not None:
+            await prefetcher.stop()
+        # Let in-flight report writes finish before the worker exits.
+        get_storage_executor().shutdown(wait=True)
+        await close_database()
+
+
+app = FastAPI(title="Explorer", version="2.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,8 +40,11 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[reports.NEXT_CURSOR_HEADER, "ETag"],
 )
+app.add_middleware(CompressionMiddleware)
 
+app.include_router(outlines.router)
 app.include_router(reports.router)
 app.include_router(suggestions.router)
 app.include_router(topics.router)
@@ -29,3 +53,10 @@ app.include_router(topics.router)
 def list_routes():
     return {"paths": [route.path for route in app.routes]}
 
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,219 @@
+"""Negotiated gzip/brotli compression for JSON and NDJSON responses.
+
+Unlike Starlette's ``GZipMiddleware``, streamed bodies are sync-flushed after
+every message, so each NDJSON event reaches the client as a complete,
+decodable frame instead of waiting in the compressor's buffer.
+"""
+from __future__ import annotations
+
+import os
+import zlib
+from typing import Dict, Optional, Sequence, Tuple
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.utils.metrics import RESPONSE_COMPRESSION_BYTES
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSION_ENV = "EXPLORER_RESPONSE_COMPRESSION"
+MIN_BYTES_ENV = "EXPLORER_RESPONSE_COMPRESSION_MIN_BYTES"
+_DEFAULT_ENCODINGS = ("br", "gzip")
+_DEFAULT_MIN_BYTES = 1024
+# Moderate levels: report text compresses well at these settings, and the
+# highest levels cost several times the CPU for a few percent.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Bodies at least this large are compressed on a worker thread (zlib and
+# brotli release the GIL) rather than stalling the event loop.
+_THREAD_THRESHOLD = 256 * 1024
+
+_COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _GzipEncoder:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+_ENCODERS = {"gzip": _GzipEncoder, "br": _BrotliEncoder}
+
+
+def available_encodings(requested: Sequence[str]) -> Tuple[str, ...]:
+    """``requested`` in order, minus unknown encodings and brotli when it is not installed."""
+
+    return tuple(
+        encoding for encoding in requested if encoding in _ENCODERS and (encoding != "br" or brotli is not None)
+    )
+
+
+def negotiate_encoding(accept_encoding: str, offered: Sequence[str]) -> Optional[str]:
+    """Pick the client's most preferred encoding among ``offered`` (ties go to ``offered`` order)."""
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[token] = weight
+    best: Optional[str] = None
+    best_weight = 0.0
+    for encoding in offered:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Compress JSON, NDJSON and text responses the client accepts.
+
+    Complete bodies under ``minimum_size`` bytes are sent as is; streamed
+    bodies are always compressed and flushed after every message. When an
+    encoding was negotiated, strong ETags become weak (the bytes differ per
+    encoding) on every compressible response, whatever its size, and on 304s,
+    so a revalidation answers with the ETag the client already holds;
+    ``If-None-Match`` matches either form.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Optional[Sequence[str]] = None,
+        minimum_size: Optional[int] = None,
+    ) -> None:
+        self.app = app
+        if encodings is None:
+            configured = os.environ.get(COMPRESSION_ENV, ",".join(_DEFAULT_ENCODINGS)).strip().lower()
+            encodings = () if configured in ("", "0", "off", "false") else configured.split(",")
+        self.encodings = available_encodings([encoding.strip() for encoding in encodings])
+        if minimum_size is None:
+            minimum_size = int(os.environ.get(MIN_BYTES_ENV, _DEFAULT_MIN_BYTES))
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.encodings:
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+            if encoding is not None:
+                await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def _mark_negotiated(headers: MutableHeaders) -> None:
+    # The same for every response once an encoding was negotiated, so 200s
+    # of any size and 304s carry one ETag form per client.
+    headers.add_vary_header("Accept-Encoding")
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send
+        self.start_message: Optional[Message] = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = "content-encoding" in headers or not content_type.startswith(_COMPRESSIBLE_TYPES)
+            if message["status"] == 304 or not self.passthrough:
+                _mark_negotiated(MutableHeaders(raw=message["headers"]))
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Held back until the first body message shows whether the
+                # response is streamed and how large it is.
+                self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            self.encoder = _ENCODERS[self.encoding]()
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                compressed = await self._compress(body, final=True)
+                headers["Content-Length"] = str(len(compressed))
+                self._count(len(body), len(compressed))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            await self.send(start)
+
+        compressed = await self._compress(body, final=not more_body)
+        self._count(len(body), len(compressed))
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        if len(body) >= _THREAD_THRESHOLD:
+            return await anyio.to_thread.run_sync(self._encode, body, final)
+        return self._encode(body, final)
+
+    def _encode(self, body: bytes, final: bool) -> bytes:
+        # Streamed messages are sync-flushed so each one decodes on its own.
+        return self.encoder.compress(body) + (self.encoder.finish() if final else self.encoder.flush())
+
+    def _count(self, raw: int, encoded: int) -> None:
+        RESPONSE_COMPRESSION_BYTES.inc(raw, encoding=self.encoding, side="raw")
+        RESPONSE_COMPRESSION_BYTES.inc(encoded, encoding=self.encoding, side="encoded")
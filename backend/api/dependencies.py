@@ -2,9 +2,20 @@ from functools import lru_cache
 import os
 from typing import Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-from backend.db import Base, create_engine_from_url, create_session_factory
+from backend.db import (
+    CommitQueue,
+    create_async_engine_from_url,
+    create_async_session_factory,
+    create_session_factory,
+    default_database_url,
+    dispose_engines,
+    get_engine,
+)
+from backend.services.outline_cache import OutlineCache
+from backend.services.outline_prefetch import OutlinePrefetcher
 from backend.services.outline_service import OutlineService
 from backend.services.report_service import ReportGeneratorService
 from backend.services.suggestion_service import SuggestionService
@@ -12,14 +23,25 @@ from backend.storage import GeneratedReportStore
 
 @lru_cache
 def get_outline_service() -> OutlineService:
-    return OutlineService()
+    return OutlineService(cache=OutlineCache.from_env())
+
+
+@lru_cache
+def get_outline_prefetcher() -> Optional[OutlinePrefetcher]:
+    try:
+        outline_service = get_outline_service()
+    except Exception:
+        # Prefetching is optional; routes that feed it must keep working without OpenAI credentials.
+        return None
+    return OutlinePrefetcher.from_env(outline_service)
 
 
 @lru_cache
 def get_report_store() -> Optional[GeneratedReportStore]:
     if os.environ.get("EXPLORER_DISABLE_STORAGE", "").lower() in {"1", "true", "yes", "on"}:
         return None
-    return GeneratedReportStore()
+    # Share the API's engine and single writer so report rows and route writes are group-committed together.
+    return GeneratedReportStore(session_factory=get_session_factory(), commit_queue=get_commit_queue())
 
 
 @lru_cache
@@ -32,10 +54,30 @@ def get_report_service() -> ReportGeneratorService:
 
 @lru_cache
 def get_session_factory() -> sessionmaker[Session]:
-    database_url = os.environ.get("EXPLORER_DATABASE_URL", "sqlite:///data/reportgen.db")
-    engine = create_engine_from_url(database_url)
-    Base.metadata.create_all(engine)
-    return create_session_factory(engine)
+    return create_session_factory(get_engine())
+
+
+@lru_cache
+def get_commit_queue() -> CommitQueue:
+    return CommitQueue.from_env(get_session_factory())
+
+
+@lru_cache
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    # The shared sync engine creates tables and runs the lightweight migrations.
+    get_engine()
+    return create_async_session_factory(create_async_engine_from_url(default_database_url()))
+
+
+async def close_database() -> None:
+    """Drain the single writer and close pooled connections of every engine created so far."""
+
+    if get_commit_queue.cache_info().currsize:
+        get_commit_queue().close(wait=True)
+    if get_async_session_factory.cache_info().currsize:
+        engine = get_async_session_factory().kw["bind"]
+        await engine.dispose()
+    dispose_engines()
 
 
 @lru_cache
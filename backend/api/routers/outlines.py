@@ -0,0 +1,95 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from backend.api.dependencies import get_outline_service
+from backend.schemas import OutlineBatchRequest, OutlineRequest
+from backend.services.outline_service import OutlineParsingError, OutlineService
+from backend.utils.metrics import STREAM_BYTES
+
+router = APIRouter()
+
+@router.post("/outline")
+async def generate_outline(
+    outline_request: OutlineRequest,
+    outline_service: OutlineService = Depends(get_outline_service),
+) -> Dict[str, Any]:
+    try:
+        return await outline_service.handle_outline_request(outline_request)
+    except OutlineParsingError as exception:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"The model returned an unusable outline: {exception}",
+        ) from exception
+
+
+@router.post("/outlines/batch")
+def generate_outlines_batch(
+    batch_request: OutlineBatchRequest,
+    outline_service: OutlineService = Depends(get_outline_service),
+):
+    """Stream one NDJSON line per topic in completion order, then a summary line.
+
+    At most ``concurrency`` outlines are generated at once; every LLM call
+    also goes through the shared limiter used by report generation, and
+    JSON outlines are served from and written to the shared outline cache.
+    """
+
+    return StreamingResponse(
+        _encode_events(_batch_events(batch_request, outline_service)),
+        media_type="application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+async def _batch_events(
+    batch_request: OutlineBatchRequest, outline_service: OutlineService
+) -> AsyncIterator[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(batch_request.concurrency)
+
+    async def outline_one(index: int, topic: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                outline_request = OutlineService.build_outline_request(
+                    topic,
+                    batch_request.format,
+                    model_spec=batch_request.model,
+                    sections=batch_request.sections,
+                    subject_inclusions=batch_request.subject_inclusions,
+                    subject_exclusions=batch_request.subject_exclusions,
+                )
+                result = await outline_service.handle_outline_request(outline_request)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                return {"status": "error", "index": index, "topic": topic, "detail": str(exception)}
+            return {"status": "complete", "index": index, "topic": topic, "result": result}
+
+    tasks = [
+        asyncio.ensure_future(outline_one(index, topic))
+        for index, topic in enumerate(batch_request.topics)
+    ]
+    failed = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            event = await next_done
+            failed += event["status"] == "error"
+            yield event
+    finally:
+        # Client went away mid-batch: stop spending on outlines nobody will read.
+        for task in tasks:
+            task.cancel()
+    yield {"status": "done", "total": len(tasks), "failed": failed}
+
+
+async def _encode_events(events: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for event in events:
+        line = (json.dumps(event) + "\n").encode("utf-8")
+        STREAM_BYTES.inc(len(line), endpoint="outlines_batch")
+        yield line
@@ -1,45 +1,81 @@
 import asyncio
+import base64
 import json
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 import uuid
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 from pydantic import EmailStr
-from sqlalchemy import select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import Row, Select, String, or_, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from starlette.background import BackgroundTask
 
 from backend.api.dependencies import (
-    get_session_factory,
+    get_async_session_factory,
+    get_commit_queue,
     get_report_store,
     get_report_service,
 )
-from backend.db import Report, session_scope
+from backend.db import CommitQueue, Report, SavedTopic, async_session_scope
 from backend.schemas import ReportResponse, GenerateRequest
 from backend.services.report_service import ReportGeneratorService
-from backend.storage import GeneratedReportStore
+from backend.storage import ContentStats, GeneratedReportStore
+from backend.utils.metrics import (
+    GENERATIONS_ACTIVE,
+    GENERATIONS_QUEUED,
+    STREAM_BYTES,
+)
 from backend.utils.api_helpers import (
     normalize_user,
+    find_user_async,
     get_or_create_user,
     resolve_base_dir,
+    load_many_async,
     load_report_content,
+    load_report_content_async,
+    load_report_stats,
+    make_etag,
+    not_modified,
+    require_admin_token,
+    user_listing_etag,
 )
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_REPORTS_PAGE = 200
+
 @router.post("/generate_report")
 def generate_report(
     generate_request: GenerateRequest,
+    profile: bool = Query(False, description="Admin only: run under the sampling profiler and save the profile with the report."),
+    admin_token: Optional[str] = Header(None, alias="X-Explorer-Admin-Token"),
     report_service: ReportGeneratorService = Depends(get_report_service),
 ):
+    if profile:
+        require_admin_token(admin_token)
+    tracker = _GenerationTracker()
+
     async def event_stream():
+        tracker.start()
+        events = (
+            report_service.stream_report(generate_request, profile=True)
+            if profile
+            else report_service.stream_report(generate_request)
+        )
         try:
-            async for event in report_service.stream_report(generate_request):
-                yield json.dumps(event) + "\n"
+            async for event in events:
+                yield _encode_event(event)
         except asyncio.CancelledError:
             raise
         except Exception as exception:  # pragma: no cover - defensive
-            yield json.dumps({"status": "error", "detail": str(exception)}) + "\n"
+            yield _encode_event({"status": "error", "detail": str(exception)})
+        finally:
+            tracker.finish()
 
     return StreamingResponse(
         event_stream(),
@@ -48,90 +84,228 @@ def generate_report(
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
         },
+        # Runs even when the client disconnects before the stream starts.
+        background=BackgroundTask(tracker.finish),
     )
 
 
+def _encode_event(event: Dict[str, Any]) -> bytes:
+    line = (json.dumps(event) + "\n").encode("utf-8")
+    STREAM_BYTES.inc(len(line), endpoint="generate_report")
+    return line
+
+
+class _GenerationTracker:
+    """Moves one generation through the queued -> active -> done gauges exactly once."""
+
+    def __init__(self) -> None:
+        self._state = "queued"
+        GENERATIONS_QUEUED.inc()
+
+    def start(self) -> None:
+        if self._state == "queued":
+            GENERATIONS_QUEUED.dec()
+            GENERATIONS_ACTIVE.inc()
+            self._state = "active"
+
+    def finish(self) -> None:
+        if self._state == "queued":
+            GENERATIONS_QUEUED.dec()
+        elif self._state == "active":
+            GENERATIONS_ACTIVE.dec()
+        self._state = "done"
+
+
 @router.get("/reports", response_model=List[ReportResponse])
-def list_reports(
+async def list_reports(
+    response: Response,
     user_email: EmailStr = Query(..., description="Email used to scope results to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    include_content: bool = Query(False, description="When true, includes report content from storage."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    include_content: Union[bool, Literal["snippet"]] = Query(
+        False,
+        description="When true, includes report content from storage; `snippet` returns a preview, word count and reading time instead.",
+    ),
+    limit: int = Query(50, ge=1, le=MAX_REPORTS_PAGE, description="Maximum reports to return."),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page."),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
     report_store: Optional[GeneratedReportStore] = Depends(get_report_store),
 ):
+    """List the user's reports, newest first, one keyset page at a time.
+
+    When more reports follow, the ``X-Next-Cursor`` response header holds
+    the ``cursor`` for the next page. The ``ETag`` changes whenever any of
+    the user's reports or topics does; a matching ``If-None-Match`` gets a
+    304 before any report row or file is read. An unknown user has no reports.
+    """
+
     user_email, username = normalize_user(user_email, username)
     base_dir = resolve_base_dir(report_store)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        reports = session.scalars(
-            select(Report)
-            .where(
-                Report.owner_user_id == user.id,
-                Report.is_deleted.is_(False),
-            )
-            .order_by(Report.created_at.desc())
-        ).all()
-        return [
-            ReportResponse(
-                id=report.id,
-                topic=report.saved_topic.title if report.saved_topic else "",
-                title=(
-                    (report.outline_snapshot or {}).get("report_title")
-                    if report.outline_snapshot
-                    else report.saved_topic.title if report.saved_topic else None
-                ),
-                status=report.status,
-                summary=report.summary,
-                content=load_report_content(report, base_dir) if include_content else None,
-                created_at=report.created_at.isoformat(),
-                updated_at=report.updated_at.isoformat(),
+    async with async_session_scope(session_factory) as session:
+        user = await find_user_async(session, user_email)
+        if user is None:
+            return []
+        etag, last_modified = user_listing_etag(user, "reports", include_content, limit, cursor)
+        unchanged = not_modified(response, if_none_match, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
+        dialect_name = session.bind.dialect.name
+        created_at_key = _created_at_key(dialect_name)
+        query = (
+            _report_rows(created_at_key)
+            .where(Report.owner_user_id == user.id, Report.is_deleted.is_(False))
+            .order_by(created_at_key.desc(), Report.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor:
+            created_at, report_id = _decode_cursor(cursor, dialect_name)
+            # The redundant ``<=`` bound gives the planner an index range on
+            # (owner_user_id, created_at); the OR breaks ties on id.
+            query = query.where(
+                created_at_key <= created_at,
+                or_(created_at_key < created_at, Report.id < report_id),
             )
-            for report in reports
-        ]
+        rows = (await session.execute(query)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(rows[-1].created_at_key, rows[-1].id)
+    if include_content == "snippet":
+        # Reports finalized before snippets were stored fall back to their (cached) content file.
+        missing = [row.content_uri if row.word_count is None else None for row in rows]
+        computed = await load_many_async(load_report_stats, missing, base_dir)
+        return [_report_response(row, None, _row_stats(row) or stats) for row, stats in zip(rows, computed)]
+    if include_content:
+        contents = await load_many_async(load_report_content, [row.content_uri for row in rows], base_dir)
+    else:
+        contents = [None] * len(rows)
+    return [_report_response(row, content) for row, content in zip(rows, contents)]
 
 
 @router.get("/reports/{report_id}", response_model=ReportResponse)
-def get_report(
+async def get_report(
     report_id: uuid.UUID,
+    response: Response,
     user_email: EmailStr = Query(..., description="Email used to scope the request to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
     report_store: Optional[GeneratedReportStore] = Depends(get_report_store),
 ):
+    """Return one report with its content.
+
+    Finished reports carry an ``ETag`` derived from the stored artifact's
+    hash; a matching ``If-None-Match`` gets a 304 without reading the file.
+    """
+
     user_email, username = normalize_user(user_email, username)
     base_dir = resolve_base_dir(report_store)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        report = session.get(Report, report_id)
-        if not report or report.owner_user_id != user.id or report.is_deleted:
+    async with async_session_scope(session_factory) as session:
+        user = await find_user_async(session, user_email)
+        if user is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
-        return ReportResponse(
-            id=report.id,
-            topic=report.saved_topic.title if report.saved_topic else "",
-            title=(
-                (report.outline_snapshot or {}).get("report_title")
-                if report.outline_snapshot
-                else report.saved_topic.title if report.saved_topic else None
-            ),
-            status=report.status,
-            summary=report.summary,
-            content=load_report_content(report, base_dir),
-            created_at=report.created_at.isoformat(),
-            updated_at=report.updated_at.isoformat(),
-        )
+        row = (
+            await session.execute(
+                _report_rows(_created_at_key(session.bind.dialect.name)).where(
+                    Report.id == report_id,
+                    Report.owner_user_id == user.id,
+                    Report.is_deleted.is_(False),
+                )
+            )
+        ).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
+    if row.content_hash:
+        etag = make_etag(row.id, row.content_hash, row.updated_at.isoformat())
+        unchanged = not_modified(response, if_none_match, etag, row.updated_at)
+        if unchanged is not None:
+            return unchanged
+    return _report_response(row, await load_report_content_async(row.content_uri, base_dir))
 
 
 @router.delete("/reports/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_report(
+async def delete_report(
     report_id: uuid.UUID,
     user_email: EmailStr = Query(..., description="Email used to scope the delete to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    commit_queue: CommitQueue = Depends(get_commit_queue),
 ):
     user_email, username = normalize_user(user_email, username)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        report = session.get(Report, report_id)
-        if not report or report.owner_user_id != user.id or report.is_deleted:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
-        report.is_deleted = True
+    deleted = await commit_queue.run_async(lambda session: _delete_report(session, user_email, username, report_id))
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found.")
+
+
+def _delete_report(session: Session, user_email: str, username: Optional[str], report_id: uuid.UUID) -> bool:
+    # Runs on the single database writer (see ``CommitQueue``).
+    user = get_or_create_user(session, user_email, username)
+    report = session.get(Report, report_id)
+    if not report or report.owner_user_id != user.id or report.is_deleted:
+        return False
+    report.is_deleted = True
+    return True
+
+
+def _created_at_key(dialect_name: str) -> ColumnElement:
+    # SQLite keeps timestamps as text, and CURRENT_TIMESTAMP's format (no
+    # microseconds) differs from how a bound datetime is rendered; comparing
+    # the stored text keeps reports created in the same second exact.
+    if dialect_name == "sqlite":
+        return type_coerce(Report.created_at, String)
+    return Report.created_at
+
+
+def _report_rows(created_at_key: ColumnElement) -> Select:
+    """Columns the report responses need, with the topic title joined in."""
+
+    return select(
+        Report.id,
+        SavedTopic.title.label("topic"),
+        Report.outline_snapshot["report_title"].as_string().label("title"),
+        Report.status,
+        Report.summary,
+        Report.content_uri,
+        Report.content_hash,
+        Report.snippet,
+        Report.word_count,
+        Report.created_at,
+        Report.updated_at,
+        created_at_key.label("created_at_key"),
+    ).join(SavedTopic, Report.saved_topic_id == SavedTopic.id)
+
+
+def _encode_cursor(created_at_key: Any, report_id: uuid.UUID) -> str:
+    key = created_at_key.isoformat() if isinstance(created_at_key, datetime) else str(created_at_key)
+    raw = json.dumps([key, str(report_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, dialect_name: str) -> Tuple[Any, uuid.UUID]:
+    try:
+        key, report_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(key, str):
+            raise ValueError(key)
+        return (key if dialect_name == "sqlite" else datetime.fromisoformat(key)), uuid.UUID(report_id)
+    except (ValueError, TypeError) as exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor.") from exception
+
+
+def _row_stats(row: Row) -> Optional[ContentStats]:
+    if row.word_count is None:
+        return None
+    return ContentStats(snippet=row.snippet or "", word_count=row.word_count)
+
+
+def _report_response(row: Row, content: Optional[str], stats: Optional[ContentStats] = None) -> ReportResponse:
+    return ReportResponse(
+        id=row.id,
+        topic=row.topic or "",
+        title=row.title or row.topic,
+        status=row.status,
+        summary=row.summary,
+        content=content,
+        snippet=stats.snippet if stats else None,
+        word_count=stats.word_count if stats else None,
+        reading_minutes=stats.reading_minutes if stats else None,
+        created_at=row.created_at.isoformat(),
+        updated_at=row.updated_at.isoformat(),
+    )
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends
 
-from backend.api.dependencies import get_suggestion_service
+from backend.api.dependencies import get_outline_prefetcher, get_suggestion_service
 from backend.schemas import SuggestionsRequest, SuggestionsResponse
+from backend.services.outline_prefetch import OutlinePrefetcher
 from backend.services.suggestion_service import SuggestionService
 
 router = APIRouter()
@@ -10,5 +13,9 @@ router = APIRouter()
 async def generate_suggestions(
     suggestions_request: SuggestionsRequest,
     suggestion_service: SuggestionService = Depends(get_suggestion_service),
+    prefetcher: Optional[OutlinePrefetcher] = Depends(get_outline_prefetcher),
 ) -> SuggestionsResponse:
-    return await suggestion_service.generate(suggestions_request)
+    response = await suggestion_service.generate(suggestions_request)
+    if prefetcher is not None:
+        prefetcher.submit(item.title for item in response.suggestions)
+    return response
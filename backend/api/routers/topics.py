@@ -1,133 +1,159 @@
 from typing import List, Optional
 import uuid
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, Response, status
 from pydantic import EmailStr
 from sqlalchemy import select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
-from backend.api.dependencies import get_session_factory
-from backend.db import SavedTopic, Report, session_scope
+from backend.api.dependencies import get_async_session_factory, get_commit_queue, get_outline_prefetcher
+from backend.db import CommitQueue, SavedTopic, Report, async_session_scope
 from backend.schemas import SavedTopicResponse, CreateSavedTopicRequest
+from backend.services.outline_prefetch import OutlinePrefetcher
 from backend.utils.api_helpers import (
     normalize_user,
+    find_user_async,
     get_or_create_user,
+    not_modified,
     resolve_topic_title,
     slugify,
+    user_listing_etag,
 )
 
 router = APIRouter()
 
 @router.get("/saved_topics", response_model=List[SavedTopicResponse])
-def list_saved_topics(
+async def list_saved_topics(
+    response: Response,
     user_email: EmailStr = Query(..., description="Email used to scope results to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+    prefetcher: Optional[OutlinePrefetcher] = Depends(get_outline_prefetcher),
 ):
+    """List the user's saved topics, newest first.
+
+    A matching ``If-None-Match`` gets a 304 without loading the topics (and
+    without prefetching their outlines again). An unknown user has no topics.
+    """
+
     user_email, username = normalize_user(user_email, username)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        topics = session.scalars(
-            select(SavedTopic)
-            .where(
-                SavedTopic.owner_user_id == user.id,
-                SavedTopic.is_deleted.is_(False),
+    async with async_session_scope(session_factory) as session:
+        user = await find_user_async(session, user_email)
+        if user is None:
+            return []
+        etag, last_modified = user_listing_etag(user, "saved_topics")
+        unchanged = not_modified(response, if_none_match, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
+        topics = (
+            await session.scalars(
+                select(SavedTopic)
+                .where(
+                    SavedTopic.owner_user_id == user.id,
+                    SavedTopic.is_deleted.is_(False),
+                )
+                .order_by(SavedTopic.created_at.desc())
             )
-            .order_by(SavedTopic.created_at.desc())
         ).all()
-        return [
-            SavedTopicResponse(
-                id=topic.id,
-                title=topic.title,
-                slug=topic.slug,
-                created_at=topic.created_at.isoformat(),
-            )
-            for topic in topics
-        ]
+        if prefetcher is not None:
+            prefetcher.submit(topic.title for topic in topics)
+        return [_topic_response(topic) for topic in topics]
 
 
 @router.post("/saved_topics", response_model=SavedTopicResponse, status_code=status.HTTP_201_CREATED)
-def create_saved_topic(
+async def create_saved_topic(
     payload: CreateSavedTopicRequest,
     user_email: EmailStr = Query(..., description="Email used to scope the new topic to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    commit_queue: CommitQueue = Depends(get_commit_queue),
+    prefetcher: Optional[OutlinePrefetcher] = Depends(get_outline_prefetcher),
 ):
     user_email, username = normalize_user(user_email, username)
     title = resolve_topic_title(payload.title)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        existing = session.scalar(
-            select(SavedTopic).where(
-                SavedTopic.owner_user_id == user.id,
-                SavedTopic.title == title,
-            )
-        )
-        if existing:
-            if existing.is_deleted:
-                existing.is_deleted = False
-            return SavedTopicResponse(
-                id=existing.id,
-                title=existing.title,
-                slug=existing.slug,
-                created_at=existing.created_at.isoformat(),
-            )
-
-        base_slug = slugify(title)
-        slug = base_slug
-        attempt = 0
-        while True:
-            conflict = session.scalar(select(SavedTopic).where(SavedTopic.slug == slug))
-            if conflict is None:
-                break
-            if conflict.owner_user_id == user.id and conflict.title == title:
-                existing_topic = conflict
-                if existing_topic.is_deleted:
-                    existing_topic.is_deleted = False
-                return SavedTopicResponse(
-                    id=existing_topic.id,
-                    title=existing_topic.title,
-                    slug=existing_topic.slug,
-                    created_at=existing_topic.created_at.isoformat(),
-                )
-            attempt += 1
-            slug = f"{base_slug}-{attempt}"
-
-        topic = SavedTopic(
-            slug=slug,
-            title=title,
-            owner=user,
-        )
-        session.add(topic)
-        session.flush()
-        return SavedTopicResponse(
-            id=topic.id,
-            title=topic.title,
-            slug=topic.slug,
-            created_at=topic.created_at.isoformat(),
-        )
+    if prefetcher is not None:
+        prefetcher.submit([title])
+    return await commit_queue.run_async(lambda session: _create_saved_topic(session, user_email, username, title))
 
 
 @router.delete("/saved_topics/{topic_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_saved_topic(
+async def delete_saved_topic(
     topic_id: uuid.UUID,
     user_email: EmailStr = Query(..., description="Email used to scope the delete to the current user."),
     username: Optional[str] = Query(None, description="Optional username stored when creating the user record."),
-    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    commit_queue: CommitQueue = Depends(get_commit_queue),
 ):
     user_email, username = normalize_user(user_email, username)
-    with session_scope(session_factory) as session:
-        user = get_or_create_user(session, user_email, username)
-        topic = session.get(SavedTopic, topic_id)
-        if not topic or topic.owner_user_id != user.id or topic.is_deleted:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved topic not found.")
-        topic.is_deleted = True
-        reports = session.scalars(
-            select(Report).where(
-                Report.saved_topic_id == topic.id,
-                Report.owner_user_id == user.id,
-                Report.is_deleted.is_(False),
-            )
-        ).all()
-        for report in reports:
-            report.is_deleted = True
+    deleted = await commit_queue.run_async(
+        lambda session: _delete_saved_topic(session, user_email, username, topic_id)
+    )
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Saved topic not found.")
+
+
+# Writes run on the single database writer (see ``CommitQueue``), so they use sync sessions.
+
+
+def _create_saved_topic(session: Session, user_email: str, username: Optional[str], title: str) -> SavedTopicResponse:
+    user = get_or_create_user(session, user_email, username)
+    existing = session.scalar(
+        select(SavedTopic).where(
+            SavedTopic.owner_user_id == user.id,
+            SavedTopic.title == title,
+        )
+    )
+    if existing:
+        if existing.is_deleted:
+            existing.is_deleted = False
+        return _topic_response(existing)
+
+    base_slug = slugify(title)
+    slug = base_slug
+    attempt = 0
+    while True:
+        conflict = session.scalar(select(SavedTopic).where(SavedTopic.slug == slug))
+        if conflict is None:
+            break
+        if conflict.owner_user_id == user.id and conflict.title == title:
+            if conflict.is_deleted:
+                conflict.is_deleted = False
+            return _topic_response(conflict)
+        attempt += 1
+        slug = f"{base_slug}-{attempt}"
+
+    topic = SavedTopic(
+        slug=slug,
+        title=title,
+        owner=user,
+    )
+    session.add(topic)
+    session.flush()
+    return _topic_response(topic)
+
+
+def _delete_saved_topic(session: Session, user_email: str, username: Optional[str], topic_id: uuid.UUID) -> bool:
+    user = get_or_create_user(session, user_email, username)
+    topic = session.get(SavedTopic, topic_id)
+    if not topic or topic.owner_user_id != user.id or topic.is_deleted:
+        return False
+    topic.is_deleted = True
+    reports = session.scalars(
+        select(Report).where(
+            Report.saved_topic_id == topic.id,
+            Report.owner_user_id == user.id,
+            Report.is_deleted.is_(False),
+        )
+    ).all()
+    for report in reports:
+        report.is_deleted = True
+    return True
+
+
+def _topic_response(topic: SavedTopic) -> SavedTopicResponse:
+    return SavedTopicResponse(
+        id=topic.id,
+        title=topic.title,
+        slug=topic.slug,
+        created_at=topic.created_at.isoformat(),
+    )
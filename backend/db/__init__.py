@@ -2,31 +2,84 @@
 Database access layer exposing SQLAlchemy models and session helpers.
 
 This module centralizes imports so application code can simply consume
-``backend.db`` to work with the persistence layer.
+``backend.db`` to work with the persistence layer. Attributes are resolved on
+first access so importing ``backend.db.enums`` does not load SQLAlchemy.
 """
 
-from .models import (
-    Base,
-    Report,
-    ReportStatus,
-    SavedTopic,
-    User,
-    UserStatus,
-)
-from .session import (
-    create_engine_from_url,
-    create_session_factory,
-    session_scope,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only
+    from .commit_queue import CommitQueue
+    from .enums import ReportStatus, UserStatus
+    from .models import Base, Report, ReportSection, SavedTopic, User
+    from .session import (
+        apply_sqlite_profile,
+        async_session_scope,
+        create_async_engine_from_url,
+        create_async_session_factory,
+        create_engine_from_url,
+        create_session_factory,
+        default_database_url,
+        dispose_engines,
+        get_engine,
+        session_scope,
+    )
+
+_LAZY_ATTRIBUTES = {
+    "Base": ".models",
+    "CommitQueue": ".commit_queue",
+    "Report": ".models",
+    "ReportSection": ".models",
+    "ReportStatus": ".enums",
+    "SavedTopic": ".models",
+    "User": ".models",
+    "UserStatus": ".enums",
+    "apply_sqlite_profile": ".session",
+    "async_session_scope": ".session",
+    "create_async_engine_from_url": ".session",
+    "create_async_session_factory": ".session",
+    "create_engine_from_url": ".session",
+    "create_session_factory": ".session",
+    "default_database_url": ".session",
+    "dispose_engines": ".session",
+    "get_engine": ".session",
+    "session_scope": ".session",
+}
 
 __all__ = [
     "Base",
+    "CommitQueue",
     "Report",
+    "ReportSection",
     "ReportStatus",
     "SavedTopic",
     "User",
     "UserStatus",
+    "apply_sqlite_profile",
+    "async_session_scope",
+    "create_async_engine_from_url",
+    "create_async_session_factory",
     "create_engine_from_url",
     "create_session_factory",
+    "default_database_url",
+    "dispose_engines",
+    "get_engine",
     "session_scope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
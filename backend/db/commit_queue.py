@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.utils.metrics import DB_COMMIT_BATCH_SIZE
+
+from .session import session_scope
+
+_MAX_BATCH_ENV = "EXPLORER_DB_COMMIT_BATCH"
+_DEFAULT_MAX_BATCH = 32
+
+T = TypeVar("T")
+WriteOperation = Callable[[Session], T]
+
+
+@dataclass
+class _PendingWrite:
+    operation: WriteOperation
+    future: Future = field(default_factory=Future)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+class CommitQueue:
+    """Single writer thread that serializes and group-commits database writes.
+
+    Callers hand over ``operation(session)`` callables instead of opening
+    their own write transactions. The writer drains whatever is queued (up
+    to ``max_batch`` operations), runs them in one transaction and commits
+    once, so N concurrent writers cost one commit (and, on SQLite, one
+    fsync) instead of N lock-contending ones. If any operation in a batch
+    fails, the batch is rolled back and each operation is retried in its own
+    transaction, so only the failing caller sees the error. Operations must
+    therefore only touch the session; return plain values or loaded ORM
+    objects (sessions do not expire on commit).
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session], *, max_batch: int = _DEFAULT_MAX_BATCH) -> None:
+        self._session_factory = session_factory
+        self.max_batch = max(1, max_batch)
+        self._queue: "queue.SimpleQueue[Optional[_PendingWrite]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.operations = 0
+
+    @classmethod
+    def from_env(cls, session_factory: sessionmaker[Session]) -> "CommitQueue":
+        return cls(session_factory, max_batch=int(os.environ.get(_MAX_BATCH_ENV, _DEFAULT_MAX_BATCH)))
+
+    def submit(self, operation: WriteOperation[T]) -> "Future[T]":
+        pending = _PendingWrite(operation)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="explorer-db-writer", daemon=True)
+                self._thread.start()
+            self._queue.put(pending)
+        return pending.future
+
+    def run(self, operation: WriteOperation[T]) -> T:
+        """Run ``operation`` on the writer thread and wait for its commit."""
+
+        return self.submit(operation).result()
+
+    async def run_async(self, operation: WriteOperation[T]) -> T:
+        return await asyncio.wrap_future(self.submit(operation))
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the writer after the operations already queued have committed."""
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(None)
+        if wait:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            batch = [pending for pending in batch if pending.future.set_running_or_notify_cancel()]
+            if batch:
+                self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: List[_PendingWrite]) -> None:
+        try:
+            results = self._transaction(batch)
+        except Exception as exception:
+            if len(batch) == 1:
+                batch[0].future.set_exception(exception)
+                return
+            for pending in batch:
+                self._commit([pending])
+            return
+        for pending, result in zip(batch, results):
+            pending.future.set_result(result)
+
+    def _transaction(self, batch: List[_PendingWrite]) -> List[object]:
+        with session_scope(self._session_factory) as session:
+            self._begin(session)
+            results = [pending.context.run(pending.operation, session) for pending in batch]
+        self.batches += 1
+        self.operations += len(batch)
+        DB_COMMIT_BATCH_SIZE.observe(len(batch))
+        return results
+
+    @staticmethod
+    def _begin(session: Session) -> None:
+        url = session.get_bind().url
+        if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+            # Take the write lock up front: a deferred transaction that reads
+            # first fails at once (without waiting out busy_timeout) if another
+            # connection commits before it upgrades to a writer.
+            session.execute(text("BEGIN IMMEDIATE"))
@@ -0,0 +1,24 @@
+"""Status enums shared by the ORM models and the API schemas.
+
+Kept free of SQLAlchemy imports so request validation does not load the ORM.
+"""
+
+from __future__ import annotations
+
+import enum
+
+
+class UserStatus(str, enum.Enum):
+    ACTIVE = "active"
+    SUSPENDED = "suspended"
+
+
+class ReportStatus(str, enum.Enum):
+    DRAFT = "draft"
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    ARCHIVED = "archived"
+
+
+__all__ = ["ReportStatus", "UserStatus"]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import enum
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set
 
 from sqlalchemy import (
     Boolean,
@@ -16,13 +16,17 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
     func,
+    update,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
 from sqlalchemy.types import CHAR, TypeDecorator
 
+from .enums import ReportStatus, UserStatus
+
 
 class Base(DeclarativeBase):
     """Declarative base shared by all persistence models."""
@@ -76,19 +80,6 @@ class SoftDeleteMixin:
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
 
-class UserStatus(str, enum.Enum):
-    ACTIVE = "active"
-    SUSPENDED = "suspended"
-
-
-class ReportStatus(str, enum.Enum):
-    DRAFT = "draft"
-    RUNNING = "running"
-    COMPLETE = "complete"
-    FAILED = "failed"
-    ARCHIVED = "archived"
-
-
 class User(Base, TimestampMixin):
     """Registered user capable of owning topics and generated reports."""
 
@@ -122,6 +113,12 @@ class User(Base, TimestampMixin):
     usage_counters: Mapped[Dict[str, int]] = mapped_column(
         MutableDict.as_mutable(JSON), default=dict
     )
+    # Advanced whenever one of the user's topics or reports changes; the
+    # listing routes derive their ETags from it.
+    content_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    content_changed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     reports: Mapped[List["Report"]] = relationship(
         back_populates="owner",
@@ -201,12 +198,19 @@ class Report(Base, TimestampMixin, SoftDeleteMixin):
     language: Mapped[str] = mapped_column(String(16), default="en", nullable=False)
     output_format: Mapped[str] = mapped_column(String(32), default="markdown", nullable=False)
     content_uri: Mapped[Optional[str]] = mapped_column(String(500))
+    content_hash: Mapped[Optional[str]] = mapped_column(String(80))
     summary: Mapped[Optional[str]] = mapped_column(Text)
+    # Listing preview computed when the report is finalized.
+    snippet: Mapped[Optional[str]] = mapped_column(String(500))
+    word_count: Mapped[Optional[int]] = mapped_column(Integer)
+    # Legacy blob of the outline plus every written section; section bodies
+    # now live in ``report_sections``. Large JSON columns are deferred so
+    # listing queries only load the small metadata columns.
     sections: Mapped[Dict[str, Any]] = mapped_column(
-        MutableDict.as_mutable(JSON), default=dict
+        MutableDict.as_mutable(JSON), default=dict, deferred=True
     )
     source_references: Mapped[List[Dict[str, Any]]] = mapped_column(
-        MutableList.as_mutable(JSON), default=list
+        MutableList.as_mutable(JSON), default=list, deferred=True
     )
     model_versions: Mapped[Dict[str, str]] = mapped_column(
         MutableDict.as_mutable(JSON), default=dict
@@ -218,7 +222,7 @@ class Report(Base, TimestampMixin, SoftDeleteMixin):
         MutableList.as_mutable(JSON), default=list
     )
     embedding: Mapped[Optional[List[float]]] = mapped_column(
-        MutableList.as_mutable(JSON)
+        MutableList.as_mutable(JSON), deferred=True
     )
     embedding_model: Mapped[Optional[str]] = mapped_column(String(100))
     embedding_dimensions: Mapped[Optional[int]] = mapped_column(Integer)
@@ -226,6 +230,9 @@ class Report(Base, TimestampMixin, SoftDeleteMixin):
     token_count: Mapped[Optional[int]] = mapped_column(Integer)
     generated_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     generated_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    timings: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        MutableDict.as_mutable(JSON), deferred=True
+    )
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     last_accessed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
@@ -237,6 +244,11 @@ class Report(Base, TimestampMixin, SoftDeleteMixin):
         back_populates="reports",
         passive_deletes=True,
     )
+    written_sections: Mapped[List["ReportSection"]] = relationship(
+        back_populates="report",
+        cascade="all, delete-orphan",
+        order_by="ReportSection.index",
+    )
 
     def mark_accessed(self) -> None:
         """Update ``last_accessed_at`` to now for engagement tracking."""
@@ -244,10 +256,49 @@ class Report(Base, TimestampMixin, SoftDeleteMixin):
         self.last_accessed_at = datetime.now(tz=timezone.utc)
 
 
+class ReportSection(Base):
+    """One written section of a report.
+
+    ``body`` holds the section text for reports assembled in memory; spooled
+    reports leave it empty and point at the body's bytes in the report's
+    content file with ``byte_offset``/``byte_size`` instead.
+    """
+
+    __tablename__ = "report_sections"
+
+    report_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("reports.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    body: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
+    byte_offset: Mapped[Optional[int]] = mapped_column(Integer)
+    byte_size: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    report: Mapped[Report] = relationship(back_populates="written_sections")
+
+    @classmethod
+    def from_entry(cls, index: int, entry: Dict[str, Any]) -> "ReportSection":
+        """Build a row from a ``sections.written`` entry (``body`` or ``offset``/``length``)."""
+
+        body = entry.get("body")
+        if body is not None:
+            return cls(index=index, title=entry.get("title") or "", body=body, byte_size=len(body.encode("utf-8")))
+        return cls(
+            index=index,
+            title=entry.get("title") or "",
+            byte_offset=entry.get("offset"),
+            byte_size=entry.get("length") or 0,
+        )
+
+
 __all__ = [
     "Base",
     "GUID",
     "Report",
+    "ReportSection",
     "ReportStatus",
     "SavedTopic",
     "SoftDeleteMixin",
@@ -255,3 +306,36 @@ __all__ = [
     "User",
     "UserStatus",
 ]
+
+
+@event.listens_for(Session, "before_flush")
+def _advance_content_versions(session: Session, flush_context, instances) -> None:
+    """Bump ``User.content_version`` for owners of topics and reports in this flush.
+
+    Runs in the same transaction as the change itself, so a listing ETag can
+    never match content written after it was issued.
+    """
+
+    owner_ids: Set[uuid.UUID] = set()
+    changed = chain(
+        session.new,
+        (obj for obj in session.dirty if session.is_modified(obj)),
+        session.deleted,
+    )
+    for obj in changed:
+        if not isinstance(obj, (SavedTopic, Report)):
+            continue
+        owner_id = obj.owner_user_id
+        if owner_id is None and obj.owner is not None:
+            # Owner assigned through the relationship; a user created in this
+            # same flush has no listings to invalidate yet.
+            owner_id = obj.owner.id
+        if owner_id is not None:
+            owner_ids.add(owner_id)
+    if owner_ids:
+        session.execute(
+            update(User)
+            .where(User.id.in_(owner_ids))
+            .values(content_version=User.content_version + 1, content_changed_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
 
-from sqlalchemy import MetaData, Table, inspect, text
+from sqlalchemy import MetaData, Table, bindparam, inspect, text
 from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable
 
-from .models import Report, SavedTopic, User
+from .models import Base, Report, ReportSection, SavedTopic, User
 
 try:
     import fcntl
@@ -16,13 +22,137 @@ except ImportError:  # pragma: no cover - Windows fallback
 
 _SUPPORTED_DIALECTS = {"sqlite"}
 
+MIGRATION_MODE_ENV = "EXPLORER_SCHEMA_MIGRATION"
+MIGRATION_BATCH_ROWS_ENV = "EXPLORER_SCHEMA_MIGRATION_BATCH_ROWS"
+# ``inline`` rebuilds legacy tables with one INSERT ... SELECT in a single
+# transaction; ``batched`` copies in primary-key order, one short transaction
+# per batch, and resumes after an interruption; ``off`` leaves legacy tables
+# alone on engine creation (run ``scripts/migrate_schema.py`` instead).
+MIGRATION_MODES = ("inline", "batched", "off")
+DEFAULT_BATCH_ROWS = 5000
 
-def ensure_lightweight_schema(engine: Engine) -> None:
-    """Ensure legacy SQLite schemas shed unused columns and gain new ones."""
+_PROGRESS_TABLE = "_schema_rebuild_progress"
+_REBUILD_SUFFIX = "__rebuild"
+# Reports per transaction when moving legacy section bodies; each row can
+# carry megabytes of text.
+_SECTION_MOVE_BATCH = 100
+
+
+@dataclass(frozen=True)
+class RebuildProgress:
+    """Where a batched table rebuild stands after each committed batch."""
+
+    table: str
+    copied: int
+    total: int
+    done: bool = False
+
+
+ProgressCallback = Callable[[RebuildProgress], None]
+
+
+def ensure_lightweight_schema(
+    engine: Engine,
+    *,
+    mode: Optional[str] = None,
+    batch_rows: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> bool:
+    """Ensure legacy SQLite schemas shed unused columns and gain new ones.
+
+    Returns immediately when ``PRAGMA user_version`` already carries the
+    current ``schema_version()`` stamp. ``mode`` defaults to
+    ``EXPLORER_SCHEMA_MIGRATION`` (else ``inline``); a batched rebuild left
+    unfinished by an earlier run is always resumed in batched mode unless
+    the mode is ``off``. Returns ``False`` when legacy tables still need a
+    rebuild (mode ``off``).
+    """
+
+    if engine.dialect.name != "sqlite" or _schema_is_current(engine):
+        return True
+    with _sqlite_migration_lock(engine):
+        if _schema_is_current(engine):
+            return True
+        return _migrate_legacy_tables(engine, _MigrationSettings.resolve(mode, batch_rows, progress))
+
+
+def ensure_schema(
+    engine: Engine,
+    *,
+    mode: Optional[str] = None,
+    batch_rows: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> bool:
+    """Migrate legacy tables, create missing ones and stamp the schema version.
+
+    Runs under the cross-process migration lock, so workers starting together
+    do not race on ``create_all``. Returns ``False`` without inspecting any
+    table when the stamp is already current (SQLite only; other dialects
+    always run ``create_all``). The stamp is not written while legacy tables
+    are left unmigrated (mode ``off``). Section bodies still held in the
+    legacy ``reports.sections`` blob are moved to ``report_sections`` before
+    stamping.
+    """
 
     if engine.dialect.name != "sqlite":
-        return
+        Base.metadata.create_all(engine)
+        return True
+    if _schema_is_current(engine):
+        return False
+    settings = _MigrationSettings.resolve(mode, batch_rows, progress)
+    with _sqlite_migration_lock(engine):
+        if _schema_is_current(engine):
+            return False
+        migrated = _migrate_legacy_tables(engine, settings)
+        Base.metadata.create_all(engine)
+        if migrated:
+            _move_written_sections(engine)
+            with engine.begin() as conn:
+                conn.execute(text(f"PRAGMA user_version={schema_version()}"))
+    return True
+
+
+@lru_cache
+def schema_version() -> int:
+    """Positive 31-bit fingerprint of the models' tables, columns and indexes.
+
+    Stored in ``PRAGMA user_version``; any model change that needs a
+    migration or a new table or index changes the fingerprint.
+    """
+
+    digest = hashlib.sha256()
+    for table in sorted(Base.metadata.tables.values(), key=lambda table: table.name):
+        digest.update(f"table:{table.name}\n".encode())
+        for column in table.columns:
+            digest.update(f"column:{column.name}:{column.type!r}:{column.nullable}\n".encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(f"index:{index.name}:{[column.name for column in index.columns]}\n".encode())
+    return int.from_bytes(digest.digest()[:4], "big") & 0x7FFFFFFF or 1
 
+
+@dataclass(frozen=True)
+class _MigrationSettings:
+    mode: str
+    batch_rows: int
+    progress: Optional[ProgressCallback]
+
+    @classmethod
+    def resolve(
+        cls, mode: Optional[str], batch_rows: Optional[int], progress: Optional[ProgressCallback]
+    ) -> "_MigrationSettings":
+        mode = mode or os.environ.get(MIGRATION_MODE_ENV, "inline")
+        if mode not in MIGRATION_MODES:
+            raise ValueError(f"Unknown schema migration mode {mode!r}; expected one of {list(MIGRATION_MODES)}.")
+        rows = batch_rows or int(os.environ.get(MIGRATION_BATCH_ROWS_ENV, DEFAULT_BATCH_ROWS))
+        return cls(mode=mode, batch_rows=max(1, rows), progress=progress)
+
+
+def _schema_is_current(engine: Engine) -> bool:
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar() == schema_version()
+
+
+def _migrate_legacy_tables(engine: Engine, settings: _MigrationSettings) -> bool:
     inspector = inspect(engine)
     existing_tables = set(inspector.get_table_names())
     managed_tables: Dict[str, Table] = {
@@ -32,30 +162,88 @@ def ensure_lightweight_schema(engine: Engine) -> None:
     }
     ordered_table_names = _topologically_sorted_tables(managed_tables.values())
     username_default = '"full_name"'
+    pending = _pending_batched_rebuilds(engine, existing_tables)
 
-    with _sqlite_migration_lock(engine):
+    complete = True
+    for table_name in ordered_table_names:
+        table = managed_tables[table_name]
+        if table_name not in existing_tables:
+            continue
+        legacy_columns = [column["name"] for column in inspector.get_columns(table_name)]
+        desired_columns = [column.name for column in table.columns]
+        if legacy_columns == desired_columns and table_name not in pending:
+            continue
+        if settings.mode == "off":
+            complete = False
+            continue
+        overrides: Dict[str, str] = {}
+        if table_name == "users" and "username" not in legacy_columns:
+            overrides["username"] = username_default
+        if table_name == "users":
+            overrides.setdefault("profile", 'COALESCE("profile", json(\'{}\'))')
+            overrides.setdefault("usage_counters", 'COALESCE("usage_counters", json(\'{}\'))')
+            if "content_version" not in legacy_columns:
+                overrides["content_version"] = "0"
+        if table_name == "reports":
+            overrides.setdefault("sections", 'COALESCE("sections", json(\'{}\'))')
+        if settings.mode == "batched" or table_name in pending:
+            _rebuild_table_batched(engine, table, legacy_columns, desired_columns, overrides, settings)
+            continue
         with engine.begin() as conn:
             conn.execute(text("PRAGMA foreign_keys=OFF"))
             try:
-                for table_name in ordered_table_names:
-                    table = managed_tables[table_name]
-                    if table_name not in existing_tables:
-                        continue
-                    legacy_columns = [column["name"] for column in inspector.get_columns(table_name)]
-                    desired_columns = [column.name for column in table.columns]
-                    if legacy_columns == desired_columns:
-                        continue
-                    overrides: Dict[str, str] = {}
-                    if table_name == "users" and "username" not in legacy_columns:
-                        overrides["username"] = username_default
-                    if table_name == "users":
-                        overrides.setdefault("profile", 'COALESCE("profile", json(\'{}\'))')
-                        overrides.setdefault("usage_counters", 'COALESCE("usage_counters", json(\'{}\'))')
-                    if table_name == "reports":
-                        overrides.setdefault("sections", 'COALESCE("sections", json(\'{}\'))')
-                    _rebuild_table(conn, table, legacy_columns, desired_columns, overrides)
+                _rebuild_table(conn, table, legacy_columns, desired_columns, overrides)
             finally:
                 conn.execute(text("PRAGMA foreign_keys=ON"))
+    return complete
+
+
+def _move_written_sections(engine: Engine) -> None:
+    """Move ``reports.sections["written"]`` entries into ``report_sections``.
+
+    Works through reports in primary-key batches, one transaction each, and
+    resets each moved report's ``sections`` to ``{}`` (copying its outline to
+    ``outline_snapshot`` if that is empty), so an interrupted move
+    picks up the remaining reports on the next run. Raw SQL keeps the stored
+    ids (and ``updated_at``) exactly as they are.
+    """
+
+    columns = [column.name for column in ReportSection.__table__.columns]
+    columns_clause = ", ".join(f'"{name}"' for name in columns)
+    values_clause = ", ".join(f":{name}" for name in columns)
+    insert_sql = text(f'INSERT INTO "{ReportSection.__tablename__}" ({columns_clause}) VALUES ({values_clause})')
+    reset_sql = text("UPDATE reports SET sections = '{}' WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    backfill_outline_sql = text(
+        "UPDATE reports SET outline_snapshot = :outline WHERE id = :id AND outline_snapshot IS NULL"
+    )
+    last_id: Optional[str] = None
+    while True:
+        with engine.begin() as conn:
+            where = "AND id > :last_id " if last_id is not None else ""
+            rows = conn.execute(
+                text(
+                    "SELECT id, sections FROM reports WHERE sections IS NOT NULL AND sections != '{}' "
+                    f"{where}ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": _SECTION_MOVE_BATCH},
+            ).all()
+            for report_id, raw in rows:
+                payload = json.loads(raw) if raw else None
+                written = payload.get("written") if isinstance(payload, dict) else None
+                for index, entry in enumerate(written or []):
+                    section = ReportSection.from_entry(index, entry)
+                    values = {name: getattr(section, name) for name in columns}
+                    conn.execute(insert_sql, {**values, "report_id": report_id})
+                outline = payload.get("outline") if isinstance(payload, dict) else None
+                if outline:
+                    conn.execute(backfill_outline_sql, {"outline": json.dumps(outline), "id": report_id})
+            if rows:
+                conn.execute(reset_sql, {"ids": [report_id for report_id, _ in rows]})
+        if len(rows) < _SECTION_MOVE_BATCH:
+            return
+        last_id = rows[-1][0]
 
 
 def _rebuild_table(
@@ -66,7 +254,21 @@ def _rebuild_table(
     select_overrides: Dict[str, str],
 ) -> None:
     temp_name = f"{table.name}__legacy"
-    conn.execute(text(f'ALTER TABLE "{table.name}" RENAME TO "{temp_name}"'))
+    # Without legacy_alter_table, SQLite rewrites other tables' foreign keys
+    # to follow the rename, leaving them pointing at the dropped copy.
+    conn.execute(text("PRAGMA legacy_alter_table=ON"))
+    try:
+        conn.execute(text(f'ALTER TABLE "{table.name}" RENAME TO "{temp_name}"'))
+    finally:
+        conn.execute(text("PRAGMA legacy_alter_table=OFF"))
+    # Named indexes follow the table through the rename and would collide
+    # with the ones created for the rebuilt table.
+    legacy_indexes = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"),
+        {"table": temp_name},
+    ).scalars().all()
+    for index_name in legacy_indexes:
+        conn.execute(text(f'DROP INDEX "{index_name}"'))
 
     metadata = MetaData()
     new_table = table.to_metadata(metadata)
@@ -91,6 +293,142 @@ def _rebuild_table(
     conn.execute(text(f'DROP TABLE "{temp_name}"'))
 
 
+def _rebuild_table_batched(
+    engine: Engine,
+    table: Table,
+    legacy_columns: Sequence[str],
+    desired_columns: Sequence[str],
+    select_overrides: Dict[str, str],
+    settings: _MigrationSettings,
+) -> None:
+    """Rebuild ``table`` by copying rows into ``<table>__rebuild`` in primary-key batches.
+
+    Each batch is its own short transaction, so readers and writers of the
+    legacy table are only blocked for one batch at a time. Triggers on the
+    legacy table mirror inserts, updates and deletes made during the copy.
+    Progress (last copied key and row counts) is stored in
+    ``_schema_rebuild_progress``; a later run resumes from there. The final
+    swap drops the legacy table and renames the copy into place.
+    """
+
+    (key,) = [column.name for column in table.primary_key.columns]
+    new_name = f"{table.name}{_REBUILD_SUFFIX}"
+    legacy_set = set(legacy_columns)
+    select_clause = ", ".join(
+        _column_copy_expression(column, legacy_set, select_overrides) for column in desired_columns
+    )
+    columns_clause = ", ".join(f'"{column}"' for column in desired_columns)
+    copy_sql = f'INSERT OR REPLACE INTO "{new_name}" ({columns_clause}) SELECT {select_clause} FROM "{table.name}"'
+
+    with engine.begin() as conn:
+        _create_progress_table(conn)
+        state = conn.execute(
+            text(f'SELECT last_key, copied, total FROM "{_PROGRESS_TABLE}" WHERE table_name = :name'),
+            {"name": table.name},
+        ).one_or_none()
+        if state is None:
+            conn.execute(text(f'DROP TABLE IF EXISTS "{new_name}"'))
+            metadata = MetaData()
+            copy = table.to_metadata(metadata, name=new_name)
+            for fk in table.foreign_key_constraints:
+                referenced = fk.elements[0].column.table
+                if referenced.name not in metadata.tables:
+                    referenced.to_metadata(metadata)
+            # Indexes are created after the swap; their names are global in SQLite.
+            conn.execute(CreateTable(copy))
+            _create_mirror_triggers(conn, table.name, new_name, key, copy_sql)
+            total = conn.execute(text(f'SELECT count(*) FROM "{table.name}"')).scalar() or 0
+            conn.execute(
+                text(
+                    f'INSERT INTO "{_PROGRESS_TABLE}" (table_name, last_key, copied, total) '
+                    "VALUES (:name, NULL, 0, :total)"
+                ),
+                {"name": table.name, "total": total},
+            )
+            last_key, copied = None, 0
+        else:
+            last_key, copied, total = state
+
+    while True:
+        with engine.begin() as conn:
+            where = f'WHERE "{key}" > :last_key ' if last_key is not None else ""
+            keys = conn.execute(
+                text(f'SELECT "{key}" FROM "{table.name}" {where}ORDER BY "{key}" LIMIT :limit'),
+                {"last_key": last_key, "limit": settings.batch_rows},
+            ).scalars().all()
+            if keys:
+                lower = f'"{key}" > :last_key AND ' if last_key is not None else ""
+                conn.execute(
+                    text(f'{copy_sql} WHERE {lower}"{key}" <= :upper'),
+                    {"last_key": last_key, "upper": keys[-1]},
+                )
+                last_key, copied = keys[-1], copied + len(keys)
+                conn.execute(
+                    text(
+                        f'UPDATE "{_PROGRESS_TABLE}" SET last_key = :last_key, copied = :copied '
+                        "WHERE table_name = :name"
+                    ),
+                    {"last_key": last_key, "copied": copied, "name": table.name},
+                )
+        if len(keys) < settings.batch_rows:
+            break
+        if settings.progress is not None:
+            settings.progress(RebuildProgress(table=table.name, copied=copied, total=total))
+
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA foreign_keys=OFF"))
+        try:
+            conn.execute(text(f'DROP TABLE "{table.name}"'))
+            conn.execute(text(f'ALTER TABLE "{new_name}" RENAME TO "{table.name}"'))
+            for index in table.indexes:
+                index.create(bind=conn)
+            conn.execute(text(f'DELETE FROM "{_PROGRESS_TABLE}" WHERE table_name = :name'), {"name": table.name})
+        finally:
+            conn.execute(text("PRAGMA foreign_keys=ON"))
+    if settings.progress is not None:
+        settings.progress(RebuildProgress(table=table.name, copied=copied, total=total, done=True))
+
+
+def _create_mirror_triggers(conn: Connection, table_name: str, new_name: str, key: str, copy_sql: str) -> None:
+    prefix = f"{new_name}_mirror"
+    conn.execute(
+        text(
+            f'CREATE TRIGGER "{prefix}_insert" AFTER INSERT ON "{table_name}" BEGIN '
+            f'{copy_sql} WHERE "{key}" = NEW."{key}"; END'
+        )
+    )
+    conn.execute(
+        text(
+            f'CREATE TRIGGER "{prefix}_update" AFTER UPDATE ON "{table_name}" BEGIN '
+            f'DELETE FROM "{new_name}" WHERE "{key}" = OLD."{key}"; '
+            f'{copy_sql} WHERE "{key}" = NEW."{key}"; END'
+        )
+    )
+    conn.execute(
+        text(
+            f'CREATE TRIGGER "{prefix}_delete" AFTER DELETE ON "{table_name}" BEGIN '
+            f'DELETE FROM "{new_name}" WHERE "{key}" = OLD."{key}"; END'
+        )
+    )
+
+
+def _create_progress_table(conn: Connection) -> None:
+    # ``last_key`` is untyped so integer and text keys keep their own ordering.
+    conn.execute(
+        text(
+            f'CREATE TABLE IF NOT EXISTS "{_PROGRESS_TABLE}" ('
+            "table_name TEXT PRIMARY KEY, last_key, copied INTEGER NOT NULL, total INTEGER NOT NULL)"
+        )
+    )
+
+
+def _pending_batched_rebuilds(engine: Engine, existing_tables: Set[str]) -> Set[str]:
+    if _PROGRESS_TABLE not in existing_tables:
+        return set()
+    with engine.connect() as conn:
+        return set(conn.execute(text(f'SELECT table_name FROM "{_PROGRESS_TABLE}"')).scalars())
+
+
 def _column_copy_expression(
     column: str,
     legacy_columns: Iterable[str],
@@ -1,32 +1,139 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Generator
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Generator, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import Session, sessionmaker
 
-from .schema_migrations import ensure_lightweight_schema
+from backend.utils.metrics import DB_SESSION_DURATION
+
+from .schema_migrations import ensure_lightweight_schema, ensure_schema
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# Async drivers used when a sync database URL is reused for the async engine.
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+DATABASE_URL_ENV = "EXPLORER_DATABASE_URL"
+DEFAULT_DATABASE_URL = "sqlite:///data/reportgen.db"
+
+_SQLITE_PROFILE_ENV = "EXPLORER_SQLITE_PROFILE"
+_SQLITE_BUSY_TIMEOUT_ENV = "EXPLORER_SQLITE_BUSY_TIMEOUT_MS"
+_DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# PRAGMAs applied to every new SQLite connection, by profile. ``production``
+# lets readers proceed during writes (WAL), waits for locks instead of failing
+# with "database is locked", and fsyncs on checkpoints rather than on every
+# commit (still durable against application crashes). ``driver`` keeps the
+# sqlite3 defaults.
+SQLITE_PROFILES: Dict[str, Dict[str, str]] = {
+    "production": {"journal_mode": "WAL", "synchronous": "NORMAL"},
+    "driver": {},
+}
 
 def create_engine_from_url(
     database_url: str,
     *,
     echo: bool = False,
     pool_pre_ping: bool = True,
+    sqlite_profile: Optional[str] = None,
+    migrate: bool = True,
 ) -> Engine:
-    """Create a SQLAlchemy engine configured for modern 2.0 usage."""
+    """Create a SQLAlchemy engine configured for modern 2.0 usage.
+
+    In-memory SQLite databases share one connection across threads so storage
+    work offloaded to a thread pool sees the same database. SQLite
+    connections get the PRAGMAs of ``sqlite_profile`` (default from
+    ``EXPLORER_SQLITE_PROFILE``, else ``production``). ``migrate=False``
+    skips the lightweight migrations, for the offline migration command.
+    """
 
+    options: Dict[str, Any] = {}
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        options = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
     engine = create_engine(
         database_url,
         echo=echo,
         pool_pre_ping=pool_pre_ping,
         future=True,
+        **options,
     )
-    ensure_lightweight_schema(engine)
+    if url.get_backend_name() == "sqlite":
+        apply_sqlite_profile(engine, sqlite_profile)
+    if migrate:
+        ensure_lightweight_schema(engine)
     return engine
 
 
+_ENGINES: Dict[str, Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def default_database_url() -> str:
+    return os.environ.get(DATABASE_URL_ENV, DEFAULT_DATABASE_URL)
+
+
+def get_engine(database_url: Optional[str] = None) -> Engine:
+    """Return the process-wide engine for ``database_url`` (default from the environment).
+
+    The first call per URL creates the engine and runs ``ensure_schema``;
+    later calls, from the API, the report store or the suggestion service,
+    share the same engine and connection pool.
+    """
+
+    url = database_url or default_database_url()
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(url)
+        if engine is None:
+            engine = create_engine_from_url(url, migrate=False)
+            ensure_schema(engine)
+            _ENGINES[url] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """Dispose and forget every registry engine (for shutdown and tests)."""
+
+    with _ENGINES_LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def apply_sqlite_profile(engine: Engine, profile: Optional[str] = None) -> None:
+    """Run the profile's PRAGMAs, plus ``busy_timeout``, on each new connection of ``engine``."""
+
+    name = profile or os.environ.get(_SQLITE_PROFILE_ENV, "production")
+    try:
+        pragmas = dict(SQLITE_PROFILES[name])
+    except KeyError:
+        raise ValueError(f"Unknown SQLite profile {name!r}; expected one of {sorted(SQLITE_PROFILES)}.") from None
+    if engine.url.database in (None, "", ":memory:"):
+        # In-memory databases have no journal file to put in WAL mode.
+        pragmas.pop("journal_mode", None)
+    busy_timeout = int(os.environ.get(_SQLITE_BUSY_TIMEOUT_ENV, _DEFAULT_SQLITE_BUSY_TIMEOUT_MS))
+    statements = [f"PRAGMA busy_timeout={busy_timeout}"]
+    statements.extend(f"PRAGMA {pragma}={value}" for pragma, value in pragmas.items())
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
 def create_session_factory(
     engine: Engine,
     *,
@@ -48,12 +155,88 @@ def session_scope(
 ) -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
 
+    started = time.perf_counter()
+    outcome = "commit"
     session = session_factory()
     try:
         yield session
         session.commit()
     except Exception:
+        outcome = "rollback"
         session.rollback()
         raise
     finally:
         session.close()
+        DB_SESSION_DURATION.observe(time.perf_counter() - started, outcome=outcome)
+
+
+def create_async_engine_from_url(
+    database_url: str,
+    *,
+    echo: bool = False,
+    pool_pre_ping: bool = True,
+    sqlite_profile: Optional[str] = None,
+) -> "AsyncEngine":
+    """Create an async engine for the same database as ``create_engine_from_url``.
+
+    Sync URLs are rewritten to their async driver (``sqlite`` -> ``aiosqlite``,
+    ``postgresql`` -> ``asyncpg``) and SQLite connections get the same
+    profile as the sync engine. Schema creation and the lightweight SQLite
+    migrations stay on the sync engine; build that first.
+    """
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = make_url(database_url)
+    backend_name = url.get_backend_name()
+    async_driver = _ASYNC_DRIVERS.get(backend_name)
+    if async_driver and url.get_driver_name() != async_driver:
+        url = url.set(drivername=f"{backend_name}+{async_driver}")
+    options: Dict[str, Any] = {}
+    if backend_name == "sqlite" and url.database in (None, "", ":memory:"):
+        options = {"poolclass": StaticPool}
+    engine = create_async_engine(url, echo=echo, pool_pre_ping=pool_pre_ping, **options)
+    if backend_name == "sqlite":
+        apply_sqlite_profile(engine.sync_engine, sqlite_profile)
+    return engine
+
+
+def create_async_session_factory(
+    engine: "AsyncEngine",
+    *,
+    expire_on_commit: bool = False,
+) -> "async_sessionmaker[AsyncSession]":
+    """Return an async session factory bound to ``engine``."""
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=expire_on_commit,
+    )
+
+
+@asynccontextmanager
+async def async_session_scope(
+    session_factory: "async_sessionmaker[AsyncSession]",
+) -> AsyncGenerator["AsyncSession", None]:
+    """Async counterpart of ``session_scope``.
+
+    Relationships are not lazy-loaded on async sessions; load them up front
+    with ``selectinload`` or similar options.
+    """
+
+    started = time.perf_counter()
+    outcome = "commit"
+    session = session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        outcome = "rollback"
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+        DB_SESSION_DURATION.observe(time.perf_counter() - started, outcome=outcome)
@@ -5,7 +5,7 @@ import uuid
 
 from pydantic import BaseModel, Field, model_validator
 
-from backend.db import ReportStatus
+from backend.db.enums import ReportStatus
 
 ReasoningEffort = Literal["minimal", "low", "medium", "high"]
 
@@ -30,6 +30,29 @@ class Outline(BaseModel):
     sections: List[Section]
 
 
+# Strict JSON schema for structured-output outline calls; mirrors ``Outline``.
+OUTLINE_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "report_title": {"type": "string"},
+        "sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "subsections": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["title", "subsections"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["report_title", "sections"],
+    "additionalProperties": False,
+}
+
+
 def normalize_subject_list(
     values: Optional[List[str]], field_name: str
 ) -> List[str]:
@@ -84,10 +107,42 @@ class OutlineRequest(SubjectFilters):
         return self
 
 
+class OutlineBatchRequest(SubjectFilters):
+    topics: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Topics to outline; filters, sections and model apply to every topic.",
+    )
+    format: Literal["json", "markdown"] = "json"
+    model: ModelSpec = Field(default_factory=lambda: ModelSpec(model=DEFAULT_TEXT_MODEL))
+    concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Maximum outlines generated at once for this batch.",
+    )
+
+    @model_validator(mode="after")
+    def validate_topics(self):
+        topics = [(topic or "").strip() for topic in self.topics]
+        if not all(topics):
+            raise ValueError("topics entries must contain non-whitespace characters.")
+        self.topics = topics
+        return self
+
+
 class GenerateRequest(SubjectFilters):
     topic: Optional[str] = None
     mode: Optional[Literal["generate_report"]] = None
     outline: Optional[Outline] = None
+    outline_markdown: Optional[str] = Field(
+        default=None,
+        description=(
+            "Markdown outline (headings, numbered lists or 'Section N:' lines) parsed "
+            "locally into ``outline``; mutually exclusive with ``outline``."
+        ),
+    )
     user_email: Optional[str] = Field(
         default=None,
         description="Email used to associate generated reports with a user profile.",
@@ -104,10 +159,34 @@ class GenerateRequest(SubjectFilters):
         }
     )
     writer_fallback: Optional[str] = None
-    return_: Literal["report", "report_with_outline"] = Field(default="report", alias="return")
+    reuse_saved_outline: bool = Field(
+        default=False,
+        description=(
+            "Reuse the outline of the most recent report on the matching saved topic "
+            "instead of generating a new one, when one exists."
+        ),
+    )
+    return_: Literal["report", "report_with_outline", "reference"] = Field(
+        default="report",
+        alias="return",
+        description=(
+            "'reference' omits the report text from the final event and returns its "
+            "report_id, content_uri, byte_size and content_hash instead; the text is "
+            "the report title plus the section_complete bodies."
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_topic_and_mode(self):
+        if self.outline_markdown is not None:
+            if self.outline is not None:
+                raise ValueError("Provide either outline or outline_markdown, not both.")
+            from backend.utils.formatting import parse_outline_markdown
+
+            default_title = self.topic.strip() if isinstance(self.topic, str) else None
+            self.outline = parse_outline_markdown(self.outline_markdown, default_title=default_title)
+            # Consumed: re-validating a dump of this request must not see both fields.
+            self.outline_markdown = None
         if self.outline is None:
             topic = self.topic.strip() if isinstance(self.topic, str) else ""
             if not topic:
@@ -197,5 +276,9 @@ class ReportResponse(BaseModel):
     status: ReportStatus
     summary: Optional[str]
     content: Optional[str] = None
+    # Filled for ``include_content=snippet`` listings instead of ``content``.
+    snippet: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_minutes: Optional[int] = None
     created_at: str
     updated_at: str
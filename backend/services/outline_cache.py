@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from backend.schemas import Outline, OutlineRequest
+from backend.utils.model_utils import supports_reasoning
+
+_CACHE_SIZE_ENV = "EXPLORER_OUTLINE_CACHE_SIZE"
+_CACHE_DIR_ENV = "EXPLORER_OUTLINE_CACHE_DIR"
+_CACHE_TTL_ENV = "EXPLORER_OUTLINE_CACHE_TTL_SECONDS"
+_DEFAULT_CACHE_SIZE = 256
+_DEFAULT_TTL_SECONDS = 24 * 60 * 60.0
+
+
+def outline_cache_key(outline_request: OutlineRequest) -> str:
+    """Key an outline request on everything that shapes the generated outline.
+
+    Topics and subject filters are compared case- and whitespace-insensitively,
+    and filter order is ignored; the reasoning effort only counts for models
+    that accept it, mirroring what is actually sent to the API.
+    """
+
+    spec = outline_request.model
+    payload = {
+        "topic": _normalize(outline_request.topic),
+        "format": outline_request.format,
+        "sections": outline_request.sections,
+        "include": sorted({_normalize(item) for item in outline_request.subject_inclusions}),
+        "exclude": sorted({_normalize(item) for item in outline_request.subject_exclusions}),
+        "model": spec.model,
+        "reasoning_effort": spec.reasoning_effort if supports_reasoning(spec.model) else None,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class OutlineCache:
+    """Two-tier outline cache: an in-process LRU backed by an optional directory.
+
+    The directory tier survives restarts and is shared by every worker that
+    points at it; entries are written atomically, one JSON file per key.
+    Entries older than ``ttl_seconds`` are treated as misses in both tiers.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_CACHE_SIZE,
+        directory: Optional[Path | str] = None,
+        ttl_seconds: Optional[float] = _DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max(0, max_entries)
+        self.directory = Path(directory).expanduser() if directory else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["OutlineCache"]:
+        """Build the cache from the environment; ``EXPLORER_OUTLINE_CACHE_SIZE=0`` disables it."""
+
+        size = int(os.environ.get(_CACHE_SIZE_ENV, _DEFAULT_CACHE_SIZE))
+        directory = os.environ.get(_CACHE_DIR_ENV) or None
+        if size <= 0 and directory is None:
+            return None
+        ttl = float(os.environ.get(_CACHE_TTL_ENV, _DEFAULT_TTL_SECONDS))
+        return cls(max_entries=size, directory=directory, ttl_seconds=ttl)
+
+    def get(self, key: str) -> Optional[Outline]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0], now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return Outline.model_validate(entry[1])
+        entry = self._read_file(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, entry)
+        return Outline.model_validate(entry[1])
+
+    def put(self, key: str, outline: Outline) -> None:
+        entry = (time.time(), outline.model_dump())
+        with self._lock:
+            self._remember(key, entry)
+        self._write_file(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_file(self, key: str, now: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        if self.directory is None:
+            return None
+        try:
+            payload = json.loads(self._path(key).read_text(encoding="utf-8"))
+            entry = (float(payload["stored_at"]), payload["outline"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if self._expired(entry[0], now):
+            return None
+        return entry
+
+    def _write_file(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(
+                json.dumps({"stored_at": entry[0], "outline": entry[1]}), encoding="utf-8"
+            )
+            os.replace(temp_path, path)
+        except OSError:
+            # The persistent tier is best effort; the in-memory copy still serves hits.
+            temp_path.unlink(missing_ok=True)
+
+
+def _normalize(value: str) -> str:
+    return " ".join((value or "").split()).casefold()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, Optional, Set
+
+from backend.schemas import DEFAULT_TEXT_MODEL, ModelSpec
+from backend.utils.metrics import GENERATIONS_ACTIVE, GENERATIONS_QUEUED, OUTLINE_PREFETCHES
+from .outline_cache import outline_cache_key
+from .outline_service import OutlineService
+
+_BUDGET_ENV = "EXPLORER_OUTLINE_PREFETCH_BUDGET_PER_HOUR"
+_TOP_N_ENV = "EXPLORER_OUTLINE_PREFETCH_TOP_N"
+_MAX_ACTIVE_ENV = "EXPLORER_OUTLINE_PREFETCH_MAX_ACTIVE"
+_SECTIONS_ENV = "EXPLORER_OUTLINE_PREFETCH_SECTIONS"
+_DEFAULT_BUDGET_PER_HOUR = 60
+_DEFAULT_TOP_N = 3
+_DEFAULT_MAX_ACTIVE = 1
+# The web app's default section count; the outline cache key includes it.
+_DEFAULT_SECTIONS = 3
+_BUDGET_WINDOW_SECONDS = 3600.0
+
+
+def _interactive_load() -> float:
+    return GENERATIONS_ACTIVE.value() + GENERATIONS_QUEUED.value()
+
+
+class OutlinePrefetcher:
+    """Speculatively generate outlines for topics a user is likely to open next.
+
+    Topics are queued from suggestion responses and saved-topic listings and
+    handed to ``OutlineService.generate_outline`` by a single background task,
+    so a later click finds the outline in the cache (or joins the in-flight
+    call). The worker only runs while fewer than ``max_active`` interactive
+    generations are in flight and stops spending once ``budget_per_hour``
+    outline calls were made in the last hour. Prefetches use ``sections``
+    (the web app's default of 3), no subject filters and the default model,
+    which is what a plain click on a suggestion sends from the web app.
+    """
+
+    def __init__(
+        self,
+        outline_service: OutlineService,
+        *,
+        budget_per_hour: int = _DEFAULT_BUDGET_PER_HOUR,
+        top_n: int = _DEFAULT_TOP_N,
+        max_active: int = _DEFAULT_MAX_ACTIVE,
+        max_pending: int = 64,
+        model_spec: Optional[ModelSpec] = None,
+        sections: Optional[int] = _DEFAULT_SECTIONS,
+        load: Callable[[], float] = _interactive_load,
+        idle_poll_seconds: float = 0.5,
+    ) -> None:
+        self.outline_service = outline_service
+        self.budget_per_hour = budget_per_hour
+        self.top_n = top_n
+        self.max_active = max_active
+        self.max_pending = max_pending
+        self.model_spec = model_spec or ModelSpec(model=DEFAULT_TEXT_MODEL)
+        self.sections = sections
+        self._load = load
+        self._idle_poll_seconds = idle_poll_seconds
+        self._pending: Deque[str] = deque()
+        self._pending_keys: Set[str] = set()
+        self._spent: Deque[float] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, outline_service: OutlineService) -> Optional["OutlinePrefetcher"]:
+        """Build a prefetcher when the service caches outlines and the budget is non-zero."""
+
+        budget = int(os.environ.get(_BUDGET_ENV, _DEFAULT_BUDGET_PER_HOUR))
+        if budget <= 0 or outline_service.cache is None:
+            return None
+        return cls(
+            outline_service,
+            budget_per_hour=budget,
+            top_n=int(os.environ.get(_TOP_N_ENV, _DEFAULT_TOP_N)),
+            max_active=int(os.environ.get(_MAX_ACTIVE_ENV, _DEFAULT_MAX_ACTIVE)),
+            sections=int(os.environ.get(_SECTIONS_ENV, _DEFAULT_SECTIONS)) or None,
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the worker on the running event loop (idempotent)."""
+
+        loop = asyncio.get_running_loop()
+        if self.running and self._loop is loop:
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name="outline-prefetch")
+        if self._pending:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def submit(self, topics: Iterable[str]) -> int:
+        """Queue the first ``top_n`` topics; safe to call from any thread.
+
+        Returns the number of topics accepted. From a worker thread (sync
+        routes) the hand-off goes through ``call_soon_threadsafe``.
+        """
+
+        selected = [topic.strip() for topic in topics if topic and topic.strip()][: self.top_n]
+        if not selected:
+            return 0
+        loop = self._loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not None:
+            self.start()
+            return self._enqueue(selected)
+        if loop is None or loop.is_closed() or not self.running:
+            OUTLINE_PREFETCHES.inc(len(selected), outcome="dropped")
+            return 0
+        loop.call_soon_threadsafe(self._enqueue, selected)
+        return len(selected)
+
+    def _enqueue(self, topics: Iterable[str]) -> int:
+        accepted = 0
+        for topic in topics:
+            key = self._key(topic)
+            if key in self._pending_keys:
+                continue
+            if len(self._pending) >= self.max_pending:
+                OUTLINE_PREFETCHES.inc(outcome="dropped")
+                continue
+            self._pending.append(topic)
+            self._pending_keys.add(key)
+            accepted += 1
+        if accepted and self._wakeup is not None:
+            self._wakeup.set()
+        return accepted
+
+    def _key(self, topic: str) -> str:
+        return outline_cache_key(self._outline_request(topic))
+
+    def _outline_request(self, topic: str):
+        return self.outline_service.build_outline_request(
+            topic, "json", model_spec=self.model_spec, sections=self.sections
+        )
+
+    def _budget_available(self) -> bool:
+        cutoff = time.monotonic() - _BUDGET_WINDOW_SECONDS
+        while self._spent and self._spent[0] < cutoff:
+            self._spent.popleft()
+        return len(self._spent) < self.budget_per_hour
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            # Interactive generations always win; poll until there is spare capacity.
+            if self._load() >= self.max_active:
+                await asyncio.sleep(self._idle_poll_seconds)
+                continue
+            topic = self._pending.popleft()
+            outline_request = self._outline_request(topic)
+            self._pending_keys.discard(outline_cache_key(outline_request))
+            if self.outline_service.cached_outline(outline_request) is not None:
+                OUTLINE_PREFETCHES.inc(outcome="cached")
+                continue
+            if not self._budget_available():
+                OUTLINE_PREFETCHES.inc(outcome="over_budget")
+                continue
+            self._spent.append(time.monotonic())
+            try:
+                await self.outline_service.generate_outline(outline_request)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                OUTLINE_PREFETCHES.inc(outcome="failed")
+                continue
+            OUTLINE_PREFETCHES.inc(outcome="generated")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
-from backend.utils.formatting import parse_outline_json
+from backend.utils.formatting import (
+    parse_outline_json,
+    parse_outline_markdown,
+    parse_outline_tolerant,
+)
 from backend.schemas import (
     DEFAULT_TEXT_MODEL,
+    OUTLINE_JSON_SCHEMA,
     ModelSpec,
     Outline,
     OutlineRequest,
@@ -13,14 +19,37 @@ from backend.schemas import (
     SubjectFilters,
 )
 from backend.utils.openai_client import OpenAITextClient, get_default_text_client
-from backend.utils.prompts import build_outline_prompt_json, build_outline_prompt_markdown
-from backend.utils.model_utils import supports_reasoning
+from backend.utils.prompts import (
+    build_outline_prompt_json,
+    build_outline_prompt_markdown,
+    build_outline_repair_prompt,
+)
+from backend.utils.metrics import OUTLINE_CACHE_LOOKUPS, OUTLINE_PARSE_RETRIES
+from backend.utils.model_utils import supports_reasoning, supports_structured_output
+from backend.utils.tracing import get_tracer
+from .outline_cache import OutlineCache, outline_cache_key
+
+_OUTLINE_SYSTEM_PROMPT = "You generate structured outlines."
+_OUTLINE_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {"name": "report_outline", "schema": OUTLINE_JSON_SCHEMA, "strict": True},
+}
+_DEFAULT_REPAIR_ATTEMPTS = 1
 
 
 class OutlineService:
 
-    def __init__(self, text_client: Optional[OpenAITextClient] = None) -> None:
+    def __init__(
+        self,
+        text_client: Optional[OpenAITextClient] = None,
+        *,
+        cache: Optional[OutlineCache] = None,
+        repair_attempts: int = _DEFAULT_REPAIR_ATTEMPTS,
+    ) -> None:
         self._text_client = text_client or get_default_text_client()
+        self.cache = cache
+        self.repair_attempts = max(0, repair_attempts)
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     @staticmethod
     def build_outline_request(
@@ -55,20 +84,121 @@ class OutlineService:
         )
 
     async def handle_outline_request(self, outline_request: OutlineRequest) -> Dict[str, Any]:
-        text = await self._request_outline_text(outline_request)
         if outline_request.format == "json":
-            outline = self._parse_outline(text)
+            outline = await self.generate_outline(outline_request)
             return outline.model_dump()
-        return {"markdown_outline": text}
+        with _outline_span(outline_request):
+            text = await self._request_outline_text(outline_request)
+            payload: Dict[str, Any] = {"markdown_outline": text}
+            try:
+                payload["outline"] = parse_outline_markdown(
+                    text, default_title=outline_request.topic
+                ).model_dump()
+            except ValueError:
+                pass
+            return payload
 
     async def generate_outline(self, outline_request: OutlineRequest) -> Outline:
         if outline_request.format != "json":
             raise ValueError("Only JSON outlines can be converted into structured models.")
+        with _outline_span(outline_request) as span:
+            if self.cache is None:
+                outline = await self._request_outline(outline_request)
+                span.set_attribute("sections", len(outline.sections))
+                return outline
+            cache_key = outline_cache_key(outline_request)
+            cached = self.cache.get(cache_key)
+            if cached is None:
+                cached = await self._join_inflight(cache_key)
+                result = "joined" if cached is not None else "miss"
+            else:
+                result = "hit"
+            OUTLINE_CACHE_LOOKUPS.inc(result=result)
+            span.set_attribute("cache_hit", cached is not None)
+            if cached is not None:
+                span.set_attribute("sections", len(cached.sections))
+                return cached
+
+            # Single flight: concurrent requests for the same key (e.g. a click
+            # racing a background prefetch) wait for this call instead of
+            # issuing their own.
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = inflight
+            try:
+                outline = await self._request_outline(outline_request)
+                self.cache.put(cache_key, outline)
+                inflight.set_result(outline)
+            finally:
+                if not inflight.done():
+                    inflight.cancel()
+                self._inflight.pop(cache_key, None)
+            span.set_attribute("sections", len(outline.sections))
+            return outline
+
+    def cached_outline(self, outline_request: OutlineRequest) -> Optional[Outline]:
+        """Return the cached outline for ``outline_request`` without calling the model."""
+
+        if self.cache is None or outline_request.format != "json":
+            return None
+        return self.cache.get(outline_cache_key(outline_request))
+
+    async def _join_inflight(self, cache_key: str) -> Optional[Outline]:
+        inflight = self._inflight.get(cache_key)
+        if inflight is None or inflight.get_loop() is not asyncio.get_running_loop():
+            return None
+        await asyncio.wait({inflight})
+        if inflight.cancelled():
+            return None
+        return inflight.result().model_copy(deep=True)
+
+    async def _request_outline(self, outline_request: OutlineRequest) -> Outline:
+        """Request a JSON outline and repair unparseable responses.
+
+        Models with structured outputs are constrained by ``OUTLINE_JSON_SCHEMA``.
+        Whatever still fails strict parsing gets up to ``repair_attempts`` cheap
+        re-asks quoting the parse error, then a tolerant extraction pass over
+        every response received; only then is ``OutlineParsingError`` raised.
+        """
+
         text = await self._request_outline_text(outline_request)
-        return self._parse_outline(text)
+        try:
+            return self._parse_outline(text)
+        except OutlineParsingError as exception:
+            error = exception
+
+        responses = [text]
+        repair_spec = ModelSpec(model=outline_request.model.model)
+        for _ in range(self.repair_attempts):
+            repair_prompt = build_outline_repair_prompt(responses[-1], str(error))
+            responses.append(
+                await self._text_client.call_text_async(
+                    repair_spec,
+                    _OUTLINE_SYSTEM_PROMPT,
+                    repair_prompt,
+                    **self._response_format_kwargs(repair_spec),
+                )
+            )
+            try:
+                outline = self._parse_outline(responses[-1])
+            except OutlineParsingError as exception:
+                error = exception
+                OUTLINE_PARSE_RETRIES.inc(strategy="reask", outcome="failure")
+                continue
+            OUTLINE_PARSE_RETRIES.inc(strategy="reask", outcome="success")
+            return outline
+
+        for response in reversed(responses):
+            try:
+                outline = parse_outline_tolerant(response)
+            except Exception:
+                continue
+            OUTLINE_PARSE_RETRIES.inc(strategy="tolerant", outcome="success")
+            return outline
+        OUTLINE_PARSE_RETRIES.inc(strategy="tolerant", outcome="failure")
+        raise error
 
     async def _request_outline_text(self, outline_request: OutlineRequest) -> str:
-        system = "You generate structured outlines."
+        system = _OUTLINE_SYSTEM_PROMPT
         prompt = (
             build_outline_prompt_json(
                 outline_request.topic,
@@ -84,7 +214,20 @@ class OutlineService:
                 outline_request.subject_exclusions,
             )
         )
-        return await self._text_client.call_text_async(outline_request.model, system, prompt)
+        kwargs = (
+            self._response_format_kwargs(outline_request.model)
+            if outline_request.format == "json"
+            else {}
+        )
+        return await self._text_client.call_text_async(
+            outline_request.model, system, prompt, **kwargs
+        )
+
+    @staticmethod
+    def _response_format_kwargs(model_spec: ModelSpec) -> Dict[str, Any]:
+        if not supports_structured_output(model_spec.model):
+            return {}
+        return {"response_format": _OUTLINE_RESPONSE_FORMAT}
 
     @staticmethod
     def _parse_outline(text: str) -> Outline:
@@ -94,6 +237,15 @@ class OutlineService:
             raise OutlineParsingError(str(exception), text) from exception
 
 
+def _outline_span(outline_request: OutlineRequest) -> Any:
+    return get_tracer().span(
+        "outline.generate",
+        model=outline_request.model.model,
+        format=outline_request.format,
+        requested_sections=outline_request.sections,
+    )
+
+
 class OutlineParsingError(Exception):
     """Raised when the LLM returns malformed JSON for the outline."""
 
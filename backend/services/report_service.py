@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, TypeVar, Union
 
 from backend.utils.formatting import (
     ensure_section_numbering,
@@ -16,17 +17,35 @@ from backend.schemas import (
     Outline,
     Section,
 )
+from backend.utils.metrics import STAGE_DURATION
 from backend.utils.model_utils import maybe_add_reasoning
 from backend.utils.openai_client import OpenAITextClient, get_default_text_client
+from backend.utils.profiling import SamplingProfiler
+from backend.utils.tracing import NOOP_SPAN, get_tracer
 from .outline_service import OutlineParsingError, OutlineService
 from backend.utils.prompts import (
     build_section_editor_prompt,
     build_section_writer_prompt,
 )
-from .report_state import NumberedSection, WrittenSection, WriterState
-from backend.storage import GeneratedReportStore, StoredReportHandle
+from .report_state import (
+    NumberedSection,
+    ReportAssembly,
+    RunTimings,
+    SectionTiming,
+    WriterState,
+)
+from backend.storage import (
+    GeneratedReportStore,
+    ReportSpool,
+    StoredReportArtifact,
+    StoredReportHandle,
+    encode_report_content,
+)
+from backend.storage.executor import StorageExecutor, get_storage_executor
 from backend.utils.summary import should_elevate_context
 
+T = TypeVar("T")
+
 
 class ReportGeneratorService:
     def __init__(
@@ -34,6 +53,7 @@ class ReportGeneratorService:
         outline_service: Optional[OutlineService] = None,
         text_client: Optional[OpenAITextClient] = None,
         report_store: Optional[GeneratedReportStore] = None,
+        storage_executor: Optional[StorageExecutor] = None,
     ) -> None:
         self.text_client = text_client or get_default_text_client()
         self.outline_service = outline_service or OutlineService(
@@ -41,11 +61,18 @@ class ReportGeneratorService:
         )
         # Respect explicit None to allow storage to be disabled via dependency wiring.
         self.report_store = report_store
+        self.storage_executor = storage_executor or get_storage_executor()
 
     async def stream_report(
-        self, generate_request: GenerateRequest
+        self, generate_request: GenerateRequest, *, profile: bool = False
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        runner = _ReportStreamRunner(self, generate_request)
+        """Stream status events for one run.
+
+        ``profile`` samples the event-loop thread for the whole run and saves
+        the profile next to the report artifacts (see ``backend.utils.profiling``).
+        """
+
+        runner = _ReportStreamRunner(self, generate_request, profile=profile)
         async for event in runner.run():
             yield event
 
@@ -82,10 +109,15 @@ class _ReportStreamRunner:
     request: GenerateRequest
 
     def __init__(
-        self, service: ReportGeneratorService, request: GenerateRequest
+        self,
+        service: ReportGeneratorService,
+        request: GenerateRequest,
+        *,
+        profile: bool = False,
     ) -> None:
         self.service = service
         self.request = request
+        self.profile = profile
         self.report_store = service.report_store
         self.__post_init__()
 
@@ -107,13 +139,29 @@ class _ReportStreamRunner:
             ),
         )
         self._encountered_error = False
-        self._assembled_narration: Optional[str] = None
         self._storage_handle: Optional[StoredReportHandle] = None
-        self._written_sections: List[WrittenSection] = []
+        self._report_artifact: Optional[StoredReportArtifact] = None
+        self._assembly: Union[ReportAssembly, ReportSpool] = ReportAssembly("")
+        self.timings = RunTimings()
+        self._tracer = get_tracer()
+        self._run_span: Any = NOOP_SPAN
+        self._section_span: Any = NOOP_SPAN
+        self._profiler: Optional[SamplingProfiler] = None
 
     async def run(self) -> AsyncGenerator[Dict[str, Any], None]:
+        self.timings = RunTimings()
+        if self.profile:
+            self._profiler = SamplingProfiler().start()
+        # Spans that stay open across yields are started explicitly and never
+        # made current, so the consumer's context is left untouched.
+        self._run_span = self._tracer.start_span(
+            "report.generate",
+            topic=self.request.topic,
+            requested_sections=self.request.sections,
+            outline_provided=self.request.outline is not None,
+        )
         try:
-            async with self.service._emit_status({"status": "started"}) as status:
+            async with self._emit_status({"status": "started"}) as status:
                 yield status
 
             self._resolved_outline: Optional[Outline] = None
@@ -123,54 +171,82 @@ class _ReportStreamRunner:
             if outline is None:
                 return
 
-            storage_status = self._prepare_storage(outline)
+            stage_started = time.monotonic()
+            storage_status = await self._offload(self._prepare_storage, outline)
+            if self.report_store:
+                self.timings.add_stage("prepare_storage", time.monotonic() - stage_started)
             if storage_status:
-                async with self.service._emit_status(storage_status) as status:
+                async with self._emit_status(storage_status) as status:
                     yield status
 
             numbered_sections = self.service._build_numbered_sections(outline)
             all_section_headers = [entry.title for entry in numbered_sections]
 
             begin_status = self._build_begin_sections_status(outline)
-            async with self.service._emit_status(begin_status) as status:
+            async with self._emit_status(begin_status) as status:
                 yield status
 
+            stage_started = time.monotonic()
             async for status in self._write_sections(
                 outline, numbered_sections, all_section_headers
             ):
                 yield status
+            self.timings.add_stage("sections", time.monotonic() - stage_started)
 
             if self._encountered_error:
-                self._mark_storage_failed("Report generation aborted before completion.")
+                await self._offload(
+                    self._mark_storage_failed, "Report generation aborted before completion."
+                )
                 return
 
-            assembled_narration = self._assembled_narration or ""
-
-            finalize_error = self._finalize_report_persistence(assembled_narration)
+            report_handle = self._storage_handle
+            stage_started = time.monotonic()
+            finalize_error = await self._offload(self._finalize_report_persistence)
+            if self.report_store:
+                self.timings.add_stage("persist", time.monotonic() - stage_started)
             if finalize_error:
-                async with self.service._emit_status(finalize_error) as status:
+                async with self._emit_status(finalize_error) as status:
                     yield status
                 return
 
-            final_payload = self._build_final_payload(outline, assembled_narration)
+            final_payload = await self._offload(self._build_final_payload, outline)
+            if self._profiler is not None:
+                final_payload["profile"] = await self._offload(self._save_profile, report_handle)
 
-            async with self.service._emit_status(final_payload) as status:
+            async with self._emit_status(final_payload) as status:
                 yield status
-        except asyncio.CancelledError:
-            self._mark_storage_failed("Report generation cancelled")
+        except asyncio.CancelledError as exception:
+            self._run_span.record_exception(exception)
+            await self._offload(self._mark_storage_failed, "Report generation cancelled")
             raise
+        finally:
+            if isinstance(self._assembly, ReportSpool):
+                # No-op after a successful commit; drops the partial file otherwise.
+                self._assembly.discard()
+            if self._profiler is not None:
+                self._profiler.stop()
+            self._run_span.set_attributes(
+                sections_written=len(self._assembly),
+                failed=self._encountered_error,
+            )
+            self._run_span.end()
 
     async def _outline_phase(self) -> AsyncGenerator[Dict[str, Any], None]:
         provided_outline = self.request.outline
+        if provided_outline is None and self.request.reuse_saved_outline:
+            saved_outline = await self._offload(self._load_saved_outline)
+            if saved_outline is not None:
+                async with self._emit_status(
+                    {
+                        "status": "using_saved_outline",
+                        "sections": len(saved_outline.sections),
+                        "outline": saved_outline.model_dump(),
+                    }
+                ) as status:
+                    yield status
+                self._resolved_outline = saved_outline
+                return
         if provided_outline is None:
-            outline_status: Dict[str, Any] = {
-                "status": "generating_outline",
-                "model": self.outline_spec.model,
-            }
-            maybe_add_reasoning(outline_status, "reasoning_effort", self.outline_spec)
-            async with self.service._emit_status(outline_status) as status:
-                yield status
-
             outline_request = self.service.outline_service.build_outline_request(
                 self.request.topic,
                 "json",
@@ -179,35 +255,55 @@ class _ReportStreamRunner:
                 subject_inclusions=self.request.subject_inclusions,
                 subject_exclusions=self.request.subject_exclusions,
             )
-            try:
-                outline = await self.service.outline_service.generate_outline(
-                    outline_request
-                )
-            except OutlineParsingError as exception:  # pragma: no cover - defensive
-                error_status = {
-                    "status": "error",
-                    "detail": f"Failed to parse outline JSON: {exception}",
-                    "raw_outline": exception.raw_response,
+            stage_started = time.monotonic()
+            # A prefetched or repeat outline goes straight to ``outline_ready``.
+            outline = self.service.outline_service.cached_outline(outline_request)
+            cached = outline is not None
+            if outline is None:
+                outline_status: Dict[str, Any] = {
+                    "status": "generating_outline",
+                    "model": self.outline_spec.model,
                 }
-                async with self.service._emit_status(error_status) as status:
+                maybe_add_reasoning(outline_status, "reasoning_effort", self.outline_spec)
+                async with self._emit_status(outline_status) as status:
                     yield status
-                return
 
+                stage_started = time.monotonic()
+                try:
+                    with STAGE_DURATION.time(
+                        stage="outline", model=self.outline_spec.model
+                    ), self._tracer.span("report.outline", parent=self._run_span):
+                        outline = await self.service.outline_service.generate_outline(
+                            outline_request
+                        )
+                except OutlineParsingError as exception:  # pragma: no cover - defensive
+                    error_status = {
+                        "status": "error",
+                        "detail": f"Failed to parse outline JSON: {exception}",
+                        "raw_outline": exception.raw_response,
+                    }
+                    async with self._emit_status(error_status) as status:
+                        yield status
+                    return
+
+            self.timings.add_stage("outline", time.monotonic() - stage_started)
             outline_ready_status: Dict[str, Any] = {
                 "status": "outline_ready",
                 "model": self.outline_spec.model,
                 "sections": len(outline.sections),
                 "outline": outline.model_dump(),
             }
+            if cached:
+                outline_ready_status["cached"] = True
             maybe_add_reasoning(
                 outline_ready_status, "reasoning_effort", self.outline_spec
             )
-            async with self.service._emit_status(outline_ready_status) as status:
+            async with self._emit_status(outline_ready_status) as status:
                 yield status
             self._resolved_outline = outline
             return
 
-        async with self.service._emit_status(
+        async with self._emit_status(
             {
                 "status": "using_provided_outline",
                 "sections": len(provided_outline.sections),
@@ -224,32 +320,39 @@ class _ReportStreamRunner:
         numbered_sections: List[NumberedSection],
         all_section_headers: List[str],
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        self._written_sections = []
-        assembled_blocks: List[str] = [outline.report_title]
-
-        for section in numbered_sections:
-            async for status in self._process_section(
-                outline,
-                section,
-                all_section_headers,
-                assembled_blocks,
-            ):
-                yield status
+        self._assembly = await self._offload(self._open_assembly, outline)
+        self._section_ready_at = time.monotonic()
+
+        for index, section in enumerate(numbered_sections, start=1):
+            self._section_span = self._tracer.start_span(
+                "report.section",
+                parent=self._run_span,
+                index=index,
+                title=section.title,
+            )
+            try:
+                async for status in self._process_section(
+                    outline,
+                    section,
+                    all_section_headers,
+                ):
+                    yield status
+            finally:
+                self._section_span.end()
+                self._section_span = NOOP_SPAN
             if self._encountered_error:
                 break
 
-        self._assembled_narration = "\n\n".join(assembled_blocks)
-        return
-
     async def _process_section(
         self,
         outline: Outline,
         section: NumberedSection,
         all_section_headers: List[str],
-        assembled_blocks: List[str],
     ) -> AsyncGenerator[Dict[str, Any], None]:
         section_title = section.title
         subsection_titles = section.subsections
+        timing = SectionTiming(title=section_title)
+        self.timings.sections.append(timing)
 
         async for status in self._emit_status_payload(
             {"status": "writing_section", "section": section_title}
@@ -257,8 +360,8 @@ class _ReportStreamRunner:
             yield status
 
         writer_system = "You write high-quality, well-structured prose that continues a report seamlessly."
-        report_context = self._build_report_context(
-            self._written_sections, section_title, subsection_titles
+        report_context = await self._offload(
+            self._build_report_context, self._assembly, section_title, subsection_titles
         )
         writer_prompt = build_section_writer_prompt(
             outline.report_title,
@@ -268,15 +371,27 @@ class _ReportStreamRunner:
             full_report_context=report_context,
         )
 
+        timing.queue_wait = time.monotonic() - self._section_ready_at
         while True:
+            call_started = time.monotonic()
+            timing.write_attempts += 1
             try:
-                section_text = await self.service.text_client.call_text_async(
-                    self.writer_state.active,
-                    writer_system,
-                    writer_prompt,
-                )
+                with STAGE_DURATION.time(
+                    stage="write", model=self.writer_state.active.model
+                ), self._tracer.span(
+                    "report.section.write",
+                    parent=self._section_span,
+                    attempt=timing.write_attempts,
+                ):
+                    section_text = await self.service.text_client.call_text_async(
+                        self.writer_state.active,
+                        writer_system,
+                        writer_prompt,
+                    )
+                timing.write += time.monotonic() - call_started
                 break
             except BaseException as exception:
+                timing.write += time.monotonic() - call_started
                 if isinstance(exception, asyncio.CancelledError) or not isinstance(
                     exception, Exception
                 ):
@@ -294,19 +409,26 @@ class _ReportStreamRunner:
                     yield status
                 continue
 
+        post_started = time.monotonic()
         section_text = enforce_subsection_headings(section_text, subsection_titles)
+        timing.post_processing += time.monotonic() - post_started
 
         async for status in self._emit_status_payload(
             {"status": "editing_section", "section": section_title}
         ):
             yield status
+        call_started = time.monotonic()
         try:
-            narrated = await self._edit_section(
-                outline.report_title,
-                section_title,
-                section_text,
-            )
+            with STAGE_DURATION.time(
+                stage="edit", model=self.editor_spec.model
+            ), self._tracer.span("report.section.edit", parent=self._section_span):
+                narrated = await self._edit_section(
+                    outline.report_title,
+                    section_title,
+                    section_text,
+                )
         except BaseException as exception:
+            timing.edit += time.monotonic() - call_started
             if isinstance(exception, asyncio.CancelledError) or not isinstance(
                 exception, Exception
             ):
@@ -317,25 +439,49 @@ class _ReportStreamRunner:
                 yield status
             return
 
+        timing.edit += time.monotonic() - call_started
+
+        post_started = time.monotonic()
         cleaned_narration = self._finalize_section_body(
             narrated, subsection_titles
         )
-        written_section = WrittenSection(
-            title=section_title,
-            body=cleaned_narration,
+        await self._offload(self._assembly.append, section_title, cleaned_narration)
+        timing.post_processing += time.monotonic() - post_started
+        self._section_span.set_attributes(
+            write_attempts=timing.write_attempts,
+            body_chars=len(cleaned_narration),
         )
-        self._written_sections.append(written_section)
-
-        assembled_blocks.append(f"{section_title}\n\n{cleaned_narration}")
 
         async for status in self._emit_status_payload(
-            {"status": "section_complete", "section": section_title}
+            {
+                "status": "section_complete",
+                "section": section_title,
+                "index": len(self._assembly),
+                "body": cleaned_narration,
+            }
         ):
             yield status
+        self._section_ready_at = time.monotonic()
+
+    def _load_saved_outline(self) -> Optional[Outline]:
+        if not self.report_store:
+            return None
+        try:
+            with self._tracer.span("report.load_saved_outline", parent=self._run_span) as span:
+                outline = self.report_store.find_latest_outline(self.request)
+                span.set_attribute("found", outline is not None)
+        except Exception:
+            # Reuse is an optimisation; fall back to generating a fresh outline.
+            return None
+        if outline is None:
+            return None
+        if self.request.sections is not None and len(outline.sections) != self.request.sections:
+            return None
+        return outline
 
     def _build_report_context(
         self,
-        written_sections: List[WrittenSection],
+        written_sections: Union[ReportAssembly, ReportSpool],
         section_title: str,
         subsection_titles: List[str],
     ) -> Optional[str]:
@@ -364,9 +510,12 @@ class _ReportStreamRunner:
         if not self.report_store:
             return None
         try:
-            self._storage_handle = self.report_store.prepare_report(
-                self.request, outline
-            )
+            with STAGE_DURATION.time(
+                stage="prepare_storage", model=""
+            ), self._tracer.span("report.prepare_storage", parent=self._run_span):
+                self._storage_handle = self.report_store.prepare_report(
+                    self.request, outline
+                )
         except Exception as exception:
             self._storage_handle = None
             return {
@@ -375,19 +524,44 @@ class _ReportStreamRunner:
             }
         return {"status": "persistence_ready"}
 
-    def _finalize_report_persistence(
-        self, assembled_narration: str
-    ) -> Optional[Dict[str, Any]]:
+    def _open_assembly(self, outline: Outline) -> Union[ReportAssembly, ReportSpool]:
+        """Spool sections into the report directory when the store supports it."""
+
+        if (
+            self.report_store
+            and self._storage_handle
+            and getattr(self.report_store, "spool_sections", False)
+        ):
+            try:
+                return self.report_store.open_spool(self._storage_handle, outline.report_title)
+            except OSError:
+                pass
+        return ReportAssembly(outline.report_title)
+
+    def _finalize_report_persistence(self) -> Optional[Dict[str, Any]]:
         if not self.report_store or not self._storage_handle:
             return None
         try:
-            section_payload = [
-                {"title": section.title, "body": section.body}
-                for section in self._written_sections
-            ]
-            self.report_store.finalize_report(
-                self._storage_handle, assembled_narration, section_payload
-            )
+            with STAGE_DURATION.time(
+                stage="persist", model=""
+            ), self._tracer.span("report.persist", parent=self._run_span):
+                if isinstance(self._assembly, ReportSpool):
+                    self._report_artifact = self.report_store.finalize_spooled_report(
+                        self._storage_handle,
+                        self._assembly,
+                        timings=self.timings.as_dict(),
+                    )
+                else:
+                    section_payload = [
+                        {"title": section.title, "body": section.body}
+                        for section in self._assembly
+                    ]
+                    self._report_artifact = self.report_store.finalize_report(
+                        self._storage_handle,
+                        self._assembly.text(),
+                        section_payload,
+                        timings=self.timings.as_dict(),
+                    )
         except Exception as exception:
             self._mark_storage_failed(f"Failed to persist report artifacts: {exception}")
             return {
@@ -404,19 +578,61 @@ class _ReportStreamRunner:
     ) -> str:
         return enforce_subsection_headings(narration, subsection_titles).strip()
 
-    def _build_final_payload(
-        self, outline: Outline, assembled_narration: str
-    ) -> Dict[str, Any]:
-        payload = {
+    def _build_final_payload(self, outline: Outline) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
             "status": "complete",
             "report_title": outline.report_title,
-            "report": assembled_narration,
         }
+        if self.request.return_ == "reference":
+            # Sections already went out in section_complete events; send only
+            # enough for the client to locate or verify the stored narration.
+            artifact = self._report_artifact or StoredReportArtifact.for_content(
+                encode_report_content(self._assembly.text())
+            )
+            payload.update(
+                report_id=str(artifact.report_id) if artifact.report_id else None,
+                content_uri=artifact.content_uri,
+                byte_size=artifact.byte_size,
+                content_hash=artifact.content_hash,
+            )
+        else:
+            payload["report"] = self._assembly.text()
+        payload["timings"] = self.timings.as_dict()
         if self.request.return_ == "report_with_outline":
             payload["outline_used"] = outline.model_dump()
         return payload
 
+    def _save_profile(self, handle: Optional[StoredReportHandle]) -> Dict[str, Any]:
+        result = self._profiler.stop()
+        timings = self.timings.as_dict()
+        breakdown = result.breakdown()
+        payload: Dict[str, Any] = {
+            "samples": breakdown["samples"],
+            "loop_idle_pct": breakdown["loop_idle_pct"],
+            "categories_pct": breakdown["categories_pct"],
+            "llm_wait_ms": timings["llm_ms"],
+            "total_ms": timings["total_ms"],
+        }
+        if handle is None or not self.report_store:
+            # Nowhere to save artifacts; return the summary inline only.
+            payload["uri"] = None
+            return payload
+        try:
+            paths = result.write(
+                handle.report_dir,
+                {"report_id": str(handle.report_id), "timings": timings},
+            )
+        except OSError as exception:
+            payload["uri"] = None
+            payload["detail"] = f"Failed to save profile: {exception}"
+            return payload
+        payload["uri"] = self.report_store.artifact_uri(paths["summary"])
+        payload["folded_uri"] = self.report_store.artifact_uri(paths["folded"])
+        return payload
+
     def _mark_storage_failed(self, detail: str) -> None:
+        if isinstance(self._assembly, ReportSpool):
+            self._assembly.discard()
         if not self.report_store or not self._storage_handle:
             return
         try:
@@ -440,20 +656,35 @@ class _ReportStreamRunner:
     def _stage_error_payload(
         self, section_title: str, action: str, exception: Exception
     ) -> Dict[str, Any]:
+        self._section_span.record_exception(exception)
         self._encountered_error = True
-        self._assembled_narration = None
         return {
             "status": "error",
             "section": section_title,
             "detail": f"Failed to {action} section '{section_title}': {exception}",
         }
 
-    async def _emit_status_payload(
+    @asynccontextmanager
+    async def _emit_status(
         self, payload: Dict[str, Any]
     ) -> AsyncGenerator[Dict[str, Any], None]:
+        payload["elapsed_ms"] = self.timings.elapsed_ms()
         async with self.service._emit_status(payload) as status:
             yield status
 
+    async def _offload(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking storage work on the storage pool, or inline without a store."""
+
+        if not self.report_store:
+            return func(*args)
+        return await self.service.storage_executor.run(func, *args)
+
+    async def _emit_status_payload(
+        self, payload: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        async with self._emit_status(payload) as status:
+            yield status
+
     async def _emit_stage_error(
         self, section_title: str, action: str, exception: Exception
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
 
 from backend.schemas import ModelSpec
 
@@ -18,6 +19,30 @@ class WrittenSection:
     body: str
 
 
+class ReportAssembly:
+    """Finished sections kept in memory; ``ReportSpool`` is the on-disk variant."""
+
+    def __init__(self, report_title: str) -> None:
+        self.report_title = report_title
+        self._sections: List[WrittenSection] = []
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def __iter__(self) -> Iterator[WrittenSection]:
+        return iter(self._sections)
+
+    def append(self, title: str, body: str) -> WrittenSection:
+        section = WrittenSection(title=title, body=body)
+        self._sections.append(section)
+        return section
+
+    def text(self) -> str:
+        blocks = [self.report_title]
+        blocks.extend(f"{section.title}\n\n{section.body}" for section in self._sections)
+        return "\n\n".join(blocks)
+
+
 @dataclass
 class WriterState:
     primary: ModelSpec
@@ -35,3 +60,60 @@ class WriterState:
             self.active = self.fallback
             return True
         return False
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+@dataclass
+class SectionTiming:
+    title: str
+    queue_wait: float = 0.0
+    write: float = 0.0
+    write_attempts: int = 0
+    edit: float = 0.0
+    post_processing: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "queue_wait_ms": _ms(self.queue_wait),
+            "write_ms": _ms(self.write),
+            "write_attempts": self.write_attempts,
+            "edit_ms": _ms(self.edit),
+            "llm_ms": _ms(self.write + self.edit),
+            "post_processing_ms": _ms(self.post_processing),
+        }
+
+
+@dataclass
+class RunTimings:
+    """Monotonic timing trace for one report run.
+
+    ``queue_wait`` for a section is the gap between the previous section (or
+    the section phase) finishing and the writer call starting; it captures
+    event-consumer backpressure and prompt building.
+    """
+
+    started: float = field(default_factory=time.monotonic)
+    stages: Dict[str, float] = field(default_factory=dict)
+    sections: List[SectionTiming] = field(default_factory=list)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def elapsed_ms(self) -> float:
+        return _ms(self.elapsed())
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        llm = sum(section.write + section.edit for section in self.sections)
+        return {
+            "total_ms": self.elapsed_ms(),
+            "llm_ms": _ms(llm + self.stages.get("outline", 0.0)),
+            "stages": {f"{name}_ms": _ms(seconds) for name, seconds in self.stages.items()},
+            "sections": [section.as_dict() for section in self.sections],
+        }
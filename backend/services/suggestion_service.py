@@ -1,22 +1,19 @@
 from __future__ import annotations
 
 import json
-import os
 from typing import Iterable, List, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session, sessionmaker
 
-from backend.db import Report, create_engine_from_url, create_session_factory, session_scope
+from backend.db import Report, create_session_factory, get_engine, session_scope
 from backend.schemas import (
     SuggestionItem,
     SuggestionsRequest,
     SuggestionsResponse,
 )
 from backend.utils.openai_client import OpenAITextClient, get_default_text_client
-
-_DEFAULT_DB_ENV = "EXPLORER_DATABASE_URL"
-_DEFAULT_DB_URL = "sqlite:///data/reportgen.db"
+from backend.utils.tracing import get_tracer
 
 
 class SuggestionService:
@@ -31,20 +28,23 @@ class SuggestionService:
         self.session_factory = session_factory or self._build_session_factory()
 
     async def generate(self, request: SuggestionsRequest) -> SuggestionsResponse:
-        seeds = self._collect_seeds(request)
-        if not seeds:
-            return SuggestionsResponse(suggestions=[])
-
-        max_suggestions = request.max_suggestions or 10
-        prompt = self._build_prompt(seeds)
-        raw_response = await self.text_client.call_text_async(
-            request.model, self._system_prompt(), prompt
-        )
-        seen: set[str] = set()
-        titles = self._parse_titles(raw_response, max_suggestions, seen)
-        return SuggestionsResponse(
-            suggestions=[SuggestionItem(title=title, source="guided") for title in titles]
-        )
+        with get_tracer().span("suggestions.generate", model=request.model.model) as span:
+            seeds = self._collect_seeds(request)
+            span.set_attribute("seeds", len(seeds))
+            if not seeds:
+                return SuggestionsResponse(suggestions=[])
+
+            max_suggestions = request.max_suggestions or 10
+            prompt = self._build_prompt(seeds)
+            raw_response = await self.text_client.call_text_async(
+                request.model, self._system_prompt(), prompt
+            )
+            seen: set[str] = set()
+            titles = self._parse_titles(raw_response, max_suggestions, seen)
+            span.set_attribute("suggestions", len(titles))
+            return SuggestionsResponse(
+                suggestions=[SuggestionItem(title=title, source="guided") for title in titles]
+            )
 
     def _collect_seeds(self, request: SuggestionsRequest) -> List[str]:
         seeds: List[str] = []
@@ -60,18 +60,17 @@ class SuggestionService:
             return []
         try:
             with session_scope(self.session_factory) as session:
-                reports = session.scalars(
-                    select(Report)
-                    .where(Report.sections != None)  # noqa: E711
+                outlines = session.scalars(
+                    select(Report.outline_snapshot)
+                    .where(Report.outline_snapshot.is_not(None))
                     .order_by(Report.created_at.desc())
                     .limit(limit)
                 ).all()
         except Exception:
             return []
         headings: List[str] = []
-        for report in reports:
-            sections_payload = (report.sections or {}).get("outline") or {}
-            sections = sections_payload.get("sections", [])
+        for outline in outlines:
+            sections = (outline or {}).get("sections", [])
             for section in sections:
                 title = (section.get("title") or "").strip()
                 if title:
@@ -172,9 +171,8 @@ class SuggestionService:
 
     @staticmethod
     def _build_session_factory() -> Optional[sessionmaker[Session]]:
-        database_url = os.environ.get(_DEFAULT_DB_ENV, _DEFAULT_DB_URL)
         try:
-            engine = create_engine_from_url(database_url)
+            engine = get_engine()
         except Exception:
             return None
         return create_session_factory(engine)
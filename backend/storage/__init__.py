@@ -1,3 +1,23 @@
-from .report_store import GeneratedReportStore, StoredReportHandle
+from .content_cache import ContentStats, ReportContentCache, content_stats, get_content_cache
+from .executor import StorageExecutor, get_storage_executor
+from .report_spool import ReportSpool
+from .report_store import (
+    GeneratedReportStore,
+    StoredReportArtifact,
+    StoredReportHandle,
+    encode_report_content,
+)
 
-__all__ = ["GeneratedReportStore", "StoredReportHandle"]
+__all__ = [
+    "ContentStats",
+    "GeneratedReportStore",
+    "ReportContentCache",
+    "ReportSpool",
+    "StoredReportArtifact",
+    "StorageExecutor",
+    "StoredReportHandle",
+    "content_stats",
+    "encode_report_content",
+    "get_content_cache",
+    "get_storage_executor",
+]
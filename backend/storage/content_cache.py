@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_CACHE_MB_ENV = "EXPLORER_REPORT_CONTENT_CACHE_MB"
+_DEFAULT_CACHE_MB = 64
+_READ_CHUNK_CHARS = 64 * 1024
+
+SNIPPET_CHARS = 280
+WORDS_PER_MINUTE = 200
+
+
+@dataclass(frozen=True)
+class ContentStats:
+    """Listing preview of a report: its opening text and length."""
+
+    snippet: str
+    word_count: int
+
+    @property
+    def reading_minutes(self) -> int:
+        return math.ceil(self.word_count / WORDS_PER_MINUTE)
+
+
+def content_stats(chunks: Iterable[str], snippet_chars: int = SNIPPET_CHARS) -> ContentStats:
+    """Compute the snippet (whitespace collapsed) and word count of streamed text.
+
+    Works chunk by chunk so spooled reports never have to be held in memory
+    whole; words split across chunk boundaries are counted once.
+    """
+
+    snippet: List[str] = []
+    snippet_length = 0
+    words = 0
+    in_word = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts = chunk.split()
+        continues = in_word and not chunk[0].isspace()
+        words += len(parts) - (1 if continues else 0)
+        in_word = not chunk[-1].isspace()
+        for index, part in enumerate(parts):
+            if snippet_length > snippet_chars:
+                break
+            if index == 0 and continues and snippet:
+                snippet[-1] += part
+                snippet_length += len(part)
+            else:
+                snippet.append(part)
+                snippet_length += len(part) + 1
+    return ContentStats(snippet=" ".join(snippet)[:snippet_chars].rstrip(), word_count=words)
+
+
+def read_text_chunks(path: Path, chunk_chars: int = _READ_CHUNK_CHARS) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as handle:
+        while True:
+            chunk = handle.read(chunk_chars)
+            if not chunk:
+                return
+            yield chunk
+
+
+@dataclass
+class _CachedContent:
+    text: str
+    stats: Optional[ContentStats] = None
+
+
+class ReportContentCache:
+    """Size-bounded LRU of report files keyed by path, mtime and size.
+
+    A rewritten file gets a new key, so stale text is never served; the old
+    entry simply ages out. Files larger than the whole budget are read
+    through without being cached. ``stats`` reuses the cached text and keeps
+    the computed snippet next to it.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, max_bytes)
+        self._entries: "OrderedDict[Tuple[str, int, int], _CachedContent]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ReportContentCache":
+        """``EXPLORER_REPORT_CONTENT_CACHE_MB=0`` disables caching."""
+
+        return cls(int(float(os.environ.get(_CACHE_MB_ENV, _DEFAULT_CACHE_MB)) * 1024 * 1024))
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def read(self, path: Path) -> Optional[str]:
+        entry = self._entry(path)
+        return entry.text if entry is not None else None
+
+    def stats(self, path: Path) -> Optional[ContentStats]:
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        if entry.stats is None:
+            entry.stats = content_stats([entry.text])
+        return entry.stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _entry(self, path: Path) -> Optional[_CachedContent]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        entry = _CachedContent(text)
+        if stat.st_size <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._size += stat.st_size
+                self._entries[key] = entry
+                while self._size > self.max_bytes:
+                    (_, _, evicted_size), _ = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+        return entry
+
+
+@lru_cache
+def get_content_cache() -> ReportContentCache:
+    return ReportContentCache.from_env()
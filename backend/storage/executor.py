@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeVar
+
+_THREADS_ENV = "EXPLORER_STORAGE_THREADS"
+_DEFAULT_THREADS = 4
+
+T = TypeVar("T")
+
+
+class StorageExecutor:
+    """Bounded thread pool for blocking report-store work (SQLAlchemy, disk).
+
+    Streaming runners await ``run`` instead of calling ``GeneratedReportStore``
+    directly so a slow disk or database only delays the stream that needs
+    it, not every stream on the event loop. Context variables (the current
+    trace span) are copied into the worker thread.
+    """
+
+    def __init__(self, max_workers: int = _DEFAULT_THREADS) -> None:
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "StorageExecutor":
+        return cls(int(os.environ.get(_THREADS_ENV, _DEFAULT_THREADS)))
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._pool(), call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="explorer-storage"
+            )
+        return self._executor
+
+
+@lru_cache
+def get_storage_executor() -> StorageExecutor:
+    return StorageExecutor.from_env()
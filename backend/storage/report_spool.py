@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from backend.services.report_state import WrittenSection
+
+PARTIAL_SUFFIX = ".partial"
+
+
+@dataclass(frozen=True)
+class SpooledSection:
+    title: str
+    offset: int
+    length: int
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"title": self.title, "offset": self.offset, "length": self.length}
+
+
+class ReportSpool:
+    """Append-only report assembly backed by ``<narrative>.partial`` on disk.
+
+    Produces the same bytes ``encode_report_content`` would for the joined
+    report (title, then ``"\\n\\n<section>\\n\\n<body>"`` per section, stripped
+    and newline-terminated) while keeping only section titles and byte
+    offsets in memory. Leading whitespace is dropped and trailing whitespace
+    is held back until more text arrives, which is what the final strip
+    would do. ``commit`` renames the partial file over the narrative path.
+    """
+
+    def __init__(self, narrative_path: Path, report_title: str) -> None:
+        self.narrative_path = narrative_path
+        self.partial_path = narrative_path.with_name(narrative_path.name + PARTIAL_SUFFIX)
+        self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = open(self.partial_path, "wb")
+        self._hash = hashlib.sha256()
+        self._size = 0
+        self._held = b""
+        self._started = False
+        self._committed = False
+        self.sections: List[SpooledSection] = []
+        self._write_text(report_title)
+
+    @property
+    def byte_size(self) -> int:
+        return self._size
+
+    @property
+    def content_hash(self) -> str:
+        return f"sha256:{self._hash.hexdigest()}"
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __iter__(self) -> Iterator[WrittenSection]:
+        for section in self.sections:
+            yield WrittenSection(title=section.title, body=self.read_body(section))
+
+    def append(self, title: str, body: str) -> SpooledSection:
+        self._write_text(f"\n\n{title}\n\n")
+        encoded = body.encode("utf-8")
+        # Bodies arrive stripped, so a non-empty body is written right after the held separator.
+        section = SpooledSection(title=title, offset=self._size + len(self._held), length=len(encoded))
+        self._write_text(body)
+        self.sections.append(section)
+        return section
+
+    def read_body(self, section: SpooledSection) -> str:
+        if self._file is not None:
+            self._file.flush()
+        path = self.narrative_path if self._committed else self.partial_path
+        with open(path, "rb") as handle:
+            handle.seek(section.offset)
+            return handle.read(section.length).decode("utf-8")
+
+    def text(self) -> str:
+        """Return the assembled report without the trailing newline (reads it back from disk)."""
+
+        if self._file is not None:
+            self._file.flush()
+        path = self.narrative_path if self._committed else self.partial_path
+        content = path.read_bytes().decode("utf-8")
+        return content[:-1] if self._committed else content
+
+    def commit(self) -> None:
+        """Terminate the text, fsync it and atomically move it into place."""
+
+        if self._committed:
+            return
+        assert self._file is not None
+        self._write_bytes(b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        os.replace(self.partial_path, self.narrative_path)
+        self._committed = True
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if not self._committed:
+            self.partial_path.unlink(missing_ok=True)
+
+    def _write_text(self, text: str) -> None:
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return
+            self._started = True
+        core = text.rstrip()
+        tail = text[len(core) :].encode("utf-8")
+        if core:
+            self._write_bytes(self._held + core.encode("utf-8"))
+            self._held = tail
+        else:
+            self._held += tail
+
+    def _write_bytes(self, data: bytes) -> None:
+        assert self._file is not None
+        self._file.write(data)
+        self._hash.update(data)
+        self._size += len(data)
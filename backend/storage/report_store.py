@@ -1,36 +1,41 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 import shutil
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
 from backend.db import (
-    Base,
+    CommitQueue,
     Report,
+    ReportSection,
     ReportStatus,
     SavedTopic,
     User,
-    create_engine_from_url,
     create_session_factory,
+    get_engine,
     session_scope,
 )
 from backend.schemas import GenerateRequest, Outline
+from backend.utils.tracing import current_span, traced
+from .content_cache import ContentStats, content_stats, read_text_chunks
+from .report_spool import ReportSpool
 
-_DEFAULT_DB_URL = "sqlite:///data/reportgen.db"
-_DEFAULT_DB_ENV = "EXPLORER_DATABASE_URL"
 _DEFAULT_STORAGE_ENV = "EXPLORER_REPORT_STORAGE_DIR"
 _DEFAULT_STORAGE_DIR = "data/reports"
 _DEFAULT_USER_EMAIL_ENV = "EXPLORER_DEFAULT_USER_EMAIL"
+_SPOOL_ENV = "EXPLORER_REPORT_SPOOL"
 _SYSTEM_USER_EMAIL = "system@explorer.local"
 _SYSTEM_USERNAME = "Explorer System"
 
@@ -39,6 +44,8 @@ _TOPIC_RETRY_LIMIT = 3
 _TOPIC_TITLE_MAX_LENGTH = 255
 _FALLBACK_REPORT_TITLE = "Explorer Report"
 
+T = TypeVar("T")
+
 
 
 @dataclass(frozen=True)
@@ -50,6 +57,33 @@ class StoredReportHandle:
     narrative_path: Path
 
 
+@dataclass(frozen=True)
+class StoredReportArtifact:
+    """Where a finalized report's narration lives and how to verify it."""
+
+    report_id: uuid.UUID
+    content_uri: Optional[str]
+    byte_size: int
+    content_hash: str
+
+    @classmethod
+    def for_content(
+        cls, content: bytes, report_id: Optional[uuid.UUID] = None, content_uri: Optional[str] = None
+    ) -> "StoredReportArtifact":
+        return cls(
+            report_id=report_id,
+            content_uri=content_uri,
+            byte_size=len(content),
+            content_hash=f"sha256:{hashlib.sha256(content).hexdigest()}",
+        )
+
+
+def encode_report_content(narration: str) -> bytes:
+    """Return the exact bytes stored for ``narration`` (stripped, newline-terminated UTF-8)."""
+
+    return (narration.strip() + "\n").encode("utf-8")
+
+
 class GeneratedReportStore:
     """Persist generated report metadata plus artifacts to disk."""
 
@@ -58,6 +92,8 @@ class GeneratedReportStore:
         *,
         base_dir: Optional[Path | str] = None,
         session_factory: Optional[sessionmaker[Session]] = None,
+        spool_sections: Optional[bool] = None,
+        commit_queue: Optional[CommitQueue] = None,
     ) -> None:
         configured_base = base_dir or os.environ.get(_DEFAULT_STORAGE_ENV, _DEFAULT_STORAGE_DIR)
         self.base_dir = Path(configured_base).expanduser().resolve()
@@ -67,7 +103,13 @@ class GeneratedReportStore:
             _DEFAULT_USER_EMAIL_ENV,
             _SYSTEM_USER_EMAIL,
         )
+        if spool_sections is None:
+            spool_sections = os.environ.get(_SPOOL_ENV, "1").lower() not in {"0", "false", "no", "off"}
+        self.spool_sections = spool_sections
+        # When set, row writes go through the shared single-writer queue.
+        self._commit_queue = commit_queue
 
+    @traced("storage.prepare_report")
     def prepare_report(self, request: GenerateRequest, outline: Outline) -> StoredReportHandle:
         """Create DB rows and disk directories prior to section streaming."""
 
@@ -76,40 +118,17 @@ class GeneratedReportStore:
         while True:
             handle: Optional[StoredReportHandle] = None
             try:
-                with session_scope(self._session_factory) as session:
-                    user_email = request.user_email or self._default_user_email
-                    if request.user_email:
-                        username = request.username
-                    else:
-                        username = request.username or _SYSTEM_USERNAME
-                    user = self._get_or_create_user(
-                        session,
-                        user_email,
-                        username,
-                    )
-                    saved_topic = self._get_or_create_saved_topic(
-                        session,
-                        user,
-                        topic_title,
-                        slug_override=self._generate_slug_variant(topic_title, attempt),
-                    )
-                    report = Report(
-                        saved_topic=saved_topic,
-                        owner=user,
-                        status=ReportStatus.RUNNING,
-                        outline_snapshot=outline.model_dump(),
-                        sections={"outline": outline.model_dump(), "written": []},
-                        generated_started_at=datetime.now(timezone.utc),
-                    )
-                    session.add(report)
-                    session.flush()
-                    handle = self._build_report_handle(report.id, user.id)
+                handle = self._write(
+                    lambda session: self._insert_report(session, request, outline, topic_title, attempt)
+                )
                 self._write_outline_snapshot(handle, outline)
+                current_span().set_attribute("report_id", handle.report_id)
                 break
             except IntegrityError as exception:
                 if not self._is_slug_unique_violation(exception):
                     raise
                 attempt += 1
+                current_span().set_attribute("slug_retries", attempt)
                 if attempt >= _TOPIC_RETRY_LIMIT:
                     raise
                 continue
@@ -121,39 +140,201 @@ class GeneratedReportStore:
                 raise
         return handle
 
+    def _insert_report(
+        self,
+        session: Session,
+        request: GenerateRequest,
+        outline: Outline,
+        topic_title: str,
+        attempt: int,
+    ) -> StoredReportHandle:
+        user_email = request.user_email or self._default_user_email
+        if request.user_email:
+            username = request.username
+        else:
+            username = request.username or _SYSTEM_USERNAME
+        user = self._get_or_create_user(
+            session,
+            user_email,
+            username,
+        )
+        saved_topic = self._get_or_create_saved_topic(
+            session,
+            user,
+            topic_title,
+            slug_override=self._generate_slug_variant(topic_title, attempt),
+        )
+        report = Report(
+            saved_topic=saved_topic,
+            owner=user,
+            status=ReportStatus.RUNNING,
+            outline_snapshot=outline.model_dump(),
+            generated_started_at=datetime.now(timezone.utc),
+        )
+        session.add(report)
+        session.flush()
+        return self._build_report_handle(report.id, user.id)
+
+    @traced("storage.finalize_report")
     def finalize_report(
         self,
         handle: StoredReportHandle,
         narration: str,
         written_sections: Iterable[Dict[str, Any]],
         summary: Optional[str] = None,
-    ) -> None:
-        """Persist the final narration and update DB metadata."""
+        timings: Optional[Dict[str, Any]] = None,
+    ) -> StoredReportArtifact:
+        """Persist the final narration and update DB metadata.
 
-        text = narration.strip() + "\n"
+        ``timings`` is the run's timing trace; its ``persist_ms`` stage covers
+        the artifact write and row load, not the final commit. Returns the
+        stored artifact's URI, size and hash.
+        """
+
+        started = time.monotonic()
+        content = encode_report_content(narration)
+        content_uri = self._relative_uri(handle.narrative_path)
+        artifact = StoredReportArtifact.for_content(content, handle.report_id, content_uri)
+        current_span().set_attributes(report_id=handle.report_id, narration_bytes=len(content))
         handle.narrative_path.parent.mkdir(parents=True, exist_ok=True)
-        handle.narrative_path.write_text(text, encoding="utf-8")
-        sections_payload = list(written_sections)
-        with session_scope(self._session_factory) as session:
+        handle.narrative_path.write_bytes(content)
+        self._mark_complete(
+            handle,
+            content_uri,
+            artifact.content_hash,
+            list(written_sections),
+            content_stats([narration]),
+            summary,
+            timings,
+            started,
+        )
+        return artifact
+
+    def open_spool(self, handle: StoredReportHandle, report_title: str) -> ReportSpool:
+        """Start spooling sections to ``report.md.partial`` in the report directory."""
+
+        return ReportSpool(handle.narrative_path, report_title)
+
+    @traced("storage.finalize_report")
+    def finalize_spooled_report(
+        self,
+        handle: StoredReportHandle,
+        spool: ReportSpool,
+        summary: Optional[str] = None,
+        timings: Optional[Dict[str, Any]] = None,
+    ) -> StoredReportArtifact:
+        """Atomically move a spooled report into place and update DB metadata.
+
+        Each ``report_sections`` row records the section's title plus the
+        byte offset and size of its body in the content file instead of a
+        second copy of the text.
+        """
+
+        started = time.monotonic()
+        spool.commit()
+        content_uri = self._relative_uri(handle.narrative_path)
+        current_span().set_attributes(report_id=handle.report_id, narration_bytes=spool.byte_size)
+        self._mark_complete(
+            handle,
+            content_uri,
+            spool.content_hash,
+            [section.as_dict() for section in spool.sections],
+            content_stats(read_text_chunks(handle.narrative_path)),
+            summary,
+            timings,
+            started,
+        )
+        return StoredReportArtifact(
+            report_id=handle.report_id,
+            content_uri=content_uri,
+            byte_size=spool.byte_size,
+            content_hash=spool.content_hash,
+        )
+
+    def _mark_complete(
+        self,
+        handle: StoredReportHandle,
+        content_uri: str,
+        content_hash: str,
+        sections_payload: List[Dict[str, Any]],
+        stats: ContentStats,
+        summary: Optional[str],
+        timings: Optional[Dict[str, Any]],
+        started: float,
+    ) -> None:
+        def mark(session: Session) -> None:
             report = session.get(Report, handle.report_id)
             if not report:
                 return
             report.status = ReportStatus.COMPLETE
             if summary:
                 report.summary = summary
-            report.sections = {"outline": report.outline_snapshot, "written": sections_payload}
-            report.content_uri = self._relative_uri(handle.narrative_path)
+            report.written_sections = [
+                ReportSection.from_entry(index, entry) for index, entry in enumerate(sections_payload)
+            ]
+            report.content_uri = content_uri
+            report.content_hash = content_hash
+            report.snippet = stats.snippet
+            report.word_count = stats.word_count
             report.generated_completed_at = datetime.now(timezone.utc)
+            if timings is not None:
+                stages = dict(timings.get("stages") or {})
+                stages["persist_ms"] = round((time.monotonic() - started) * 1000, 3)
+                report.timings = {**timings, "stages": stages}
 
+        self._write(mark)
+
+    @traced("storage.discard_report")
     def discard_report(self, handle: StoredReportHandle) -> None:
         """Remove the persisted report row and artifacts when generation fails."""
 
+        current_span().set_attribute("report_id", handle.report_id)
         self._remove_artifacts(handle)
-        with session_scope(self._session_factory) as session:
+
+        def delete(session: Session) -> None:
             report = session.get(Report, handle.report_id)
-            if not report:
-                return
-            session.delete(report)
+            if report:
+                session.delete(report)
+
+        self._write(delete)
+
+    def find_latest_outline(self, request: GenerateRequest) -> Optional[Outline]:
+        """Return the outline of the newest live report on the request's saved topic."""
+
+        topic_title = _normalize_topic_title(request.topic)
+        if not topic_title:
+            return None
+        user_email = request.user_email or self._default_user_email
+        with session_scope(self._session_factory) as session:
+            snapshot = session.scalar(
+                select(Report.outline_snapshot)
+                .join(SavedTopic, Report.saved_topic_id == SavedTopic.id)
+                .join(User, SavedTopic.owner_user_id == User.id)
+                .where(
+                    User.email == user_email,
+                    SavedTopic.title == topic_title,
+                    SavedTopic.is_deleted.is_(False),
+                    Report.is_deleted.is_(False),
+                    Report.status != ReportStatus.FAILED,
+                    Report.outline_snapshot.is_not(None),
+                )
+                .order_by(Report.created_at.desc())
+                .limit(1)
+            )
+        if not snapshot:
+            return None
+        return Outline.model_validate(snapshot)
+
+    def artifact_uri(self, path: Path) -> str:
+        """Return ``path`` relative to the storage root, as stored in ``content_uri``."""
+
+        return self._relative_uri(path)
+
+    def _write(self, operation: Callable[[Session], T]) -> T:
+        if self._commit_queue is not None:
+            return self._commit_queue.run(operation)
+        with session_scope(self._session_factory) as session:
+            return operation(session)
 
     def _topic_title(self, request: GenerateRequest, outline: Outline) -> str:
         topic = _normalize_topic_title(request.topic)
@@ -277,10 +458,7 @@ def _slugify(value: str) -> str:
 
 
 def _create_default_session_factory() -> sessionmaker[Session]:
-    database_url = os.environ.get(_DEFAULT_DB_ENV, _DEFAULT_DB_URL)
-    engine = create_engine_from_url(database_url)
-    Base.metadata.create_all(engine)
-    return create_session_factory(engine)
+    return create_session_factory(get_engine())
 
 
 def _normalize_topic_title(value: Optional[str]) -> str:
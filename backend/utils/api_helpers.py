@@ -1,14 +1,23 @@
-from typing import Optional, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+import asyncio
+import hashlib
 import os
+import secrets
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
 import uuid
 
-from fastapi import HTTPException, status
-from sqlalchemy import select
+from fastapi import HTTPException, Response, status
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.db import User, Report
-from backend.storage import GeneratedReportStore
+from backend.db import User
+from backend.db.schema_migrations import schema_version
+from backend.storage import ContentStats, GeneratedReportStore, get_content_cache, get_storage_executor
+
+T = TypeVar("T")
 
 def normalize_user(user_email: Optional[str], username: Optional[str]) -> Tuple[str, Optional[str]]:
     email = (user_email or "").strip()
@@ -20,6 +29,18 @@ def normalize_user(user_email: Optional[str], username: Optional[str]) -> Tuple[
     normalized_username = (username or "").strip() or None
     return email, normalized_username
 
+def require_admin_token(token: Optional[str]) -> None:
+    """Reject the request unless ``token`` matches ``EXPLORER_ADMIN_TOKEN``.
+
+    Admin-only options are disabled entirely when no token is configured.
+    """
+    expected = os.environ.get("EXPLORER_ADMIN_TOKEN", "")
+    if not expected or not token or not secrets.compare_digest(token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This option requires a valid X-Explorer-Admin-Token header.",
+        )
+
 def resolve_base_dir(report_store: Optional[GeneratedReportStore]) -> Path:
     if report_store:
         return report_store.base_dir
@@ -33,17 +54,63 @@ def get_or_create_user(
 ) -> User:
     user = session.scalar(select(User).where(User.email == user_email))
     if user:
-        if username:
-            if not user.full_name:
-                user.full_name = username
-            if not user.username:
-                user.username = username
+        _fill_username(user, username)
         return user
     user = User(email=user_email, full_name=username, username=username)
     session.add(user)
     session.flush()
     return user
 
+async def find_user_async(session: AsyncSession, user_email: str) -> Optional[User]:
+    """Read-only user lookup for GET routes; users are only created on the writer (``CommitQueue``)."""
+    return await session.scalar(select(User).where(User.email == user_email))
+
+def _fill_username(user: User, username: Optional[str]) -> None:
+    if username:
+        if not user.full_name:
+            user.full_name = username
+        if not user.username:
+            user.username = username
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag over ``parts``; the schema version is mixed in so upgrades invalidate it."""
+    raw = "\x1f".join(str(part) for part in (schema_version(), *parts))
+    return f'"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+def user_listing_etag(user: User, *parts: object) -> Tuple[str, Optional[datetime]]:
+    """ETag and ``Last-Modified`` for a listing of ``user``'s topics or reports.
+
+    Both come from the user's change counter, which every topic or report
+    write advances, so no listed rows are needed. Reads only what is already
+    loaded on ``user``, so it never triggers a lazy load.
+    """
+    loaded = inspect(user).dict
+    etag = make_etag(user.id, loaded.get("content_version") or 0, *parts)
+    return etag, loaded.get("content_changed_at")
+
+def not_modified(
+    response: Response, if_none_match: Optional[str], etag: str, last_modified: Optional[datetime] = None
+) -> Optional[Response]:
+    """Set the validators on ``response``; return a 304 when ``If-None-Match`` matches ``etag``.
+
+    ``If-Modified-Since`` is not evaluated: ``Last-Modified`` only has
+    one-second resolution, and ``If-None-Match`` takes precedence anyway.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    if if_none_match and _etag_listed(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def _etag_listed(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison, so a W/ prefix is ignored.
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
 def slugify(value: str) -> str:
     slug = value.lower()
     cleaned = []
@@ -64,15 +131,41 @@ def resolve_topic_title(title: str) -> str:
         )
     return resolved[:255]
 
-def load_report_content(report: Report, base_dir: Path) -> Optional[str]:
-    if not report.content_uri:
+def load_report_content(content_uri: Optional[str], base_dir: Path) -> Optional[str]:
+    path = _content_path(content_uri, base_dir)
+    return get_content_cache().read(path) if path is not None else None
+
+def load_report_stats(content_uri: Optional[str], base_dir: Path) -> Optional[ContentStats]:
+    path = _content_path(content_uri, base_dir)
+    return get_content_cache().stats(path) if path is not None else None
+
+def _content_path(content_uri: Optional[str], base_dir: Path) -> Optional[Path]:
+    if not content_uri:
         return None
-    path = Path(report.content_uri)
-    if not path.is_absolute():
-        path = base_dir / path
-    try:
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-    except Exception:
+    path = Path(content_uri)
+    return path if path.is_absolute() else base_dir / path
+
+async def load_report_content_async(content_uri: Optional[str], base_dir: Path) -> Optional[str]:
+    """Read stored report content on the storage thread pool."""
+    if not content_uri:
         return None
-    return None
+    return await get_storage_executor().run(load_report_content, content_uri, base_dir)
+
+async def load_many_async(
+    loader: Callable[[Optional[str], Path], T], content_uris: Sequence[Optional[str]], base_dir: Path
+) -> List[Optional[T]]:
+    """Run ``loader`` for each URI on the storage pool, a bounded number at a time.
+
+    At most half the pool's threads serve one listing, so report writes
+    queued behind a large listing still get a thread.
+    """
+    executor = get_storage_executor()
+    limit = asyncio.Semaphore(max(1, executor.max_workers // 2))
+
+    async def load(content_uri: Optional[str]) -> Optional[T]:
+        if not content_uri:
+            return None
+        async with limit:
+            return await executor.run(loader, content_uri, base_dir)
+
+    return await asyncio.gather(*(load(content_uri) for content_uri in content_uris))
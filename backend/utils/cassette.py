@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Literal, Optional
+
+CassetteMode = Literal["record", "replay"]
+
+_CASSETTE_PATH_ENV = "EXPLORER_OPENAI_CASSETTE"
+_CASSETTE_MODE_ENV = "EXPLORER_OPENAI_CASSETTE_MODE"
+_CASSETTE_LATENCY_ENV = "EXPLORER_OPENAI_CASSETTE_REPLAY_LATENCY"
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request was never recorded."""
+
+    def __init__(self, request: Dict[str, Any]):
+        super().__init__(
+            f"No recorded response for model {request.get('model')!r} "
+            f"(key {request_key(request)[:12]}); re-record the cassette."
+        )
+        self.request = request
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Stable hash of the request fields that determine the model output."""
+
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """JSONL log of text-client requests and responses for offline replays.
+
+    In ``record`` mode every completed call is appended (with its latency) as
+    one JSON line. In ``replay`` mode responses are served from the file in
+    recorded order per request key; once a key's recordings are exhausted the
+    last one is reused so repeated benchmark runs stay deterministic.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        mode: CassetteMode,
+        *,
+        replay_latency: bool = False,
+        latency_scale: float = 1.0,
+    ) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected 'record' or 'replay'.")
+        self.path = Path(path).expanduser()
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._last_served: Dict[str, Dict[str, Any]] = {}
+        if mode == "replay":
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassette"]:
+        path = os.environ.get(_CASSETTE_PATH_ENV)
+        if not path:
+            return None
+        mode = os.environ.get(_CASSETTE_MODE_ENV, "replay").strip().lower()
+        replay_latency = os.environ.get(_CASSETTE_LATENCY_ENV, "").lower() in _TRUTHY
+        return cls(path, mode, replay_latency=replay_latency)  # type: ignore[arg-type]
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, request: Dict[str, Any], response_text: str, latency_seconds: float, api: str) -> None:
+        entry = {
+            "key": request_key(request),
+            "request": request,
+            "response": response_text,
+            "latency_seconds": round(latency_seconds, 6),
+            "api": api,
+            "recorded_at": time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+    def replay(self, request: Dict[str, Any]) -> str:
+        entry = self._next_entry(request)
+        if self.replay_latency:
+            time.sleep(entry["latency_seconds"] * self.latency_scale)
+        return entry["response"]
+
+    async def replay_async(self, request: Dict[str, Any]) -> str:
+        entry = self._next_entry(request)
+        if self.replay_latency:
+            await asyncio.sleep(entry["latency_seconds"] * self.latency_scale)
+        return entry["response"]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return all recorded entries in file order."""
+
+        return list(_read_entries(self.path))
+
+    def _next_entry(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        key = request_key(request)
+        with self._lock:
+            queue = self._entries.get(key)
+            if queue:
+                entry = queue.popleft()
+                self._last_served[key] = entry
+                return entry
+            if key in self._last_served:
+                return self._last_served[key]
+        raise CassetteMissError(request)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette file not found: {self.path}")
+        for entry in _read_entries(self.path):
+            self._entries[entry.get("key") or request_key(entry["request"])].append(entry)
+
+
+def _read_entries(path: Path):
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
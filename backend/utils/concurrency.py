@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+
+from backend.utils.metrics import LLM_CALLS_IN_FLIGHT, LLM_CALLS_WAITING
+
+_LIMIT_ENV = "EXPLORER_MAX_CONCURRENT_LLM_CALLS"
+_DEFAULT_LIMIT = 16
+
+
+class LLMLimiter:
+    """Cap concurrent LLM calls across every service that shares the limiter.
+
+    Semaphores are created lazily per event loop, so one process-wide limiter
+    works for the server loop as well as for ``asyncio.run`` in tests and
+    scripts. A limit of ``0`` or less disables the cap.
+    """
+
+    def __init__(self, limit: int = _DEFAULT_LIMIT) -> None:
+        self.limit = limit
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def from_env(cls) -> "LLMLimiter":
+        return cls(int(os.environ.get(_LIMIT_ENV, _DEFAULT_LIMIT)))
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        if self.limit <= 0:
+            yield
+            return
+        semaphore = self._semaphore()
+        LLM_CALLS_WAITING.inc()
+        try:
+            await semaphore.acquire()
+        finally:
+            LLM_CALLS_WAITING.dec()
+        LLM_CALLS_IN_FLIGHT.inc()
+        try:
+            yield
+        finally:
+            LLM_CALLS_IN_FLIGHT.dec()
+            semaphore.release()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limit)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+@lru_cache
+def get_llm_limiter() -> LLMLimiter:
+    return LLMLimiter.from_env()
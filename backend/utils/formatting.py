@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from json import JSONDecodeError, JSONDecoder
-from typing import List
+from typing import List, Optional, Tuple
 
-from backend.schemas import Outline
+from backend.schemas import Outline, Section
 
 _SECTION_LABEL_RE = re.compile(r"Section\s+(\d+(?:\.\d+)*)\s*[:.-]?\s*(.*)", re.IGNORECASE)
 _NUMBER_PREFIX_RE = re.compile(r"^(\d+(?:\.\d+)*)\s*[:.-]?\s*(.*)$")
 _HASH_HEADING_PATTERN = re.compile(r"^###\s*")
 _NUMBERED_HEADING_PATTERN = re.compile(r"^(?:###\s*)?\d+(?:\.\d+)*\s*[:.-]?")
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
 
 
 def _ensure_numbered_title(title: str, default_number: str) -> str:
@@ -43,21 +45,74 @@ def ensure_subsection_numbering(title: str, section_index: int, subsection_index
 
 
 def enforce_subsection_headings(section_text: str, subsection_titles: List[str]) -> str:
-    lines = section_text.splitlines()
-    result = []
-    subsection_cursor = 0
+    normalizer = SubsectionHeadingNormalizer(subsection_titles)
+    return normalizer.feed(section_text) + normalizer.close()
 
-    for line in lines:
+
+class SubsectionHeadingNormalizer:
+    """Incremental form of ``enforce_subsection_headings``.
+
+    ``feed`` accepts arbitrary text chunks (e.g. streaming deltas) and returns
+    the normalized text for every line completed so far; ``close`` flushes the
+    final partial line. Concatenating all returned pieces equals
+    ``enforce_subsection_headings`` on the joined input: lines are split with
+    ``str.splitlines`` semantics, rejoined with ``"\\n"``, and the first heading-like
+    lines (``###`` or a leading number) are replaced by the titles in order.
+    """
+
+    def __init__(self, subsection_titles: List[str]) -> None:
+        self._titles = list(subsection_titles)
+        self._cursor = 0
+        self._pending = ""
+        self._started = False
+        self._closed = False
+
+    def feed(self, chunk: str) -> str:
+        if self._closed:
+            raise ValueError("feed() called after close().")
+        if not chunk:
+            return ""
+        text = self._pending + chunk
+        lines = text.splitlines()
+        last_char = text[-1]
+        if last_char not in _LINE_BREAKS or last_char == "\r":
+            # Keep the unfinished line; a trailing "\r" may be the first half of "\r\n".
+            self._pending = lines.pop() + ("\r" if last_char == "\r" else "")
+        else:
+            self._pending = ""
+        if not lines:
+            return ""
+        return self._emit(lines)
+
+    def close(self) -> str:
+        if self._closed:
+            return ""
+        self._closed = True
+        pending, self._pending = self._pending, ""
+        if not pending:
+            return ""
+        return self._emit(pending.splitlines() or [""])
+
+    def _emit(self, lines: List[str]) -> str:
+        if self._cursor < len(self._titles):
+            lines = [self._normalize(line) for line in lines]
+        joined = "\n".join(lines)
+        if self._started:
+            return "\n" + joined
+        self._started = True
+        return joined
+
+    def _normalize(self, line: str) -> str:
+        if self._cursor >= len(self._titles):
+            return line
         stripped = line.lstrip()
-        if subsection_cursor < len(subsection_titles):
+        if stripped[:1] == "#" or stripped[:1].isdigit():
             if _HASH_HEADING_PATTERN.match(stripped) or _NUMBERED_HEADING_PATTERN.match(stripped):
                 prefix = line[: len(line) - len(stripped)]
-                result.append(f"{prefix}{subsection_titles[subsection_cursor]}")
-                subsection_cursor += 1
-                continue
-        result.append(line)
-
-    return "\n".join(result)
+                title = self._titles[self._cursor]
+                self._cursor += 1
+                return f"{prefix}{title}"
+        return line
 
 
 def parse_outline_json(text: str) -> Outline:
@@ -84,3 +139,227 @@ def parse_outline_json(text: str) -> Outline:
             except JSONDecodeError:
                 pass
         raise
+
+
+_CODE_FENCE_RE = re.compile(r"```[a-zA-Z0-9_-]*\s*\n?(.*?)```", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+
+def parse_outline_tolerant(text: str) -> Outline:
+    """Best-effort outline extraction for responses ``parse_outline_json`` rejects.
+
+    Looks inside every code fence and at every ``{`` for a decodable object,
+    repairs trailing commas and typographic quotes, and accepts common shape
+    drift: ``title`` for ``report_title``, a wrapping ``outline`` object,
+    plain-string sections and ``{"title": ...}`` subsections.
+    """
+
+    normalized = text.translate(_SMART_QUOTES)
+    candidates = [match.group(1) for match in _CODE_FENCE_RE.finditer(normalized)]
+    candidates.append(normalized)
+    decoder = JSONDecoder()
+    last_error: Exception = ValueError("No JSON object found in outline response.")
+    for candidate in candidates:
+        repaired = _TRAILING_COMMA_RE.sub(r"\1", candidate)
+        start = repaired.find("{")
+        while start != -1:
+            try:
+                data, _ = decoder.raw_decode(repaired, start)
+                return _coerce_outline(data)
+            except (JSONDecodeError, ValueError, TypeError) as exception:
+                last_error = exception
+            start = repaired.find("{", start + 1)
+    raise last_error
+
+
+def _coerce_outline(data: object) -> Outline:
+    if isinstance(data, dict) and isinstance(data.get("outline"), dict):
+        data = data["outline"]
+    if not isinstance(data, dict):
+        raise ValueError("Outline JSON must be an object.")
+    title = data.get("report_title") or data.get("title")
+    raw_sections = data.get("sections")
+    if not isinstance(title, str) or not title.strip() or not isinstance(raw_sections, list):
+        raise ValueError("Outline JSON needs a report_title and a sections list.")
+    sections = []
+    for entry in raw_sections:
+        if isinstance(entry, str):
+            sections.append({"title": entry, "subsections": []})
+            continue
+        if not isinstance(entry, dict) or not isinstance(entry.get("title"), str):
+            raise ValueError("Each outline section needs a title.")
+        subsections = []
+        for sub in entry.get("subsections") or []:
+            sub_title = sub.get("title") if isinstance(sub, dict) else sub
+            if isinstance(sub_title, str) and sub_title.strip():
+                subsections.append(sub_title)
+        sections.append({"title": entry["title"], "subsections": subsections})
+    if not sections:
+        raise ValueError("Outline JSON contains no sections.")
+    return Outline.model_validate({"report_title": title, "sections": sections})
+
+
+_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_MD_BULLET_RE = re.compile(r"^[-*+\u2022]\s+(.*)$")
+_MD_KEYWORD_RE = re.compile(
+    r"^(?:section|part|chapter)\s+(\d+|[ivxlc]+)\b\s*[:.)\-\u2013\u2014]?\s*(.*)$", re.IGNORECASE
+)
+_MD_NUMBER_RE = re.compile(r"^(\d+(?:\.\d+)*)(?:\.(?!\d)|[):]|\s*[-\u2013\u2014])\s*(.+)$")
+_MD_DOTTED_NUMBER_RE = re.compile(r"^(\d+(?:\.\d+)+)\s+(.+)$")
+_MD_ROMAN_RE = re.compile(r"^([IVXLC]+)[.)]\s+(.+)$")
+_MD_LETTER_RE = re.compile(r"^([a-zA-Z])[.)]\s+(.+)$")
+_MD_TITLE_RE = re.compile(r"^(?:report\s+)?title\s*:\s*(.+)$", re.IGNORECASE)
+_MD_EMPHASIS_RE = re.compile(r"(\*\*|__|\*|_|`)(.+?)\1")
+
+
+@dataclass
+class _MarkdownItem:
+    indent: int
+    heading: Optional[int]
+    depth: int  # 0 for bullets/plain text, 1 for "1."/"I."/"Section 1", 2 for "1.1"/"a."
+    listed: bool
+    keyword: bool
+    text: str
+
+    def signature(self) -> Tuple:
+        if self.heading is not None:
+            return ("heading", self.heading)
+        return ("list", self.indent, self.depth)
+
+
+def parse_outline_markdown(text: str, default_title: Optional[str] = None) -> Outline:
+    """Parse a Markdown outline into an ``Outline`` without calling a model.
+
+    Understands ``#`` headings, numbered (``1.``, ``1.1``, ``I.``, ``a)``) and
+    bulleted lists, and "Section N: ..." lines. The report title is a lone
+    top-level heading, a ``Title:`` line, or the first unmarked line before
+    the first section, falling back to ``default_title``. Sections are the
+    shallowest section-like tier; within each section the first deeper tier
+    becomes its subsections and anything nested further is ignored. Numbering
+    is stripped because the pipeline renumbers titles itself.
+    """
+
+    items = _markdown_items(text)
+    title: Optional[str] = None
+    explicit = [item for item in items if _MD_TITLE_RE.match(item.text) and not item.listed]
+    if explicit:
+        title = _MD_TITLE_RE.match(explicit[0].text).group(1).strip()
+        items = [item for item in items if item is not explicit[0]]
+
+    headings = [item.heading for item in items if item.heading is not None]
+    if title is None and headings:
+        first = next(item for item in items if item.heading is not None)
+        rest = [item for item in items if item is not first]
+        if (
+            first.heading == min(headings)
+            and headings.count(first.heading) == 1
+            and not first.keyword
+            and any(item.heading is not None or item.listed for item in rest)
+        ):
+            title = first.text
+            items = rest
+
+    is_section = _section_predicate(items)
+    sections: List[Section] = []
+    sub_signature: Optional[Tuple] = None
+    for item in items:
+        if is_section(item):
+            sections.append(Section(title=item.text, subsections=[]))
+            sub_signature = None
+            continue
+        if not sections:
+            if title is None and item.heading is None and not item.listed:
+                title = item.text
+            continue
+        if item.heading is None and not item.listed:
+            continue  # prose under a section
+        if sub_signature is None:
+            sub_signature = item.signature()
+        if item.signature() == sub_signature:
+            sections[-1].subsections.append(item.text)
+
+    if not sections:
+        raise ValueError("No sections found in the Markdown outline.")
+    title = title or (default_title or "").strip()
+    if not title:
+        raise ValueError("Markdown outline has no title; add a top-level heading or a 'Title:' line.")
+    return Outline(report_title=title, sections=sections)
+
+
+def _section_predicate(items: List[_MarkdownItem]):
+    if any(item.keyword for item in items):
+        return lambda item: item.keyword
+    headings = [item.heading for item in items if item.heading is not None]
+    if headings:
+        level = min(headings)
+        return lambda item: item.heading == level
+    numbered = [item for item in items if item.listed and item.depth == 1]
+    candidates = numbered or [item for item in items if item.listed]
+    if not candidates:
+        return lambda item: False
+    indent = min(item.indent for item in candidates)
+    depth = candidates[0].depth
+    return lambda item: (
+        item.listed and item.heading is None and item.indent == indent and item.depth == depth
+    )
+
+
+def _markdown_items(text: str) -> List[_MarkdownItem]:
+    items: List[_MarkdownItem] = []
+    for raw_line in text.expandtabs(4).splitlines():
+        stripped = raw_line.strip()
+        if not stripped or stripped.startswith("```") or set(stripped) <= {"-", "=", "*", "_"}:
+            continue
+        indent = len(raw_line) - len(raw_line.lstrip())
+        heading: Optional[int] = None
+        listed = False
+        match = _MD_HEADING_RE.match(stripped)
+        if match:
+            heading = len(match.group(1))
+            stripped = match.group(2)
+        else:
+            match = _MD_BULLET_RE.match(stripped)
+            if match:
+                listed = True
+                stripped = match.group(1)
+        stripped = _strip_emphasis(stripped)
+        depth, keyword, stripped, numbered = _strip_numbering(stripped)
+        listed = listed or (numbered and heading is None)
+        if not stripped:
+            continue
+        items.append(
+            _MarkdownItem(
+                indent=indent,
+                heading=heading,
+                depth=depth,
+                listed=listed,
+                keyword=keyword,
+                text=stripped,
+            )
+        )
+    return items
+
+
+def _strip_numbering(text: str) -> Tuple[int, bool, str, bool]:
+    """Return (depth, is_section_keyword, text_without_numbering, was_numbered)."""
+
+    match = _MD_KEYWORD_RE.match(text)
+    if match:
+        rest = match.group(2).strip()
+        return 1, True, rest or text.strip().rstrip(":"), True
+    match = _MD_NUMBER_RE.match(text) or _MD_DOTTED_NUMBER_RE.match(text)
+    if match:
+        return match.group(1).count(".") + 1, False, match.group(2).strip(), True
+    match = _MD_ROMAN_RE.match(text)
+    if match:
+        return 1, False, match.group(2).strip(), True
+    match = _MD_LETTER_RE.match(text)
+    if match:
+        return 2, False, match.group(2).strip(), True
+    return 0, False, text.strip(), False
+
+
+def _strip_emphasis(text: str) -> str:
+    cleaned = _MD_EMPHASIS_RE.sub(r"\2", text.strip())
+    return cleaned.strip().rstrip(":").strip()
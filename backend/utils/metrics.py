@@ -0,0 +1,417 @@
+"""Prometheus-style metrics registry with optional multi-process aggregation.
+
+Metrics live in process memory and are rendered in the Prometheus text
+exposition format by ``GET /metrics``. When several uvicorn workers serve the
+API, point ``EXPLORER_METRICS_MULTIPROC_DIR`` (or ``PROMETHEUS_MULTIPROC_DIR``)
+at a shared directory: each process then snapshots its samples to
+``metrics-<pid>.json`` at most once per ``flush_interval`` (updates inside
+the window are written when it ends, and at exit) and the rendering worker
+merges every snapshot. Counters and histograms are summed across
+processes; gauges are summed over processes that are still alive.
+
+The module only depends on the standard library so any layer can import it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+_MULTIPROC_DIR_ENVS = ("EXPLORER_METRICS_MULTIPROC_DIR", "PROMETHEUS_MULTIPROC_DIR")
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, registry: "MetricsRegistry", name: str, documentation: str, labelnames: Sequence[str]):
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _label_values(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}")
+        return tuple("" if labels[name] is None else str(labels[name]) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._label_values(labels)
+        with self._registry._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self._registry._maybe_flush()
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {json.dumps(key): value for key, value in self._values.items()}
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._registry._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self._registry._maybe_flush()
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._registry._lock:
+            self._values[key] = float(value)
+        self._registry._maybe_flush()
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {json.dumps(key): value for key, value in self._values.items()}
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+        # Per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._registry._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += 1
+            state[-1] += value
+        self._registry._maybe_flush()
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> float:
+        state = self._values.get(self._label_values(labels))
+        return state[-2] if state else 0.0
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {json.dumps(key): list(state) for key, state in self._values.items()}
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in Prometheus text format."""
+
+    def __init__(self, *, multiprocess_dir: Optional[Path | str] = None, flush_interval: float = 1.0) -> None:
+        self._lock = threading.RLock()
+        self._metrics: Dict[str, _Metric] = {}
+        self._multiprocess_dir = Path(multiprocess_dir) if multiprocess_dir else None
+        self._flush_interval = flush_interval
+        self._last_flush = 0.0
+        self._deferred_flush: Optional[threading.Timer] = None
+        if self._multiprocess_dir is not None:
+            self._multiprocess_dir.mkdir(parents=True, exist_ok=True)
+            atexit.register(self._flush_quietly)
+
+    @classmethod
+    def from_env(cls) -> "MetricsRegistry":
+        for env_name in _MULTIPROC_DIR_ENVS:
+            directory = os.environ.get(env_name)
+            if directory:
+                return cls(multiprocess_dir=directory)
+        return cls()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets=buckets))
+
+    def render(self) -> str:
+        """Return all metric families in the Prometheus text exposition format."""
+
+        snapshots = [self._snapshot()]
+        if self._multiprocess_dir is not None:
+            self.flush()
+            snapshots = self._read_process_snapshots()
+        lines: List[str] = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            merged = _merge_samples(metric, [snapshot.get(name, {}) for snapshot in snapshots])
+            for label_values, value in sorted(merged.items()):
+                labels = dict(zip(metric.labelnames, json.loads(label_values)))
+                if isinstance(metric, Histogram):
+                    lines.extend(_render_histogram(name, labels, metric.buckets, value))
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        """Write this process's snapshot to the multi-process directory."""
+
+        if self._multiprocess_dir is None:
+            return
+        payload = json.dumps({"pid": os.getpid(), "metrics": self._snapshot()})
+        target = self._multiprocess_dir / f"metrics-{os.getpid()}.json"
+        temp = target.with_suffix(f".tmp-{threading.get_ident()}")
+        temp.write_text(payload, encoding="utf-8")
+        os.replace(temp, target)
+        self._last_flush = time.monotonic()
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different shape.")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def _snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: metric._snapshot() for name, metric in self._metrics.items()}
+
+    def _maybe_flush(self) -> None:
+        if self._multiprocess_dir is None:
+            return
+        remaining = self._flush_interval - (time.monotonic() - self._last_flush)
+        if remaining <= 0:
+            self._flush_quietly()
+            return
+        # Throttled: write once the window ends so the last update of a burst
+        # (e.g. a gauge going back down) does not stay stale until the next one.
+        with self._lock:
+            if self._deferred_flush is None:
+                self._deferred_flush = threading.Timer(remaining, self._run_deferred_flush)
+                self._deferred_flush.daemon = True
+                self._deferred_flush.start()
+
+    def _run_deferred_flush(self) -> None:
+        with self._lock:
+            self._deferred_flush = None
+        self._flush_quietly()
+
+    def _flush_quietly(self) -> None:
+        try:
+            self.flush()
+        except OSError:  # pragma: no cover - metrics must never break requests
+            pass
+
+    def _read_process_snapshots(self) -> List[Dict[str, Dict[str, Any]]]:
+        snapshots: List[Dict[str, Dict[str, Any]]] = []
+        for path in sorted(self._multiprocess_dir.glob("metrics-*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            metrics = payload.get("metrics", {})
+            if not _pid_alive(payload.get("pid")):
+                # Gauges describe live state; drop them for workers that exited.
+                metrics = {
+                    name: samples
+                    for name, samples in metrics.items()
+                    if not isinstance(self._metrics.get(name), Gauge)
+                }
+            snapshots.append(metrics)
+        return snapshots
+
+
+def _merge_samples(metric: _Metric, snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    for samples in snapshots:
+        for label_values, value in samples.items():
+            if isinstance(metric, Histogram):
+                if len(value) != len(metric.buckets) + 2:
+                    continue
+                current = merged.setdefault(label_values, [0.0] * len(value))
+                for index, item in enumerate(value):
+                    current[index] += item
+            else:
+                merged[label_values] = merged.get(label_values, 0.0) + value
+    return merged
+
+
+def _render_histogram(name: str, labels: Dict[str, str], buckets: Sequence[float], state: List[float]) -> List[str]:
+    lines = []
+    for bound, count in zip(buckets, state):
+        lines.append(f"{name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {_format_value(count)}")
+    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {_format_value(state[-2])}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(state[-1])}")
+    lines.append(f"{name}_count{_format_labels(labels)} {_format_value(state[-2])}")
+    return lines
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+    return "{" + rendered + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _pid_alive(pid: Any) -> bool:
+    if not isinstance(pid, int):
+        return False
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # pragma: no cover - process exists under another user
+        return True
+    return True
+
+
+REGISTRY = MetricsRegistry.from_env()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "explorer_stage_duration_seconds",
+    "Latency of report pipeline stages (outline, write, edit, persist).",
+    ("stage", "model"),
+)
+LLM_CALLS = REGISTRY.counter(
+    "explorer_llm_calls_total",
+    "Completed LLM calls by model and API flavour.",
+    ("model", "api"),
+)
+LLM_ERRORS = REGISTRY.counter(
+    "explorer_llm_errors_total",
+    "Failed LLM calls by model and API flavour.",
+    ("model", "api"),
+)
+LLM_TOKENS = REGISTRY.counter(
+    "explorer_llm_tokens_total",
+    "Tokens reported by the provider, split into prompt and completion.",
+    ("model", "kind"),
+)
+GENERATIONS_ACTIVE = REGISTRY.gauge(
+    "explorer_generations_active",
+    "Report generations currently streaming.",
+)
+GENERATIONS_QUEUED = REGISTRY.gauge(
+    "explorer_generations_queued",
+    "Report generations accepted but not yet streaming.",
+)
+DB_SESSION_DURATION = REGISTRY.histogram(
+    "explorer_db_session_duration_seconds",
+    "Wall time of session_scope and async_session_scope transactions by outcome.",
+    ("outcome",),
+)
+DB_COMMIT_BATCH_SIZE = REGISTRY.histogram(
+    "explorer_db_commit_batch_size",
+    "Write operations group-committed per transaction by the database writer.",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+STREAM_BYTES = REGISTRY.counter(
+    "explorer_stream_bytes_sent_total",
+    "Bytes of NDJSON events handed to the HTTP layer.",
+    ("endpoint",),
+)
+RESPONSE_COMPRESSION_BYTES = REGISTRY.counter(
+    "explorer_response_compression_bytes_total",
+    "Compressed response bytes before (raw) and after (encoded) compression, by encoding.",
+    ("encoding", "side"),
+)
+OUTLINE_CACHE_LOOKUPS = REGISTRY.counter(
+    "explorer_outline_cache_lookups_total",
+    "Outline cache lookups by result (hit, miss, joined an in-flight request).",
+    ("result",),
+)
+OUTLINE_PREFETCHES = REGISTRY.counter(
+    "explorer_outline_prefetch_total",
+    "Speculative outline prefetches by outcome.",
+    ("outcome",),
+)
+OUTLINE_PARSE_RETRIES = REGISTRY.counter(
+    "explorer_outline_parse_retries_total",
+    "Outline responses that failed strict parsing, by repair strategy and outcome.",
+    ("strategy", "outcome"),
+)
+LLM_CALLS_IN_FLIGHT = REGISTRY.gauge(
+    "explorer_llm_calls_in_flight",
+    "Async LLM calls currently holding a slot in the shared concurrency limiter.",
+)
+LLM_CALLS_WAITING = REGISTRY.gauge(
+    "explorer_llm_calls_waiting",
+    "Async LLM calls waiting for a slot in the shared concurrency limiter.",
+)
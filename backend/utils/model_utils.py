@@ -1,8 +1,13 @@
+import os
 from typing import Any, Dict, Optional
 
 from backend.schemas import ModelSpec
 
 _REASONING_MODEL_PREFIXES = ("gpt-5", "o3", "o4")
+_STRUCTURED_OUTPUT_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+# Early snapshots that predate json_schema response formats.
+_STRUCTURED_OUTPUT_EXCLUDED = ("gpt-4o-2024-05-13", "o1-mini", "o1-preview")
+_STRUCTURED_OUTPUT_ENV = "EXPLORER_STRUCTURED_OUTPUTS"
 
 
 def supports_reasoning(model_name: Optional[str]) -> bool:
@@ -11,6 +16,21 @@ def supports_reasoning(model_name: Optional[str]) -> bool:
     return any(model_name.startswith(prefix) for prefix in _REASONING_MODEL_PREFIXES)
 
 
+def supports_structured_output(model_name: Optional[str]) -> bool:
+    """Whether ``model_name`` accepts ``json_schema`` response formats.
+
+    ``EXPLORER_STRUCTURED_OUTPUTS=0`` turns this off for OpenAI-compatible
+    backends that do not implement structured outputs.
+    """
+    if not model_name:
+        return False
+    if os.environ.get(_STRUCTURED_OUTPUT_ENV, "1").lower() in {"0", "false", "no", "off"}:
+        return False
+    if model_name.startswith(_STRUCTURED_OUTPUT_EXCLUDED):
+        return False
+    return model_name.startswith(_STRUCTURED_OUTPUT_MODEL_PREFIXES)
+
+
 def maybe_add_reasoning(payload: Dict[str, Any], key: str, model_spec: ModelSpec) -> None:
     if model_spec.reasoning_effort and supports_reasoning(model_spec.model):
         payload[key] = model_spec.reasoning_effort
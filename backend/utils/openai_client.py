@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import os
+import time
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 from openai import AsyncOpenAI, OpenAI
 
 from backend.schemas import ModelSpec
+from backend.utils.cassette import Cassette
+from backend.utils.concurrency import LLMLimiter, get_llm_limiter
+from backend.utils.metrics import LLM_CALLS, LLM_ERRORS, LLM_TOKENS
 from backend.utils.model_utils import supports_reasoning
+from backend.utils.tracing import NOOP_SPAN, get_tracer
 
 
 class OpenAITextClient:
@@ -17,47 +22,176 @@ class OpenAITextClient:
         self,
         sync_client: Optional[OpenAI] = None,
         async_client: Optional[AsyncOpenAI] = None,
+        *,
+        cassette: Optional[Cassette] = None,
+        limiter: Optional[LLMLimiter] = None,
     ) -> None:
+        self._cassette = cassette
+        self._limiter = limiter or get_llm_limiter()
+        if cassette is not None and cassette.replaying:
+            # Replays are served from the cassette and must work offline without an API key.
+            self._sync_client = sync_client
+            self._async_client = async_client
+            return
         self._sync_client = sync_client or self._make_sync_client()
         self._async_client = async_client or self._make_async_client()
 
+    @property
+    def cassette(self) -> Optional[Cassette]:
+        return self._cassette
+
     def call_text(
         self,
         model_spec: ModelSpec,
         system_prompt: str,
         user_prompt: str,
         style_hint: Optional[str] = None,
+        *,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        with _llm_span(model_spec, system_prompt, user_prompt, style_hint) as span:
+            return self._call_text(
+                model_spec, system_prompt, user_prompt, style_hint, response_format, span
+            )
+
+    async def call_text_async(
+        self,
+        model_spec: ModelSpec,
+        system_prompt: str,
+        user_prompt: str,
+        style_hint: Optional[str] = None,
+        *,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Send one text request.
+
+        ``response_format`` takes a Chat Completions ``json_schema`` format and
+        is translated for the Responses API fallback. Calls wait for a slot
+        in the shared ``LLMLimiter`` first.
+        """
+
+        async with self._limiter.acquire():
+            with _llm_span(model_spec, system_prompt, user_prompt, style_hint) as span:
+                return await self._call_text_async(
+                    model_spec, system_prompt, user_prompt, style_hint, response_format, span
+                )
+
+    def _call_text(
+        self,
+        model_spec: ModelSpec,
+        system_prompt: str,
+        user_prompt: str,
+        style_hint: Optional[str],
+        response_format: Optional[Dict[str, Any]],
+        span: Any,
     ) -> str:
+        if self._cassette is not None and self._cassette.replaying:
+            text = self._cassette.replay(
+                _cassette_request(model_spec, system_prompt, user_prompt, style_hint, response_format)
+            )
+            LLM_CALLS.inc(model=model_spec.model, api="cassette")
+            span.set_attributes(api="cassette", cache_hit=True, retry_count=0)
+            return text
+        started = time.perf_counter()
         try:
             response = self._sync_client.chat.completions.create(
-                **_build_chat_kwargs(model_spec, system_prompt, user_prompt, style_hint)
+                **_build_chat_kwargs(model_spec, system_prompt, user_prompt, style_hint, response_format)
             )
-            return _extract_chat_text(response)
+            text, api = _extract_chat_text(response), "chat"
         except Exception:
+            LLM_ERRORS.inc(model=model_spec.model, api="chat")
             # Fall back to Responses API for models that are not yet on Chat,
             # or when the Chat endpoint is unavailable.
-            response = self._sync_client.responses.create(
-                **_build_response_kwargs(model_spec, system_prompt, user_prompt, style_hint)
-            )
-            return response.output_text
+            try:
+                response = self._sync_client.responses.create(
+                    **_build_response_kwargs(
+                        model_spec, system_prompt, user_prompt, style_hint, response_format
+                    )
+                )
+            except Exception:
+                LLM_ERRORS.inc(model=model_spec.model, api="responses")
+                raise
+            text, api = response.output_text, "responses"
+        _record_call_metrics(model_spec.model, api, response, span)
+        self._maybe_record(
+            model_spec,
+            system_prompt,
+            user_prompt,
+            style_hint,
+            text,
+            started,
+            api,
+            response_format=response_format,
+        )
+        return text
 
-    async def call_text_async(
+    async def _call_text_async(
         self,
         model_spec: ModelSpec,
         system_prompt: str,
         user_prompt: str,
-        style_hint: Optional[str] = None,
+        style_hint: Optional[str],
+        response_format: Optional[Dict[str, Any]],
+        span: Any,
     ) -> str:
+        if self._cassette is not None and self._cassette.replaying:
+            text = await self._cassette.replay_async(
+                _cassette_request(model_spec, system_prompt, user_prompt, style_hint, response_format)
+            )
+            LLM_CALLS.inc(model=model_spec.model, api="cassette")
+            span.set_attributes(api="cassette", cache_hit=True, retry_count=0)
+            return text
+        started = time.perf_counter()
         try:
             response = await self._async_client.chat.completions.create(
-                **_build_chat_kwargs(model_spec, system_prompt, user_prompt, style_hint)
+                **_build_chat_kwargs(model_spec, system_prompt, user_prompt, style_hint, response_format)
             )
-            return _extract_chat_text(response)
+            text, api = _extract_chat_text(response), "chat"
         except Exception:
-            response = await self._async_client.responses.create(
-                **_build_response_kwargs(model_spec, system_prompt, user_prompt, style_hint)
-            )
-            return response.output_text
+            LLM_ERRORS.inc(model=model_spec.model, api="chat")
+            try:
+                response = await self._async_client.responses.create(
+                    **_build_response_kwargs(
+                        model_spec, system_prompt, user_prompt, style_hint, response_format
+                    )
+                )
+            except Exception:
+                LLM_ERRORS.inc(model=model_spec.model, api="responses")
+                raise
+            text, api = response.output_text, "responses"
+        _record_call_metrics(model_spec.model, api, response, span)
+        self._maybe_record(
+            model_spec,
+            system_prompt,
+            user_prompt,
+            style_hint,
+            text,
+            started,
+            api,
+            response_format=response_format,
+        )
+        return text
+
+    def _maybe_record(
+        self,
+        model_spec: ModelSpec,
+        system_prompt: str,
+        user_prompt: str,
+        style_hint: Optional[str],
+        text: str,
+        started: float,
+        api: str,
+        *,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        if self._cassette is None:
+            return
+        self._cassette.record(
+            _cassette_request(model_spec, system_prompt, user_prompt, style_hint, response_format),
+            text,
+            time.perf_counter() - started,
+            api,
+        )
 
     @staticmethod
     def _make_sync_client() -> OpenAI:
@@ -72,7 +206,7 @@ class OpenAITextClient:
 
 @lru_cache
 def _default_text_client() -> OpenAITextClient:
-    return OpenAITextClient()
+    return OpenAITextClient(cassette=Cassette.from_env())
 
 
 def get_default_text_client() -> OpenAITextClient:
@@ -80,29 +214,103 @@ def get_default_text_client() -> OpenAITextClient:
 
 
 def _build_chat_kwargs(
-    model_spec: ModelSpec, system_prompt: str, user_prompt: str, style_hint: Optional[str]
+    model_spec: ModelSpec,
+    system_prompt: str,
+    user_prompt: str,
+    style_hint: Optional[str],
+    response_format: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     kwargs: Dict[str, Any] = {
         "model": model_spec.model,
         "messages": _build_messages(system_prompt, user_prompt, style_hint),
     }
+    if response_format is not None:
+        kwargs["response_format"] = response_format
     if model_spec.reasoning_effort and supports_reasoning(model_spec.model):
         kwargs["reasoning"] = {"effort": model_spec.reasoning_effort}
     return kwargs
 
 
 def _build_response_kwargs(
-    model_spec: ModelSpec, system_prompt: str, user_prompt: str, style_hint: Optional[str]
+    model_spec: ModelSpec,
+    system_prompt: str,
+    user_prompt: str,
+    style_hint: Optional[str],
+    response_format: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     kwargs: Dict[str, Any] = {
         "model": model_spec.model,
         "input": _build_messages(system_prompt, user_prompt, style_hint),
     }
+    if response_format is not None:
+        # The Responses API flattens the Chat ``json_schema`` wrapper into ``text.format``.
+        if response_format.get("type") == "json_schema":
+            text_format = {"type": "json_schema", **response_format.get("json_schema", {})}
+        else:
+            text_format = dict(response_format)
+        kwargs["text"] = {"format": text_format}
     if model_spec.reasoning_effort and supports_reasoning(model_spec.model):
         kwargs["reasoning"] = {"effort": model_spec.reasoning_effort}
     return kwargs
 
 
+def _llm_span(
+    model_spec: ModelSpec, system_prompt: str, user_prompt: str, style_hint: Optional[str]
+) -> Any:
+    tracer = get_tracer()
+    if not tracer.enabled:
+        return NOOP_SPAN
+    prompt_bytes = sum(
+        len(part.encode("utf-8")) for part in (system_prompt, user_prompt, style_hint or "")
+    )
+    return tracer.span(
+        "llm.call",
+        model=model_spec.model,
+        reasoning_effort=model_spec.reasoning_effort,
+        prompt_bytes=prompt_bytes,
+    )
+
+
+def _record_call_metrics(model: str, api: str, response: Any, span: Any = NOOP_SPAN) -> None:
+    LLM_CALLS.inc(model=model, api=api)
+    span.set_attributes(api=api, cache_hit=False, retry_count=0 if api == "chat" else 1)
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    if prompt_tokens is None:
+        prompt_tokens = getattr(usage, "input_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if completion_tokens is None:
+        completion_tokens = getattr(usage, "output_tokens", None)
+    if isinstance(prompt_tokens, int):
+        LLM_TOKENS.inc(prompt_tokens, model=model, kind="prompt")
+        span.set_attribute("prompt_tokens", prompt_tokens)
+    if isinstance(completion_tokens, int):
+        LLM_TOKENS.inc(completion_tokens, model=model, kind="completion")
+        span.set_attribute("completion_tokens", completion_tokens)
+
+
+def _cassette_request(
+    model_spec: ModelSpec,
+    system_prompt: str,
+    user_prompt: str,
+    style_hint: Optional[str],
+    response_format: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    request = {
+        "model": model_spec.model,
+        "reasoning_effort": (
+            model_spec.reasoning_effort if supports_reasoning(model_spec.model) else None
+        ),
+        "messages": _build_messages(system_prompt, user_prompt, style_hint),
+    }
+    if response_format is not None:
+        # Only present when used, so cassettes recorded without it keep their keys.
+        request["response_format"] = response_format
+    return request
+
+
 def _build_messages(system_prompt: str, user_prompt: str, style_hint: Optional[str]) -> List[Dict[str, str]]:
     messages = []
     if style_hint:
@@ -0,0 +1,197 @@
+"""In-process sampling profiler for a single generation run.
+
+A helper thread snapshots the event-loop thread's Python stack every few
+milliseconds via ``sys._current_frames``. Samples are kept as folded stacks
+(``frame;frame;frame count``), which flamegraph.pl, speedscope and inferno
+read directly, and each sample is classified so a run's wall time can be split
+into "the loop was idle waiting on I/O" versus the Python work it was doing.
+
+The loop thread is shared by every in-flight request, so samples taken while
+other generations run are attributed to this profile as well; profile a run
+on a quiet worker for clean numbers.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import linecache
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+_DEFAULT_INTERVAL = 0.005
+_MAX_DEPTH = 128
+
+# (category, path fragments) checked from the innermost frame outwards.
+_CATEGORIES = (
+    ("pydantic", ("/pydantic/", "/pydantic_core/")),
+    ("regex_post_processing", ("/backend/utils/formatting.py", "/re/", "/sre_")),
+    ("db", ("/sqlalchemy/", "/sqlite3/")),
+    ("json", ("/json/",)),
+    ("http_client", ("/httpx/", "/httpcore/", "/openai/", "/h11/", "/anyio/")),
+    ("storage", ("/backend/storage/",)),
+)
+# Compiled loops (uvloop) wait for I/O in C: the innermost Python frame is
+# then the one that called into the loop, e.g. asyncio's ``Runner.run``.
+_LOOP_ENTRY_CALLS = ("run_until_complete(", "run_forever(")
+_IDLE_CATEGORY = "event_loop_idle"
+_OTHER_CATEGORY = "python_other"
+
+
+@dataclass
+class ProfileResult:
+    interval: float
+    wall_seconds: float
+    cpu_seconds: float
+    stacks: Counter = field(default_factory=Counter)
+    categories: Counter = field(default_factory=Counter)
+
+    @property
+    def samples(self) -> int:
+        return sum(self.categories.values())
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def breakdown(self) -> Dict[str, Any]:
+        """Share of samples per category, with the idle/busy split up front."""
+
+        total = self.samples or 1
+        idle = self.categories.get(_IDLE_CATEGORY, 0)
+        return {
+            "samples": self.samples,
+            "interval_ms": round(self.interval * 1000, 3),
+            "wall_ms": round(self.wall_seconds * 1000, 3),
+            "process_cpu_ms": round(self.cpu_seconds * 1000, 3),
+            "loop_idle_pct": round(100.0 * idle / total, 2),
+            "loop_busy_pct": round(100.0 * (total - idle) / total, 2),
+            "categories_pct": {
+                name: round(100.0 * count / total, 2)
+                for name, count in self.categories.most_common()
+            },
+            "top_stacks": [
+                {"stack": stack.split(";")[-3:], "samples": count}
+                for stack, count in self.stacks.most_common(10)
+            ],
+        }
+
+    def write(self, directory: Path, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Path]:
+        directory.mkdir(parents=True, exist_ok=True)
+        folded_path = directory / "profile.folded"
+        summary_path = directory / "profile.json"
+        folded_path.write_text(self.folded(), encoding="utf-8")
+        summary = {**self.breakdown(), **(extra or {})}
+        summary_path.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+        return {"folded": folded_path, "summary": summary_path}
+
+
+class SamplingProfiler:
+    """Sample one thread's stack (the caller's by default) until ``stop()``."""
+
+    def __init__(
+        self,
+        *,
+        thread_id: Optional[int] = None,
+        interval: float = _DEFAULT_INTERVAL,
+    ) -> None:
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stacks: Counter = Counter()
+        self._categories: Counter = Counter()
+        self._started_wall = 0.0
+        self._started_cpu = 0.0
+        self._result: Optional[ProfileResult] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._result is None
+
+    def start(self) -> "SamplingProfiler":
+        if self._thread is not None:
+            raise RuntimeError("Profiler already started.")
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._thread = threading.Thread(
+            target=self._run, name="explorer-profiler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> ProfileResult:
+        if self._result is not None:
+            return self._result
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._result = ProfileResult(
+            interval=self.interval,
+            wall_seconds=time.perf_counter() - self._started_wall,
+            cpu_seconds=time.process_time() - self._started_cpu,
+            stacks=self._stacks,
+            categories=self._categories,
+        )
+        return self._result
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self._record(frame)
+
+    def _record(self, frame: FrameType) -> None:
+        frames: List[FrameType] = []
+        current: Optional[FrameType] = frame
+        while current is not None and len(frames) < _MAX_DEPTH:
+            frames.append(current)
+            current = current.f_back
+        self._categories[_classify(frames)] += 1
+        self._stacks[
+            ";".join(
+                f"{_short_path(item.f_code.co_filename)}:{item.f_code.co_name}"
+                for item in reversed(frames)
+            )
+        ] += 1
+
+
+def _classify(frames: List[FrameType]) -> str:
+    """Classify a sample from its innermost frame outwards."""
+
+    leaf = frames[0].f_code
+    if leaf.co_name == "select" and leaf.co_filename.endswith("selectors.py"):
+        return _IDLE_CATEGORY
+    if _enters_loop(leaf.co_filename, frames[0].f_lineno):
+        return _IDLE_CATEGORY
+    for frame in frames:
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        for category, fragments in _CATEGORIES:
+            if any(fragment in filename for fragment in fragments):
+                return category
+    return _OTHER_CATEGORY
+
+
+@functools.lru_cache(maxsize=256)
+def _enters_loop(filename: str, lineno: Optional[int]) -> bool:
+    """Whether the line is a call into the event loop (nothing runs above it)."""
+
+    if lineno is None:
+        return False
+    line = linecache.getline(filename, lineno)
+    return any(call in line for call in _LOOP_ENTRY_CALLS)
+
+
+def _short_path(filename: str) -> str:
+    normalized = filename.replace("\\", "/")
+    for marker in ("/site-packages/", "/backend/", "/lib/python"):
+        index = normalized.rfind(marker)
+        if index != -1:
+            return normalized[index + 1 :]
+    return normalized.rsplit("/", 1)[-1]
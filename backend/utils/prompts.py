@@ -51,6 +51,28 @@ def build_outline_prompt_json(
 """
 
 
+def build_outline_repair_prompt(previous_response: str, parse_error: str) -> str:
+    excerpt = previous_response.strip()
+    if len(excerpt) > 4000:
+        excerpt = excerpt[:4000] + "\n…"
+    return f"""Your previous outline could not be parsed as JSON ({parse_error}).
+
+Previous response:
+{excerpt}
+
+Return the same outline as valid JSON only, with no code fences or commentary, using this schema:
+{{
+  "report_title": string,
+  "sections": [
+    {{
+      "title": string,
+      "subsections": string[]
+    }}
+  ]
+}}
+"""
+
+
 def build_outline_prompt_markdown(
     topic: str,
     sections: Optional[int] = None,
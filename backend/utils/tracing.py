@@ -0,0 +1,287 @@
+"""Lightweight span tracing for generation runs with a local JSONL exporter.
+
+Set ``EXPLORER_TRACE_FILE`` to a path and every finished span is appended to
+it as one JSON object (OpenTelemetry-style field names). Spans nest through a
+context variable, so ``OpenAITextClient`` calls made inside a section's write
+span become its children without any plumbing. ``to_chrome_trace`` converts a
+trace file for ``chrome://tracing`` or Perfetto.
+
+When no exporter is configured, ``Tracer.span`` hands back a shared no-op span
+so instrumentation costs one attribute check per call site.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
+
+_TRACE_FILE_ENV = "EXPLORER_TRACE_FILE"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "explorer_current_span", default=None
+)
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSONL file; safe to share across threads."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+class Span:
+    """A timed operation; use as a context manager to make it the current span."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "status",
+        "_start_ns",
+        "_start_perf",
+        "_tracer",
+        "_token",
+        "_ended",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.status = "ok"
+        self._start_ns = time.time_ns()
+        self._start_perf = time.perf_counter()
+        self._tracer = tracer
+        self._token: Optional[contextvars.Token] = None
+        self._ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.status = "error"
+        self.attributes["exception.type"] = type(exception).__name__
+        self.attributes["exception.message"] = str(exception)
+
+    def end(self) -> None:
+        if self._ended:
+            return
+        self._ended = True
+        duration_ns = int((time.perf_counter() - self._start_perf) * 1e9)
+        self._tracer._export(
+            {
+                "trace_id": self.trace_id,
+                "span_id": self.span_id,
+                "parent_span_id": self.parent_span_id,
+                "name": self.name,
+                "start_time_unix_nano": self._start_ns,
+                "end_time_unix_nano": self._start_ns + duration_ns,
+                "duration_ms": round(duration_ns / 1e6, 3),
+                "status": self.status,
+                "attributes": self.attributes,
+                "pid": os.getpid(),
+            }
+        )
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc is not None:
+            self.record_exception(exc)
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoopSpan:
+    __slots__ = ()
+    name = ""
+    attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        return None
+
+    def set_attributes(self, **attributes: Any) -> None:
+        return None
+
+    def record_exception(self, exception: BaseException) -> None:
+        return None
+
+    def end(self) -> None:
+        return None
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        return None
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _SpanActivation:
+    __slots__ = ("_span", "_token")
+
+    def __init__(self, span: Span) -> None:
+        self._span = span
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._token is not None:
+            _current_span.reset(self._token)
+
+
+class Tracer:
+    def __init__(self, exporter: Optional[JsonlSpanExporter] = None) -> None:
+        self._exporter = exporter
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        path = os.environ.get(_TRACE_FILE_ENV)
+        return cls(JsonlSpanExporter(path) if path else None)
+
+    @property
+    def enabled(self) -> bool:
+        return self._exporter is not None
+
+    def span(self, name: str, *, parent: Optional[Span] = None, **attributes: Any):
+        """Return a span that becomes current inside its ``with`` block."""
+
+        if self._exporter is None:
+            return NOOP_SPAN
+        if not isinstance(parent, Span):
+            parent = _current_span.get()
+        return Span(self, name, parent, attributes)
+
+    def start_span(self, name: str, *, parent: Optional[Span] = None, **attributes: Any):
+        """Start a span without making it current; the caller must ``end()`` it.
+
+        Use this for spans that stay open across ``yield`` points of an async
+        generator, where a context variable would leak into the consumer.
+        """
+
+        return self.span(name, parent=parent, **attributes)
+
+    def use_span(self, span: Any):
+        """Make ``span`` current for the ``with`` block without ending it."""
+
+        if not isinstance(span, Span):
+            return NOOP_SPAN
+        return _SpanActivation(span)
+
+    def _export(self, record: Dict[str, Any]) -> None:
+        if self._exporter is None:
+            return
+        try:
+            self._exporter.export(record)
+        except OSError:  # pragma: no cover - tracing must never break requests
+            pass
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = Tracer.from_env()
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install ``tracer`` process-wide; ``None`` re-reads the environment lazily."""
+
+    global _tracer
+    _tracer = tracer
+
+
+def current_span() -> Union[Span, _NoopSpan]:
+    """Return the active span, or the no-op span so callers can annotate blindly."""
+
+    span = _current_span.get()
+    return span if span is not None else NOOP_SPAN
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Wrap a synchronous function in a span named ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def read_spans(path: Path | str) -> List[Dict[str, Any]]:
+    with Path(path).open("r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def to_chrome_trace(spans: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert exported spans to the Chrome trace-event format (one track per trace)."""
+
+    events = []
+    tracks: Dict[str, int] = {}
+    for span in spans:
+        track = tracks.setdefault(span["trace_id"], len(tracks) + 1)
+        events.append(
+            {
+                "name": span["name"],
+                "cat": span["name"].split(".", 1)[0],
+                "ph": "X",
+                "ts": span["start_time_unix_nano"] / 1000,
+                "dur": (span["end_time_unix_nano"] - span["start_time_unix_nano"]) / 1000,
+                "pid": span.get("pid", 0),
+                "tid": track,
+                "args": {**span.get("attributes", {}), "status": span.get("status")},
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -0,0 +1,3 @@
+"""Benchmarks and load-test harnesses for Explorer (run with ``python -m benchmarks.<name>``)."""
+
+__all__ = []
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Compare peak RSS of in-memory and spooled report assembly.
+
+Each mode runs in a fresh interpreter that streams ``--concurrency`` reports
+at once through ``ReportGeneratorService`` with a local text client returning
+large section bodies (no network), against a temporary SQLite database and
+report directory. The child reports its peak RSS growth over the post-import
+baseline, and the parent prints both modes plus the per-run difference.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODES = ("memory", "spool")
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrss is KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _LargeSectionClient:
+    def __init__(self, section_kib: int) -> None:
+        paragraph = "Tidal turbines convert slow, dense flows into steady power. "
+        self._body = (paragraph * (section_kib * 1024 // len(paragraph) + 1))[: section_kib * 1024]
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        await asyncio.sleep(0)
+        # Fresh string per call, as a real response would be.
+        return "".join([self._body[:-1], self._body[-1]])
+
+
+def run_child(mode: str, concurrency: int, sections: int, section_kib: int, return_mode: str) -> Dict[str, object]:
+    from backend.db import Base, create_engine_from_url, create_session_factory
+    from backend.schemas import GenerateRequest, Outline, Section
+    from backend.services.report_service import ReportGeneratorService
+    from backend.storage import GeneratedReportStore
+
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine_from_url(f"sqlite+pysqlite:///{workdir}/bench.db")
+        Base.metadata.create_all(engine)
+        store = GeneratedReportStore(
+            base_dir=Path(workdir) / "reports",
+            session_factory=create_session_factory(engine),
+            spool_sections=mode == "spool",
+        )
+        service = ReportGeneratorService(
+            outline_service=object(),
+            text_client=_LargeSectionClient(section_kib),
+            report_store=store,
+        )
+        outline = Outline(
+            report_title="Memory benchmark",
+            sections=[Section(title=f"Section {index}", subsections=[]) for index in range(sections)],
+        )
+        request = GenerateRequest.model_validate({"outline": outline.model_dump(), "return": return_mode})
+
+        async def one_run() -> int:
+            received = 0
+            async for event in service.stream_report(request):
+                received += len(json.dumps(event))
+            return received
+
+        async def all_runs() -> List[int]:
+            return await asyncio.gather(*(one_run() for _ in range(concurrency)))
+
+        baseline = _peak_rss_bytes()
+        received = asyncio.run(all_runs())
+        peak = _peak_rss_bytes()
+    growth = max(peak - baseline, 0)
+    return {
+        "mode": mode,
+        "return": return_mode,
+        "concurrency": concurrency,
+        "report_mib": round(sections * section_kib / 1024, 2),
+        "peak_rss_mib": round(peak / (1024 * 1024), 1),
+        "rss_growth_mib": round(growth / (1024 * 1024), 1),
+        "rss_growth_per_run_mib": round(growth / concurrency / (1024 * 1024), 2),
+        "event_bytes_per_run": received[0] if received else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16, help="Reports generated at once (default: %(default)s).")
+    parser.add_argument("--sections", type=int, default=12, help="Sections per report (default: %(default)s).")
+    parser.add_argument("--section-kib", type=int, default=256, help="Body size per section in KiB (default: %(default)s).")
+    parser.add_argument(
+        "--return",
+        dest="return_mode",
+        choices=("report", "reference"),
+        default="reference",
+        help="Final payload mode for both runs (default: %(default)s).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.concurrency, args.sections, args.section_kib, args.return_mode)))
+        return
+
+    results = []
+    for mode in MODES:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.assembly_memory",
+                "--child",
+                mode,
+                "--concurrency",
+                str(args.concurrency),
+                "--sections",
+                str(args.sections),
+                "--section-kib",
+                str(args.section_kib),
+                "--return",
+                args.return_mode,
+            ],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['mode']:<7} return={row['return']:<9} runs={row['concurrency']:<3} report={row['report_mib']}MiB "
+            f"peak_rss={row['peak_rss_mib']}MiB growth={row['rss_growth_mib']}MiB "
+            f"({row['rss_growth_per_run_mib']}MiB/run)"
+        )
+    saved = results[0]["rss_growth_per_run_mib"] - results[1]["rss_growth_per_run_mib"]
+    print(f"spooling saves {saved:.2f}MiB peak RSS per concurrent run")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Concurrent report-store writes under three SQLite setups.
+
+``--threads`` workers (standing in for the storage thread pool of one API
+worker under load) each run ``--reports`` report lifecycles through
+``GeneratedReportStore``: ``prepare_report`` followed by ``finalize_report``
+with a small body. Each mode uses a fresh database file:
+
+- ``driver``: sqlite3 defaults (rollback journal, synchronous=FULL), one
+  transaction per write, as before the production profile;
+- ``wal``: the production profile (WAL, synchronous=NORMAL, busy_timeout),
+  one transaction per write;
+- ``wal+queue``: the production profile with writes group-committed by
+  ``CommitQueue``.
+
+Reports throughput, per-write latency percentiles, failed writes (e.g.
+"database is locked") and the number of write transactions committed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from backend.db import Base, CommitQueue, create_engine_from_url, create_session_factory
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.storage import GeneratedReportStore
+from benchmarks.load_test import percentile
+
+MODES = ("driver", "wal", "wal+queue")
+
+
+def run_mode(mode: str, threads: int, reports: int) -> Dict[str, object]:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine_from_url(
+            f"sqlite+pysqlite:///{workdir}/bench.db",
+            sqlite_profile="driver" if mode == "driver" else "production",
+        )
+        Base.metadata.create_all(engine)
+        session_factory = create_session_factory(engine)
+        commit_queue = CommitQueue(session_factory) if mode == "wal+queue" else None
+        store = GeneratedReportStore(
+            base_dir=Path(workdir) / "reports",
+            session_factory=session_factory,
+            spool_sections=False,
+            commit_queue=commit_queue,
+        )
+        outline = Outline(report_title="Write benchmark", sections=[Section(title="1: Intro", subsections=[])])
+        latencies: List[float] = []
+        errors: Dict[str, int] = {}
+        lock = threading.Lock()
+
+        def timed(func, *args) -> Optional[object]:
+            started = time.perf_counter()
+            try:
+                return func(*args)
+            except Exception as exception:
+                with lock:
+                    key = type(exception).__name__
+                    errors[key] = errors.get(key, 0) + 1
+                return None
+            finally:
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+
+        def worker(index: int) -> None:
+            for run in range(reports):
+                request = GenerateRequest.model_validate(
+                    {
+                        "topic": f"Topic {index}-{run}",
+                        "mode": "generate_report",
+                        "user_email": f"user{index % 8}@example.com",
+                        "username": f"user{index % 8}",
+                    }
+                )
+                handle = timed(store.prepare_report, request, outline)
+                if handle is not None:
+                    timed(store.finalize_report, handle, "Write benchmark\n\n1: Intro\n\nBody.", [])
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        wall = time.perf_counter() - started
+        if commit_queue is not None:
+            commit_queue.close()
+        engine.dispose()
+
+    writes = len(latencies)
+    return {
+        "mode": mode,
+        "threads": threads,
+        "writes": writes,
+        "failed": errors,
+        "transactions": commit_queue.batches if commit_queue is not None else writes,
+        "wall_seconds": round(wall, 3),
+        "writes_per_second": round(writes / wall, 1) if wall else None,
+        "write_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent writer threads (default: %(default)s).")
+    parser.add_argument("--reports", type=int, default=20, help="Report lifecycles per thread (default: %(default)s).")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Modes to run (default: all).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = [run_mode(mode, max(1, args.threads), max(1, args.reports)) for mode in args.modes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        failed = ",".join(f"{name}:{count}" for name, count in row["failed"].items()) or "0"
+        print(
+            f"{row['mode']:<10} threads={row['threads']} writes={row['writes']} failed={failed} "
+            f"transactions={row['transactions']} wall={row['wall_seconds']}s {row['writes_per_second']} writes/s "
+            f"p50={row['write_ms']['p50']}ms p95={row['write_ms']['p95']}ms max={row['write_ms']['max']}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
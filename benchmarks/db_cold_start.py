@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Measure database cold start: per-caller engines vs. the shared engine registry.
+
+Each sample runs in a fresh interpreter against a populated SQLite file and
+times what a worker does before serving its first request: build session
+factories for the API, the report store and the suggestion service.
+
+- ``per_caller``: the previous behaviour. Each caller builds its own engine
+  with ``create_engine_from_url`` (lightweight migrations under the file
+  lock, inspecting every table) plus ``create_all``, and the schema is
+  never stamped.
+- ``registry``: ``get_engine`` creates one engine per URL. Startup is a
+  single ``PRAGMA user_version`` check once the schema has been stamped.
+
+Imports are excluded from the timings.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODES = ("per_caller", "registry")
+CALLERS = 3
+
+
+def run_child(mode: str, database_path: str) -> Dict[str, float]:
+    from backend.db import Base, create_engine_from_url, create_session_factory, get_engine
+
+    url = f"sqlite:///{database_path}"
+    started = time.perf_counter()
+    engines = set()
+    for _ in range(CALLERS):
+        if mode == "per_caller":
+            engine = create_engine_from_url(url)
+            Base.metadata.create_all(engine)
+        else:
+            engine = get_engine(url)
+        create_session_factory(engine)
+        engines.add(id(engine))
+    return {"startup_ms": (time.perf_counter() - started) * 1000, "engines": len(engines)}
+
+
+def populate(database_path: Path, reports: int) -> None:
+    from backend.db import (
+        Report,
+        ReportStatus,
+        SavedTopic,
+        User,
+        create_session_factory,
+        dispose_engines,
+        get_engine,
+        session_scope,
+    )
+
+    session_factory = create_session_factory(get_engine(f"sqlite:///{database_path}"))
+    with session_scope(session_factory) as session:
+        user = User(email="bench@example.com", username="bench")
+        for index in range(reports):
+            topic = SavedTopic(slug=f"topic-{index}", title=f"Topic {index}", owner=user)
+            session.add(Report(saved_topic=topic, owner=user, status=ReportStatus.COMPLETE, sections={}))
+    dispose_engines()
+
+
+def sample(mode: str, database_path: Path) -> Dict[str, float]:
+    if mode == "per_caller":
+        # Previous releases never stamped the schema.
+        with sqlite3.connect(database_path) as connection:
+            connection.execute("PRAGMA user_version=0")
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.db_cold_start", "--child", mode, "--database", str(database_path)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=1000, help="Reports in the database (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=7, help="Fresh interpreters per mode (default: %(default)s).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args.child, args.database)))
+        return
+
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        database_path = Path(workdir) / "bench.db"
+        populate(database_path, args.reports)
+        for mode in MODES:
+            if mode == "registry":
+                sample(mode, database_path)  # first start after upgrade stamps the schema
+            samples = [sample(mode, database_path) for _ in range(max(1, args.repeat))]
+            results.append(
+                {
+                    "mode": mode,
+                    "callers": CALLERS,
+                    "engines": samples[0]["engines"],
+                    "startup_ms_median": round(statistics.median(s["startup_ms"] for s in samples), 2),
+                    "startup_ms_min": round(min(s["startup_ms"] for s in samples), 2),
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['mode']:<11} callers={row['callers']} engines={row['engines']} "
+            f"startup median={row['startup_ms_median']}ms min={row['startup_ms_min']}ms"
+        )
+    saved = results[0]["startup_ms_median"] - results[1]["startup_ms_median"]
+    print(f"registry saves {saved:.2f}ms of database startup per worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Micro-benchmark subsection heading normalization on multi-megabyte sections.
+
+Compares the previous two-list implementation of ``enforce_subsection_headings``
+with ``SubsectionHeadingNormalizer`` fed the whole text at once and fed
+streaming-sized deltas, and checks that all three produce identical output.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Sequence
+
+from backend.utils.formatting import (
+    _HASH_HEADING_PATTERN,
+    _NUMBERED_HEADING_PATTERN,
+    SubsectionHeadingNormalizer,
+    enforce_subsection_headings,
+)
+
+_PARAGRAPH = (
+    "Tidal streams carry predictable energy twice a day, and the turbines that harvest it "
+    "sit in water that is harsh on seals, bearings and blades alike."
+)
+
+
+def legacy_enforce(section_text: str, subsection_titles: List[str]) -> str:
+    """The pre-incremental implementation, kept here as the baseline."""
+
+    result = []
+    cursor = 0
+    for line in section_text.splitlines():
+        stripped = line.lstrip()
+        if cursor < len(subsection_titles):
+            if _HASH_HEADING_PATTERN.match(stripped) or _NUMBERED_HEADING_PATTERN.match(stripped):
+                result.append(f"{line[: len(line) - len(stripped)]}{subsection_titles[cursor]}")
+                cursor += 1
+                continue
+        result.append(line)
+    return "\n".join(result)
+
+
+def synthetic_section(target_bytes: int) -> str:
+    """CRLF text with a heading every 40 lines; most headings exceed the outline's subsections."""
+
+    lines: List[str] = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        if index % 40 == 0:
+            line = f"### {index // 40 + 1}. Draft heading"
+        elif index % 7 == 0:
+            line = ""
+        else:
+            line = _PARAGRAPH
+        lines.append(line)
+        size += len(line) + 1
+        index += 1
+    return "\r\n".join(lines) + "\n"
+
+
+def streamed(text: str, titles: List[str], chunk_size: int) -> str:
+    normalizer = SubsectionHeadingNormalizer(titles)
+    pieces = [normalizer.feed(text[start : start + chunk_size]) for start in range(0, len(text), chunk_size)]
+    pieces.append(normalizer.close())
+    return "".join(pieces)
+
+
+def measure(func: Callable[[], str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def run(sizes_mb: Sequence[float], subsections: int, chunk_size: int, repeat: int) -> List[Dict[str, object]]:
+    titles = [f"{index}: Subsection {index}" for index in range(1, subsections + 1)]
+    results: List[Dict[str, object]] = []
+    for size_mb in sizes_mb:
+        text = synthetic_section(int(size_mb * 1024 * 1024))
+        expected = legacy_enforce(text, titles)
+        if enforce_subsection_headings(text, titles) != expected or streamed(text, titles, chunk_size) != expected:
+            raise SystemExit(f"normalizer output differs from the baseline at {size_mb} MB")
+        variants = {
+            "legacy": lambda: legacy_enforce(text, titles),
+            "normalizer_full": lambda: enforce_subsection_headings(text, titles),
+            f"normalizer_stream_{chunk_size}": lambda: streamed(text, titles, chunk_size),
+        }
+        for name, func in variants.items():
+            median = measure(func, repeat)
+            results.append(
+                {
+                    "variant": name,
+                    "size_mb": size_mb,
+                    "median_ms": round(median * 1000, 2),
+                    "mb_per_second": round(size_mb / median, 1) if median else None,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes-mb",
+        type=float,
+        nargs="+",
+        default=[1.0, 4.0],
+        help="Synthetic section sizes in MiB (default: %(default)s).",
+    )
+    parser.add_argument("--subsections", type=int, default=5, help="Outline subsections (default: %(default)s).")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Characters per streamed delta (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (default: %(default)s).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = run(args.sizes_mb, args.subsections, max(1, args.chunk_size), max(1, args.repeat))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['variant']:<24} size={row['size_mb']:>5}MB median={row['median_ms']:>9.2f}ms "
+            f"{row['mb_per_second']:>7} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure cold import time of Explorer entry points and enforce a regression budget.
+
+Each target is imported in a fresh interpreter so results reflect what a batch
+script pays for every ``python -m cli.stream_report`` invocation. The script
+exits non-zero when the median import time exceeds the budget or when a target
+pulls in a module it should not need.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+import json
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    module: str
+    budget_seconds: float
+    forbidden_modules: Tuple[str, ...] = field(default_factory=tuple)
+
+
+DEFAULT_TARGETS: Tuple[ImportTarget, ...] = (
+    ImportTarget(
+        "cli.stream_report",
+        budget_seconds=0.35,
+        forbidden_modules=("sqlalchemy", "openai", "httpx", "fastapi"),
+    ),
+    ImportTarget(
+        "backend.schemas",
+        budget_seconds=0.3,
+        forbidden_modules=("sqlalchemy", "openai"),
+    ),
+    ImportTarget(
+        "backend",
+        budget_seconds=0.05,
+        forbidden_modules=("sqlalchemy", "openai", "pydantic"),
+    ),
+)
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """Import ``module`` in a fresh interpreter and return (seconds, loaded modules)."""
+
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    payload = json.loads(completed.stdout.strip().splitlines()[-1])
+    return payload["seconds"], payload["modules"]
+
+
+def loaded_forbidden_modules(loaded: Sequence[str], forbidden: Sequence[str]) -> List[str]:
+    return sorted(
+        name
+        for name in forbidden
+        if any(module == name or module.startswith(f"{name}.") for module in loaded)
+    )
+
+
+def run_targets(
+    targets: Sequence[ImportTarget], repeat: int, budget_scale: float
+) -> Tuple[List[Dict[str, object]], bool]:
+    results: List[Dict[str, object]] = []
+    ok = True
+    for target in targets:
+        samples: List[float] = []
+        loaded: List[str] = []
+        for _ in range(repeat):
+            seconds, loaded = measure_import(target.module)
+            samples.append(seconds)
+        median = statistics.median(samples)
+        budget = target.budget_seconds * budget_scale
+        leaked = loaded_forbidden_modules(loaded, target.forbidden_modules)
+        within_budget = median <= budget and not leaked
+        ok = ok and within_budget
+        results.append(
+            {
+                "module": target.module,
+                "median_seconds": round(median, 4),
+                "min_seconds": round(min(samples), 4),
+                "budget_seconds": round(budget, 4),
+                "forbidden_loaded": leaked,
+                "ok": within_budget,
+            }
+        )
+    return results, ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target (default: %(default)s).")
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget, e.g. 2.0 on slow CI hosts (default: %(default)s).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results, ok = run_targets(DEFAULT_TARGETS, max(1, args.repeat), args.budget_scale)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            marker = "ok  " if result["ok"] else "FAIL"
+            print(
+                f"{marker} {result['module']:<22} median={result['median_seconds']:.3f}s "
+                f"min={result['min_seconds']:.3f}s budget={result['budget_seconds']:.3f}s"
+                + (f" forbidden={','.join(result['forbidden_loaded'])}" if result["forbidden_loaded"] else "")
+            )
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
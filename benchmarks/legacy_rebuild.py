@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Rebuild a large synthetic legacy reports table inline vs. in batches.
+
+Builds a SQLite database with the current schema minus ``reports.timings``
+(so ``reports`` needs a rebuild) and ``--rows`` reports carrying
+``--payload-kib`` of section JSON each, then migrates a fresh copy of it in
+each mode with ``ensure_schema``. While the migration runs, a separate
+connection commits a tiny heartbeat write every few milliseconds (as the
+running API would); the longest heartbeat wait is how long the migration
+held the write lock at a stretch.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from backend.db import (
+    Base,
+    Report,
+    ReportStatus,
+    SavedTopic,
+    User,
+    create_engine_from_url,
+    create_session_factory,
+    session_scope,
+)
+from backend.db.schema_migrations import ensure_schema
+
+MODES = ("inline", "batched")
+
+
+def build_legacy_database(path: Path, rows: int, payload_kib: int) -> None:
+    engine = create_engine_from_url(f"sqlite:///{path}", migrate=False)
+    Base.metadata.create_all(engine)
+    body = "x" * (payload_kib * 1024)
+    with session_scope(create_session_factory(engine)) as session:
+        user = User(email="bench@example.com", username="bench")
+        topic = SavedTopic(slug="bench", title="Bench", owner=user)
+        session.add(
+            Report(
+                saved_topic=topic,
+                owner=user,
+                status=ReportStatus.COMPLETE,
+                sections={"written": [{"title": "Body", "body": body}]},
+            )
+        )
+    engine.dispose()
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("ALTER TABLE reports DROP COLUMN timings")
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(reports)") if row[1] != "id"]
+        column_list = ", ".join(columns)
+        # Clone the seeded report with fresh ids in the GUID column's
+        # dashed char(36) format.
+        new_id = (
+            "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-' || hex(randomblob(2)) || '-' "
+            "|| hex(randomblob(2)) || '-' || hex(randomblob(6)))"
+        )
+        connection.execute(
+            f"WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+            f"INSERT INTO reports (id, {column_list}) "
+            f"SELECT {new_id}, {column_list} FROM n, (SELECT * FROM reports LIMIT 1)",
+            (max(0, rows - 1),),
+        )
+        connection.execute("CREATE TABLE heartbeat (at REAL NOT NULL)")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def migrate(path: Path, mode: str, batch_rows: int, interval: float) -> Dict[str, object]:
+    waits: List[float] = []
+    stop = threading.Event()
+
+    def heartbeat() -> None:
+        connection = sqlite3.connect(path, timeout=600)
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                with connection:
+                    connection.execute("INSERT INTO heartbeat (at) VALUES (?)", (time.time(),))
+                waits.append(time.perf_counter() - started)
+                time.sleep(interval)
+        finally:
+            connection.close()
+
+    engine = create_engine_from_url(f"sqlite:///{path}", migrate=False)
+    thread = threading.Thread(target=heartbeat, daemon=True)
+    thread.start()
+    started = time.perf_counter()
+    ensure_schema(engine, mode=mode, batch_rows=batch_rows)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    thread.join()
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql("SELECT count(*) FROM reports").scalar()
+    engine.dispose()
+    return {
+        "mode": mode,
+        "rows": rows,
+        "migration_seconds": round(elapsed, 2),
+        "heartbeats": len(waits),
+        "max_write_wait_ms": round(max(waits, default=0.0) * 1000, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Legacy reports (default: %(default)s).")
+    parser.add_argument("--payload-kib", type=int, default=4, help="Section JSON per report (default: %(default)s).")
+    parser.add_argument("--batch-rows", type=int, default=5000, help="Rows per batch (default: %(default)s).")
+    parser.add_argument(
+        "--heartbeat-ms", type=float, default=5.0, help="Pause between heartbeat writes (default: %(default)s)."
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        template = Path(workdir) / "legacy.db"
+        build_legacy_database(template, args.rows, args.payload_kib)
+        size_mib = template.stat().st_size / (1024 * 1024)
+        for mode in MODES:
+            copy = Path(workdir) / f"{mode}.db"
+            shutil.copy(template, copy)
+            row = migrate(copy, mode, args.batch_rows, args.heartbeat_ms / 1000)
+            results.append({**row, "database_mib": round(size_mib, 1), "batch_rows": args.batch_rows})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['mode']:<8} rows={row['rows']} db={row['database_mib']}MiB "
+            f"migration={row['migration_seconds']}s heartbeats={row['heartbeats']} "
+            f"max_write_wait={row['max_write_wait_ms']}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Drive the real FastAPI app at N concurrent generations against the OpenAI stub.
+
+The stub server and the API each run in their own ``uvicorn`` subprocess so the
+API's RSS can be sampled in isolation; this process only acts as the client.
+Reports throughput, time-to-first-event, end-to-end latency percentiles and
+peak RSS of the API worker. This is the reference harness for performance
+changes in the generation pipeline:
+
+    python -m benchmarks.load_test --concurrency 16 --requests 64 --latency lognormal:-1.5,0.4
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import httpx
+
+from benchmarks.openai_stub import add_stub_arguments
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class RunResult:
+    ok: bool
+    final_status: str
+    time_to_first_event: Optional[float]
+    end_to_end: float
+    events: int
+    bytes_received: int
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; ``None`` for an empty sample."""
+
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct * len(ordered) / 100.0))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(results: Sequence[RunResult], wall_seconds: float, peak_rss_bytes: Optional[int]) -> Dict[str, object]:
+    completed = [result for result in results if result.ok]
+    latencies = [result.end_to_end for result in completed]
+    first_events = [result.time_to_first_event for result in results if result.time_to_first_event is not None]
+    statuses: Dict[str, int] = {}
+    for result in results:
+        statuses[result.final_status] = statuses.get(result.final_status, 0) + 1
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * 1000, 1)
+
+    return {
+        "requests": len(results),
+        "completed": len(completed),
+        "final_statuses": statuses,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(len(completed) / wall_seconds, 3) if wall_seconds > 0 else None,
+        "time_to_first_event_ms": {
+            "p50": ms(percentile(first_events, 50)),
+            "p95": ms(percentile(first_events, 95)),
+            "p99": ms(percentile(first_events, 99)),
+        },
+        "end_to_end_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+        },
+        "bytes_received": sum(result.bytes_received for result in results),
+        "api_peak_rss_mb": round(peak_rss_bytes / (1024 * 1024), 1) if peak_rss_bytes else None,
+    }
+
+
+async def run_one(client: httpx.AsyncClient, payload: Dict[str, object]) -> RunResult:
+    started = time.perf_counter()
+    first_event: Optional[float] = None
+    final_status = "no_events"
+    events = 0
+    received = 0
+    try:
+        async with client.stream("POST", "/generate_report", json=payload) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return RunResult(False, f"http_{response.status_code}", None, time.perf_counter() - started, 0, 0)
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                if first_event is None:
+                    first_event = time.perf_counter() - started
+                events += 1
+                received += len(line) + 1
+                try:
+                    final_status = json.loads(line).get("status", "unknown")
+                except json.JSONDecodeError:
+                    final_status = "invalid_json"
+    except httpx.HTTPError as exc:
+        final_status = f"transport_error:{type(exc).__name__}"
+    elapsed = time.perf_counter() - started
+    return RunResult(final_status == "complete", final_status, first_event, elapsed, events, received)
+
+
+async def drive(base_url: str, payloads: Sequence[Dict[str, object]], concurrency: int) -> List[RunResult]:
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=None, limits=limits) as client:
+
+        async def bounded(payload: Dict[str, object]) -> RunResult:
+            async with semaphore:
+                return await run_one(client, payload)
+
+        return await asyncio.gather(*(bounded(payload) for payload in payloads))
+
+
+def warm_up(base_url: str, payload: Dict[str, object]) -> RunResult:
+    """Run one generation so lazily built services are ready before timing starts."""
+
+    async def _run() -> RunResult:
+        async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+            return await run_one(client, payload)
+
+    return asyncio.run(_run())
+
+
+def build_payloads(count: int, sections: int) -> List[Dict[str, object]]:
+    return [
+        {
+            "topic": f"Load test topic {index}",
+            "mode": "generate_report",
+            "sections": sections,
+        }
+        for index in range(count)
+    ]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server for {url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+@contextmanager
+def _server(args: List[str], ready_url: str, env: Dict[str, str]) -> Iterator[subprocess.Popen]:
+    process = subprocess.Popen([sys.executable, *args], cwd=REPO_ROOT, env=env)
+    try:
+        _wait_until_ready(ready_url, process)
+        yield process
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:  # pragma: no cover - defensive
+            process.kill()
+
+
+class RssSampler:
+    """Poll ``/proc/<pid>/status`` for the peak resident set size of a process."""
+
+    def __init__(self, pid: int, interval: float = 0.05) -> None:
+        self._path = Path(f"/proc/{pid}/status")
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.peak_bytes: Optional[int] = None
+
+    def __enter__(self) -> "RssSampler":
+        if self._path.exists():
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                for line in self._path.read_text().splitlines():
+                    if line.startswith("VmHWM:") or line.startswith("VmRSS:"):
+                        value = int(line.split()[1]) * 1024
+                        self.peak_bytes = max(self.peak_bytes or 0, value)
+            except (OSError, ValueError):
+                return
+            self._stop.wait(self._interval)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test /generate_report against the OpenAI stub server.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent generations (default: %(default)s).")
+    parser.add_argument("--requests", type=int, default=None, help="Total generations (default: 4x concurrency).")
+    parser.add_argument("--sections", type=int, default=3, help="Sections per generated report (default: %(default)s).")
+    parser.add_argument("--no-storage", action="store_true", help="Run the API with EXPLORER_DISABLE_STORAGE=1.")
+    parser.add_argument("--api-url", default=None, help="Benchmark an already running API instead of spawning one.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    add_stub_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    total = args.requests or args.concurrency * 4
+    payloads = build_payloads(total, args.sections)
+
+    with tempfile.TemporaryDirectory(prefix="explorer-load-") as workdir:
+        stub_port = _free_port()
+        stub_args = [
+            "-m",
+            "benchmarks.openai_stub",
+            "--port",
+            str(stub_port),
+            "--latency",
+            args.latency,
+            "--tokens-per-second",
+            str(args.tokens_per_second),
+            "--completion-tokens",
+            str(args.completion_tokens),
+            "--error-rate",
+            str(args.error_rate),
+            "--rate-limit-rate",
+            str(args.rate_limit_rate),
+        ]
+        if args.seed is not None:
+            stub_args += ["--seed", str(args.seed)]
+        env = dict(os.environ)
+        with _server(stub_args, f"http://127.0.0.1:{stub_port}/_stats", env):
+            if args.api_url:
+                warm_up(args.api_url, build_payloads(1, args.sections)[0])
+                started = time.perf_counter()
+                results = asyncio.run(drive(args.api_url, payloads, args.concurrency))
+                summary = summarize(results, time.perf_counter() - started, None)
+            else:
+                api_port = _free_port()
+                api_env = dict(env)
+                api_env.update(
+                    {
+                        "OPENAI_API_KEY": "stub-key",
+                        "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+                        "EXPLORER_DATABASE_URL": f"sqlite:///{Path(workdir) / 'load.db'}",
+                        "EXPLORER_REPORT_STORAGE_DIR": str(Path(workdir) / "reports"),
+                    }
+                )
+                if args.no_storage:
+                    api_env["EXPLORER_DISABLE_STORAGE"] = "1"
+                api_args = [
+                    "-m",
+                    "uvicorn",
+                    "backend.api.app:app",
+                    "--port",
+                    str(api_port),
+                    "--log-level",
+                    "warning",
+                ]
+                with _server(api_args, f"http://127.0.0.1:{api_port}/_routes", api_env) as api_process:
+                    api_url = f"http://127.0.0.1:{api_port}"
+                    warm_up(api_url, build_payloads(1, args.sections)[0])
+                    with RssSampler(api_process.pid) as sampler:
+                        started = time.perf_counter()
+                        results = asyncio.run(drive(api_url, payloads, args.concurrency))
+                        wall = time.perf_counter() - started
+                    summary = summarize(results, wall, sampler.peak_bytes)
+            summary["stub"] = httpx.get(f"http://127.0.0.1:{stub_port}/_stats").json()
+
+    summary["concurrency"] = args.concurrency
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        print(f"{key:>24}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""OpenAI-compatible stand-in server for load tests without real API spend.
+
+Implements ``POST /v1/chat/completions`` and ``POST /v1/responses`` in both
+streaming (SSE) and non-streaming form. Responses are synthesized from the
+prompt so the real report pipeline can run end to end: outline prompts get a
+valid outline JSON, writer prompts get one heading per requested subsection,
+editor prompts echo the section body, and suggestion prompts get topic JSON.
+
+Latency is modelled as a time-to-first-token drawn from a configurable
+distribution plus ``completion_tokens / tokens_per_second`` of generation time.
+Server errors (500) and rate limits (429) can be injected at fixed rates.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_SECTIONS_RE = re.compile(r"Create exactly (\d+) main sections")
+_TOPIC_RE = re.compile(r'report on the topic of "(.*?)"')
+_SUBSECTIONS_MARKER = "Subsections to cover inside this section:"
+_EDIT_MARKER = "Section body to edit:"
+_FILLER_WORDS = (
+    "analysis",
+    "context",
+    "evidence",
+    "practice",
+    "systems",
+    "adoption",
+    "measured",
+    "outcomes",
+    "resilient",
+    "teams",
+    "signals",
+    "growth",
+)
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Time-to-first-token distribution parsed from ``kind:params`` specs.
+
+    Supported specs: ``fixed:0.2``, ``uniform:0.1,0.6``, ``normal:0.3,0.05``
+    and ``lognormal:mu,sigma`` (parameters of the underlying normal, seconds).
+    """
+
+    kind: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, _, raw_params = spec.partition(":")
+        kind = kind.strip().lower()
+        try:
+            params = tuple(float(value) for value in raw_params.split(",") if value.strip())
+        except ValueError as exc:
+            raise ValueError(f"Invalid latency parameters in {spec!r}") from exc
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+        if kind not in expected:
+            raise ValueError(f"Unknown latency distribution {kind!r}; expected one of {sorted(expected)}")
+        if len(params) != expected[kind]:
+            raise ValueError(f"{kind} latency expects {expected[kind]} parameter(s), got {len(params)}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        else:
+            value = rng.lognormvariate(*self.params)
+        return max(0.0, value)
+
+
+@dataclass
+class StubConfig:
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    tokens_per_second: float = 0.0
+    completion_tokens: int = 300
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    streamed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    completion_tokens: int = 0
+
+
+def create_stub_app(config: Optional[StubConfig] = None) -> FastAPI:
+    """Build the stub ASGI app; ``app.state.stats`` tracks served requests."""
+
+    config = config or StubConfig()
+    rng = random.Random(config.seed)
+    stats = StubStats()
+    app = FastAPI(title="OpenAI stub")
+    app.state.config = config
+    app.state.stats = stats
+
+    def maybe_inject_failure() -> Optional[JSONResponse]:
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            stats.rate_limited += 1
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": f"{config.retry_after_seconds:g}"},
+                content=_error_body("Rate limit reached (injected).", "rate_limit_exceeded"),
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            stats.errors += 1
+            return JSONResponse(
+                status_code=500,
+                content=_error_body("Internal server error (injected).", "server_error"),
+            )
+        return None
+
+    async def prepare(request: Request, prompt_key: str) -> Tuple[Dict[str, Any], str, List[str], Optional[JSONResponse]]:
+        body = await request.json()
+        stats.requests += 1
+        failure = maybe_inject_failure()
+        messages = body.get(prompt_key) or []
+        prompt_text = "\n".join(_message_text(message) for message in messages)
+        text = synthesize_response(prompt_text, config.completion_tokens)
+        chunks = _chunk_text(text)
+        if failure is None:
+            await asyncio.sleep(config.latency.sample(rng))
+        return body, prompt_text, chunks, failure
+
+    async def paced(chunks: List[str]) -> AsyncIterator[str]:
+        delay = 1.0 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        for chunk in chunks:
+            if delay:
+                await asyncio.sleep(delay)
+            stats.completion_tokens += 1
+            yield chunk
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body, prompt_text, chunks, failure = await prepare(request, "messages")
+        if failure is not None:
+            return failure
+        model = body.get("model", "stub-model")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        usage = _usage(prompt_text, chunks, "chat")
+        if body.get("stream"):
+            stats.streamed += 1
+
+            async def events() -> AsyncIterator[str]:
+                async for chunk in paced(chunks):
+                    yield _sse(
+                        {
+                            "id": completion_id,
+                            "object": "chat.completion.chunk",
+                            "created": created,
+                            "model": model,
+                            "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}],
+                        }
+                    )
+                yield _sse(
+                    {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                        "usage": usage,
+                    }
+                )
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        text = "".join([chunk async for chunk in paced(chunks)])
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    @app.post("/v1/responses")
+    async def responses(request: Request):
+        body, prompt_text, chunks, failure = await prepare(request, "input")
+        if failure is not None:
+            return failure
+        model = body.get("model", "stub-model")
+        response_id = f"resp_{uuid.uuid4().hex}"
+        message_id = f"msg_{uuid.uuid4().hex}"
+        created = int(time.time())
+        usage = _usage(prompt_text, chunks, "responses")
+
+        def response_object(text: str, status: str) -> Dict[str, Any]:
+            content = [{"type": "output_text", "text": text, "annotations": []}] if text else []
+            return {
+                "id": response_id,
+                "object": "response",
+                "created_at": created,
+                "model": model,
+                "status": status,
+                "output": [
+                    {
+                        "type": "message",
+                        "id": message_id,
+                        "role": "assistant",
+                        "status": status,
+                        "content": content,
+                    }
+                ]
+                if text
+                else [],
+                "parallel_tool_calls": False,
+                "tool_choice": "auto",
+                "tools": [],
+                "usage": usage if status == "completed" else None,
+            }
+
+        if body.get("stream"):
+            stats.streamed += 1
+
+            async def events() -> AsyncIterator[str]:
+                sequence = 0
+                yield _sse(
+                    {"type": "response.created", "sequence_number": sequence, "response": response_object("", "in_progress")},
+                    event="response.created",
+                )
+                parts: List[str] = []
+                async for chunk in paced(chunks):
+                    sequence += 1
+                    parts.append(chunk)
+                    yield _sse(
+                        {
+                            "type": "response.output_text.delta",
+                            "sequence_number": sequence,
+                            "item_id": message_id,
+                            "output_index": 0,
+                            "content_index": 0,
+                            "delta": chunk,
+                            "logprobs": [],
+                        },
+                        event="response.output_text.delta",
+                    )
+                sequence += 1
+                yield _sse(
+                    {
+                        "type": "response.completed",
+                        "sequence_number": sequence,
+                        "response": response_object("".join(parts), "completed"),
+                    },
+                    event="response.completed",
+                )
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        text = "".join([chunk async for chunk in paced(chunks)])
+        return response_object(text, "completed")
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": "stub-model", "object": "model", "created": 0, "owned_by": "stub"}]}
+
+    @app.get("/_stats")
+    async def read_stats():
+        return stats.__dict__
+
+    return app
+
+
+def synthesize_response(prompt: str, completion_tokens: int) -> str:
+    """Return a plausible completion for the pipeline prompt in ``prompt``."""
+
+    if "Return valid JSON only" in prompt:
+        return _outline_json(prompt)
+    if _EDIT_MARKER in prompt:
+        return prompt.split(_EDIT_MARKER, 1)[1].strip()
+    if _SUBSECTIONS_MARKER in prompt:
+        return _section_body(prompt, completion_tokens)
+    if '"suggestions"' in prompt:
+        return json.dumps({"suggestions": [{"title": f"Stub Topic {index}"} for index in range(1, 9)]})
+    return _filler(completion_tokens)
+
+
+def _outline_json(prompt: str) -> str:
+    sections_match = _SECTIONS_RE.search(prompt)
+    topic_match = _TOPIC_RE.search(prompt)
+    section_count = int(sections_match.group(1)) if sections_match else 3
+    topic = topic_match.group(1) if topic_match else "Stub Report"
+    outline = {
+        "report_title": f"{topic} Report",
+        "sections": [
+            {
+                "title": f"Section {index}: Aspect {index} of {topic}",
+                "subsections": [f"{index}.{sub}: Detail {sub}" for sub in (1, 2)],
+            }
+            for index in range(1, section_count + 1)
+        ],
+    }
+    return json.dumps(outline)
+
+
+def _section_body(prompt: str, completion_tokens: int) -> str:
+    block = prompt.split(_SUBSECTIONS_MARKER, 1)[1].split("Instructions:", 1)[0]
+    labels = [line.strip() for line in block.splitlines() if line.strip() and line.strip() != "(none)"]
+    if not labels:
+        return _filler(completion_tokens)
+    per_label = max(1, completion_tokens // len(labels))
+    return "\n".join(f"{label}\n{_filler(per_label)}" for label in labels)
+
+
+def _filler(words: int) -> str:
+    return " ".join(_FILLER_WORDS[index % len(_FILLER_WORDS)] for index in range(max(1, words))) + "."
+
+
+def _chunk_text(text: str) -> List[str]:
+    # Roughly one "token" per whitespace-delimited word, keeping separators intact.
+    return re.findall(r"\S+\s*|\s+", text) or [""]
+
+
+def _usage(prompt: str, chunks: List[str], api: str) -> Dict[str, int]:
+    prompt_tokens = max(1, math.ceil(len(prompt) / 4))
+    completion_tokens = len(chunks)
+    if api == "responses":
+        return {
+            "input_tokens": prompt_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": completion_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+
+def _message_text(message: Any) -> str:
+    if not isinstance(message, dict):
+        return str(message)
+    content = message.get("content")
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content or ""
+
+
+def _error_body(message: str, code: str) -> Dict[str, Any]:
+    return {"error": {"message": message, "type": code, "param": None, "code": code}}
+
+
+def _sse(payload: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(payload)}\n\n"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run an OpenAI-compatible stub server for load tests.")
+    add_stub_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: %(default)s).")
+    parser.add_argument("--port", type=int, default=8100, help="Bind port (default: %(default)s).")
+    return parser.parse_args(argv)
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--latency",
+        default="fixed:0.05",
+        help="Time-to-first-token distribution: fixed:S, uniform:A,B, normal:MU,SIGMA or lognormal:MU,SIGMA (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=0.0,
+        help="Generation rate per request; 0 returns all tokens immediately (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--completion-tokens",
+        type=int,
+        default=300,
+        help="Approximate tokens per writer completion (default: %(default)s).",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 500.")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests failing with 429.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and failure sampling.")
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency=LatencyDistribution.parse(args.latency),
+        tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import uvicorn
+
+    args = parse_args(argv)
+    app = create_stub_app(config_from_args(args))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Benchmark the local Markdown outline parser on large synthetic outlines.
+
+Generates outlines in each supported style (headings, numbered lists,
+"Section N:" lines) with the requested number of sections and subsections,
+parses every one ``--repeat`` times and reports the median time per outline
+and the throughput in lines per second. Parsing must stay linear in outline
+size, so the script also fails when the largest outline costs disproportionately
+more per line than the smallest.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Sequence
+
+from backend.utils.formatting import parse_outline_markdown
+
+
+def headings_outline(sections: int, subsections: int) -> str:
+    lines = ["# Synthetic Report", ""]
+    for index in range(1, sections + 1):
+        lines.append(f"## {index}. Section {index} heading")
+        lines.append("Short framing paragraph that the parser should skip.")
+        for sub in range(1, subsections + 1):
+            lines.append(f"### {index}.{sub} Subsection {sub} of {index}")
+            lines.append(f"#### Detail under {index}.{sub}")
+    return "\n".join(lines)
+
+
+def numbered_outline(sections: int, subsections: int) -> str:
+    lines = ["Synthetic Report"]
+    for index in range(1, sections + 1):
+        lines.append(f"{index}. **Section {index} heading**")
+        for sub in range(1, subsections + 1):
+            lines.append(f"    {index}.{sub} Subsection {sub} of {index}")
+            lines.append(f"        - Detail under {index}.{sub}")
+    return "\n".join(lines)
+
+
+def keyword_outline(sections: int, subsections: int) -> str:
+    lines = ["Title: Synthetic Report"]
+    for index in range(1, sections + 1):
+        lines.append(f"Section {index}: Section {index} heading")
+        for sub in range(1, subsections + 1):
+            lines.append(f"- Subsection {sub} of {index}")
+    return "\n".join(lines)
+
+
+STYLES: Dict[str, Callable[[int, int], str]] = {
+    "headings": headings_outline,
+    "numbered": numbered_outline,
+    "section_keyword": keyword_outline,
+}
+
+
+def measure(text: str, repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse_outline_markdown(text)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def run(sizes: Sequence[int], subsections: int, repeat: int) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for style, build in STYLES.items():
+        for sections in sizes:
+            text = build(sections, subsections)
+            outline = parse_outline_markdown(text)
+            if len(outline.sections) != sections or any(
+                len(section.subsections) != subsections for section in outline.sections
+            ):
+                raise SystemExit(f"{style} outline with {sections} sections parsed incorrectly")
+            line_count = text.count("\n") + 1
+            median = measure(text, repeat)
+            results.append(
+                {
+                    "style": style,
+                    "sections": sections,
+                    "lines": line_count,
+                    "median_ms": round(median * 1000, 3),
+                    "lines_per_second": round(line_count / median) if median else None,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Section counts to generate per style (default: %(default)s).",
+    )
+    parser.add_argument("--subsections", type=int, default=5, help="Subsections per section (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=20, help="Parses per outline (default: %(default)s).")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=3.0,
+        help="Fail when per-line cost of the largest size exceeds the smallest by this factor (default: %(default)s).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    sizes = sorted(set(args.sizes))
+    results = run(sizes, args.subsections, max(1, args.repeat))
+    ok = True
+    for style in STYLES:
+        rows = [row for row in results if row["style"] == style]
+        smallest, largest = rows[0], rows[-1]
+        slowdown = smallest["lines_per_second"] / max(largest["lines_per_second"], 1)
+        ok = ok and slowdown <= args.max_slowdown
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for row in results:
+            print(
+                f"{row['style']:<16} sections={row['sections']:>5} lines={row['lines']:>6} "
+                f"median={row['median_ms']:>9.3f}ms {row['lines_per_second']:>10} lines/s"
+            )
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
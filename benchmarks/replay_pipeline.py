@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Replay a recorded cassette through the report pipeline to measure its overhead.
+
+Record a real run first by launching the API (or CLI-driven service) with::
+
+    EXPLORER_OPENAI_CASSETTE=run.jsonl EXPLORER_OPENAI_CASSETTE_MODE=record uvicorn backend.api.app:app
+
+and save the request body with ``--payload-file`` or reuse the ``--topic``. Then::
+
+    python -m benchmarks.replay_pipeline --cassette run.jsonl --topic "Urban farming" --runs 20
+
+Without ``--replay-latency`` every LLM call returns instantly, so the measured
+time is pure pipeline overhead (pydantic, formatting, event assembly). With it,
+recorded latencies are reproduced, which lets scheduling strategies be compared
+on identical inputs.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from backend.schemas import GenerateRequest
+from backend.services.report_service import ReportGeneratorService
+from backend.utils.cassette import Cassette
+from backend.utils.openai_client import OpenAITextClient
+from benchmarks.load_test import percentile
+
+
+async def replay_once(service: ReportGeneratorService, request: GenerateRequest) -> Dict[str, object]:
+    started = time.perf_counter()
+    events = 0
+    final_status = "no_events"
+    async for event in service.stream_report(request):
+        events += 1
+        final_status = event.get("status", "unknown")
+    return {"seconds": time.perf_counter() - started, "events": events, "status": final_status}
+
+
+async def replay_runs(
+    service: ReportGeneratorService,
+    request: GenerateRequest,
+    runs: int,
+    concurrency: int,
+) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    remaining = runs
+    while remaining > 0:
+        batch = min(concurrency, remaining)
+        results.extend(await asyncio.gather(*(replay_once(service, request) for _ in range(batch))))
+        remaining -= batch
+    return results
+
+
+def build_request(payload_file: Optional[Path], topic: Optional[str], sections: Optional[int]) -> GenerateRequest:
+    if payload_file is not None:
+        return GenerateRequest.model_validate(json.loads(payload_file.read_text(encoding="utf-8")))
+    if not topic:
+        raise SystemExit("Provide --payload-file or --topic matching the recorded run.")
+    payload: Dict[str, object] = {"topic": topic, "mode": "generate_report"}
+    if sections is not None:
+        payload["sections"] = sections
+    return GenerateRequest.model_validate(payload)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a cassette through the report pipeline.")
+    parser.add_argument("--cassette", type=Path, required=True, help="Cassette JSONL recorded by the text client.")
+    parser.add_argument("--payload-file", type=Path, help="Request body used for the recorded run.")
+    parser.add_argument("--topic", help="Topic used for the recorded run when no payload file is given.")
+    parser.add_argument("--sections", type=int, help="Sections hint used for the recorded run.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of replays (default: %(default)s).")
+    parser.add_argument("--concurrency", type=int, default=1, help="Replays in flight at once (default: %(default)s).")
+    parser.add_argument("--replay-latency", action="store_true", help="Reproduce recorded LLM latencies.")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Scale recorded latencies (default: %(default)s).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args(argv)
+
+    cassette = Cassette(
+        args.cassette,
+        "replay",
+        replay_latency=args.replay_latency,
+        latency_scale=args.latency_scale,
+    )
+    recorded_llm_seconds = sum(entry["latency_seconds"] for entry in cassette.entries())
+    service = ReportGeneratorService(
+        text_client=OpenAITextClient(cassette=cassette),
+        report_store=None,
+    )
+    request = build_request(args.payload_file, args.topic, args.sections)
+    results = asyncio.run(replay_runs(service, request, max(1, args.runs), max(1, args.concurrency)))
+    durations = [float(result["seconds"]) for result in results]
+    summary = {
+        "runs": len(results),
+        "final_statuses": sorted({str(result["status"]) for result in results}),
+        "events_per_run": results[0]["events"] if results else 0,
+        "replay_latency": args.replay_latency,
+        "recorded_llm_seconds": round(recorded_llm_seconds, 4),
+        "run_ms": {
+            "mean": round(statistics.mean(durations) * 1000, 3),
+            "p50": round(percentile(durations, 50) * 1000, 3),
+            "p95": round(percentile(durations, 95) * 1000, 3),
+            "max": round(max(durations) * 1000, 3),
+        },
+    }
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    for key, value in summary.items():
+        print(f"{key:>22}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""GET /reports with content: uncached vs. cached full content vs. snippets vs. 304s.
+
+Seeds a temporary SQLite database with ``--reports`` finished reports for
+one user, each with a ``--content-kib`` markdown file, then lists one page
+of ``--limit`` reports ``--requests`` times through an in-process ASGI
+client, ``--concurrency`` requests at a time:
+
+- ``full-uncached``: ``include_content=true`` with the content cache
+  disabled, so every listing reads every file;
+- ``full-cached``: ``include_content=true`` with the content cache warm;
+- ``snippet``: ``include_content=snippet``, served from the columns
+  computed when each report was finalized;
+- ``not-modified``: ``include_content=true`` revalidated with the
+  listing's ``ETag`` in ``If-None-Match``, answered with a 304.
+
+Reports request latency percentiles, response size and content cache hits.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Set
+
+import httpx
+
+from backend.db import Base, create_async_engine_from_url, create_async_session_factory, create_engine_from_url
+from backend.storage import content_stats, get_content_cache
+from benchmarks.load_test import percentile
+from benchmarks.report_list_pagination import EMAIL, paginated_app
+
+MODES = ("full-uncached", "full-cached", "snippet", "not-modified")
+PARAGRAPH = "Tidal turbines convert the kinetic energy of moving water into electricity, twice a day. "
+
+
+def seed(path: Path, content_dir: Path, count: int, content_kib: int) -> None:
+    engine = create_engine_from_url(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    body = (PARAGRAPH * (content_kib * 1024 // len(PARAGRAPH) + 1))[: content_kib * 1024]
+    user_id = str(uuid.uuid4())
+    outline = json.dumps({"report_title": "Benchmark report", "sections": []})
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(
+            "INSERT INTO users (id, email, username, profile, status, usage_counters, created_at, updated_at) "
+            "VALUES (?, ?, 'bench', '{}', 'ACTIVE', '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            (user_id, EMAIL),
+        )
+        for index in range(count):
+            topic_id, report_id = str(uuid.uuid4()), str(uuid.uuid4())
+            text = f"Report {index}\n\n{body}\n"
+            content_path = content_dir / f"{report_id}.md"
+            content_path.write_text(text, encoding="utf-8")
+            stats = content_stats([text])
+            created = f"datetime('now', '-{count - index} seconds')"
+            connection.execute(
+                "INSERT INTO saved_topics (id, slug, title, owner_user_id, created_at, updated_at, is_deleted) "
+                f"VALUES (?, ?, ?, ?, {created}, {created}, 0)",
+                (topic_id, f"topic-{index}", f"Topic {index}", user_id),
+            )
+            connection.execute(
+                "INSERT INTO reports (id, saved_topic_id, owner_user_id, outline_snapshot, status, language, "
+                "output_format, summary, snippet, word_count, content_uri, sections, source_references, "
+                "model_versions, quality_scores, tags, created_at, updated_at, is_deleted) "
+                "VALUES (?, ?, ?, ?, 'COMPLETE', 'en', 'markdown', NULL, ?, ?, ?, '{}', '[]', '{}', '{}', '[]', "
+                f"{created}, {created}, 0)",
+                (report_id, topic_id, user_id, outline, stats.snippet, stats.word_count, str(content_path)),
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+async def measure(app, mode: str, limit: int, requests: int, concurrency: int) -> Dict[str, object]:
+    cache_mb = "0" if mode == "full-uncached" else "256"
+    os.environ["EXPLORER_REPORT_CONTENT_CACHE_MB"] = cache_mb
+    get_content_cache.cache_clear()
+    params = {"user_email": EMAIL, "limit": str(limit), "include_content": "snippet" if mode == "snippet" else "true"}
+    headers: Dict[str, str] = {}
+    latencies: List[float] = []
+    sizes: List[int] = []
+    statuses: Set[int] = set()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        if mode in ("full-cached", "not-modified"):
+            first = await client.get("/reports", params=params)
+            first.raise_for_status()
+            if mode == "not-modified":
+                headers["If-None-Match"] = first.headers["ETag"]
+        cache = get_content_cache()
+        hits, misses = cache.hits, cache.misses
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/reports", params=params, headers=headers)
+                if response.is_error:
+                    response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+                sizes.append(len(response.content))
+                statuses.add(response.status_code)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    response_status = ",".join(str(code) for code in sorted(statuses))
+
+    def ms(value: float) -> float:
+        return round(value * 1000, 2)
+
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "request_ms": {"p50": ms(percentile(latencies, 50)), "p95": ms(percentile(latencies, 95))},
+        "status": response_status,
+        "response_kib": round(sum(sizes) / len(sizes) / 1024, 1),
+        "cache_hits": cache.hits - hits,
+        "cache_misses": cache.misses - misses,
+    }
+
+
+def run(count: int, content_kib: int, limit: int, requests: int, concurrency: int, modes: List[str]) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    previous = os.environ.get("EXPLORER_REPORT_CONTENT_CACHE_MB")
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "bench.db"
+        seed(path, Path(workdir), count, content_kib)
+        engine = create_async_engine_from_url(f"sqlite:///{path}")
+        app = paginated_app(create_async_session_factory(engine))
+
+        async def main() -> None:
+            for mode in modes:
+                row = await measure(app, mode, limit, requests, concurrency)
+                results.append({"reports": count, "content_kib": content_kib, "limit": limit, **row})
+            await engine.dispose()
+
+        try:
+            asyncio.run(main())
+        finally:
+            if previous is None:
+                os.environ.pop("EXPLORER_REPORT_CONTENT_CACHE_MB", None)
+            else:
+                os.environ["EXPLORER_REPORT_CONTENT_CACHE_MB"] = previous
+            get_content_cache.cache_clear()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200, help="Reports owned by the user (default: %(default)s).")
+    parser.add_argument("--content-kib", type=int, default=64, help="Size of each report file (default: %(default)s).")
+    parser.add_argument("--limit", type=int, default=50, help="Reports per listing (default: %(default)s).")
+    parser.add_argument("--requests", type=int, default=100, help="Listings per mode (default: %(default)s).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Listings in flight (default: %(default)s).")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Modes to run (default: all).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = run(
+        max(1, args.reports),
+        max(1, args.content_kib),
+        max(1, args.limit),
+        max(1, args.requests),
+        max(1, args.concurrency),
+        args.modes,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['mode']:<14} listings={row['requests']} status={row['status']} rps={row['requests_per_second']} "
+            f"p50={row['request_ms']['p50']}ms p95={row['request_ms']['p95']}ms "
+            f"response={row['response_kib']}KiB cache_hits={row['cache_hits']} cache_misses={row['cache_misses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
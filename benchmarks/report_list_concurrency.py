@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Compare concurrent GET /reports on the previous sync route and the async route.
+
+Seeds a temporary SQLite database with ``--reports`` reports for one user,
+then fires ``--requests`` list calls ``--concurrency`` at a time through an
+in-process ASGI client. The ``sync`` app mounts the previous threadpool
+implementation (``def`` route over ``session_scope``); the ``async`` app
+mounts the real router on aiosqlite. While the burst runs, a sync ``def``
+probe route (standing in for ``/generate_report``, which also starts on the
+threadpool) is called every few milliseconds and its latency is reported
+next to list latency and throughput.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import anyio.to_thread
+import httpx
+from fastapi import FastAPI, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.api.dependencies import get_async_session_factory, get_outline_prefetcher, get_report_store
+from backend.api.routers import reports
+from backend.db import (
+    Base,
+    Report,
+    ReportStatus,
+    SavedTopic,
+    User,
+    create_async_engine_from_url,
+    create_async_session_factory,
+    create_engine_from_url,
+    create_session_factory,
+    session_scope,
+)
+from backend.utils.api_helpers import get_or_create_user
+from benchmarks.load_test import percentile
+
+EMAIL = "bench@example.com"
+MODES = ("sync", "async")
+
+
+def seed(session_factory: sessionmaker[Session], count: int) -> None:
+    with session_scope(session_factory) as session:
+        user = User(email=EMAIL, username="bench")
+        session.add(user)
+        for index in range(count):
+            topic = SavedTopic(slug=f"topic-{index}", title=f"Topic {index}", owner=user)
+            session.add(
+                Report(
+                    saved_topic=topic,
+                    owner=user,
+                    status=ReportStatus.COMPLETE,
+                    outline_snapshot={"report_title": f"Report {index}", "sections": []},
+                    summary="A short summary of the report.",
+                )
+            )
+
+
+def sync_app(session_factory: sessionmaker[Session]) -> FastAPI:
+    """The list route as it was before the async session path, lazy relationship loads included."""
+
+    app = FastAPI()
+
+    @app.get("/reports")
+    def list_reports(user_email: str = Query(...)):
+        with session_scope(session_factory) as session:
+            user = get_or_create_user(session, user_email, None)
+            rows = session.scalars(
+                select(Report)
+                .where(Report.owner_user_id == user.id, Report.is_deleted.is_(False))
+                .order_by(Report.created_at.desc())
+            ).all()
+            return [
+                {
+                    "id": str(report.id),
+                    "topic": report.saved_topic.title if report.saved_topic else "",
+                    "created_at": report.created_at.isoformat(),
+                }
+                for report in rows
+            ]
+
+    _add_probe(app)
+    return app
+
+
+def async_app(database_url: str) -> FastAPI:
+    app = FastAPI()
+    app.include_router(reports.router)
+    factory = create_async_session_factory(create_async_engine_from_url(database_url))
+    app.dependency_overrides[get_async_session_factory] = lambda: factory
+    app.dependency_overrides[get_report_store] = lambda: None
+    app.dependency_overrides[get_outline_prefetcher] = lambda: None
+    _add_probe(app)
+    return app
+
+
+def _add_probe(app: FastAPI) -> None:
+    @app.get("/probe")
+    def probe():
+        return {"ok": True}
+
+
+async def burst(app: FastAPI, requests: int, concurrency: int, probe_interval: float) -> Dict[str, object]:
+    transport = httpx.ASGITransport(app=app)
+    list_latencies: List[float] = []
+    probe_latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def one_list() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/reports", params={"user_email": EMAIL})
+                response.raise_for_status()
+                list_latencies.append(time.perf_counter() - started)
+
+        async def probes() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                (await client.get("/probe")).raise_for_status()
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(probe_interval)
+
+        prober = asyncio.create_task(probes())
+        started = time.perf_counter()
+        await asyncio.gather(*(one_list() for _ in range(requests)))
+        wall = time.perf_counter() - started
+        done.set()
+        await prober
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * 1000, 1)
+
+    return {
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(requests / wall, 1) if wall else None,
+        "list_ms": {"p50": ms(percentile(list_latencies, 50)), "p95": ms(percentile(list_latencies, 95))},
+        "probe_ms": {
+            "p50": ms(percentile(probe_latencies, 50)),
+            "p95": ms(percentile(probe_latencies, 95)),
+            "max": ms(max(probe_latencies, default=None)),
+        },
+    }
+
+
+def run(reports_count: int, requests: int, concurrency: int, threads: int, probe_interval: float) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+        engine = create_engine_from_url(database_url)
+        Base.metadata.create_all(engine)
+        session_factory = create_session_factory(engine)
+        seed(session_factory, reports_count)
+        apps = {"sync": sync_app(session_factory), "async": async_app(database_url)}
+
+        async def measure(mode: str) -> Dict[str, object]:
+            anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+            return await burst(apps[mode], requests, concurrency, probe_interval)
+
+        for mode in MODES:
+            row = asyncio.run(measure(mode))
+            results.append({"mode": mode, "reports": reports_count, "concurrency": concurrency, "threads": threads, **row})
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=200, help="Reports owned by the benchmark user (default: %(default)s).")
+    parser.add_argument("--requests", type=int, default=200, help="List requests per mode (default: %(default)s).")
+    parser.add_argument("--concurrency", type=int, default=64, help="List requests in flight (default: %(default)s).")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=40,
+        help="Starlette threadpool size; 40 is the anyio default (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--probe-interval-ms",
+        type=float,
+        default=5.0,
+        help="Pause between probe requests (default: %(default)s).",
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = run(
+        args.reports,
+        args.requests,
+        max(1, args.concurrency),
+        max(1, args.threads),
+        args.probe_interval_ms / 1000,
+    )
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        print(
+            f"{row['mode']:<6} reports={row['reports']} concurrency={row['concurrency']} threads={row['threads']} "
+            f"wall={row['wall_seconds']}s {row['throughput_rps']} req/s "
+            f"list p50={row['list_ms']['p50']}ms p95={row['list_ms']['p95']}ms "
+            f"probe p50={row['probe_ms']['p50']}ms p95={row['probe_ms']['p95']}ms max={row['probe_ms']['max']}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
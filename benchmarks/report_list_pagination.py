@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""GET /reports for a user with many reports: unbounded list vs. keyset pages.
+
+Seeds a temporary SQLite database with ``--reports`` reports (each on its
+own saved topic) for one user, then measures through an in-process ASGI
+client:
+
+- ``unbounded``: the previous route, which loaded every ``Report`` entity
+  plus its saved topic (``selectinload``) and returned them all;
+- ``first-page``: the keyset-paginated projection route, first ``--limit``
+  reports;
+- ``deep-page``: the same route resumed from a cursor halfway through;
+- ``walk``: every page in turn, following ``X-Next-Cursor`` (per-page
+  latency is reported, plus the total for the walk).
+
+Reports request latency percentiles and SQL statements per request.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Query
+from sqlalchemy import event, select
+from sqlalchemy.orm import selectinload
+
+from backend.api.dependencies import get_async_session_factory, get_outline_prefetcher, get_report_store
+from backend.api.routers import reports
+from backend.db import (
+    Base,
+    Report,
+    async_session_scope,
+    create_async_engine_from_url,
+    create_async_session_factory,
+    create_engine_from_url,
+)
+from backend.utils.api_helpers import get_or_create_user_async
+from benchmarks.load_test import percentile
+
+EMAIL = "bench@example.com"
+MODES = ("unbounded", "first-page", "deep-page", "walk")
+
+
+def seed(path: Path, count: int) -> None:
+    engine = create_engine_from_url(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    user_id = str(uuid.uuid4())
+    outline = json.dumps({"report_title": "Benchmark report", "sections": [{"title": "1: Intro", "subsections": []}]})
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(
+            "INSERT INTO users (id, email, username, profile, status, usage_counters, created_at, updated_at) "
+            "VALUES (?, ?, 'bench', '{}', 'ACTIVE', '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            (user_id, EMAIL),
+        )
+        for index in range(count):
+            topic_id, report_id = str(uuid.uuid4()), str(uuid.uuid4())
+            # Spread creation times one second apart, newest last.
+            created = f"datetime('now', '-{count - index} seconds')"
+            connection.execute(
+                "INSERT INTO saved_topics (id, slug, title, owner_user_id, created_at, updated_at, is_deleted) "
+                f"VALUES (?, ?, ?, ?, {created}, {created}, 0)",
+                (topic_id, f"topic-{index}", f"Topic {index}", user_id),
+            )
+            connection.execute(
+                "INSERT INTO reports (id, saved_topic_id, owner_user_id, outline_snapshot, status, language, "
+                "output_format, summary, sections, source_references, model_versions, quality_scores, tags, "
+                "created_at, updated_at, is_deleted) "
+                "VALUES (?, ?, ?, ?, 'COMPLETE', 'en', 'markdown', 'A short summary of the report.', '{}', '[]', "
+                f"'{{}}', '{{}}', '[]', {created}, {created}, 0)",
+                (report_id, topic_id, user_id, outline),
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def unbounded_app(factory) -> FastAPI:
+    """The list route as it was before keyset pagination."""
+
+    app = FastAPI()
+
+    @app.get("/reports")
+    async def list_reports(user_email: str = Query(...)):
+        async with async_session_scope(factory) as session:
+            user = await get_or_create_user_async(session, user_email, None)
+            rows = (
+                await session.scalars(
+                    select(Report)
+                    .options(selectinload(Report.saved_topic))
+                    .where(Report.owner_user_id == user.id, Report.is_deleted.is_(False))
+                    .order_by(Report.created_at.desc())
+                )
+            ).all()
+        return [
+            {
+                "id": str(report.id),
+                "topic": report.saved_topic.title if report.saved_topic else "",
+                "title": (report.outline_snapshot or {}).get("report_title"),
+                "status": report.status,
+                "summary": report.summary,
+                "created_at": report.created_at.isoformat(),
+                "updated_at": report.updated_at.isoformat(),
+            }
+            for report in rows
+        ]
+
+    return app
+
+
+def paginated_app(factory) -> FastAPI:
+    app = FastAPI()
+    app.include_router(reports.router)
+    app.dependency_overrides[get_async_session_factory] = lambda: factory
+    app.dependency_overrides[get_report_store] = lambda: None
+    app.dependency_overrides[get_outline_prefetcher] = lambda: None
+    return app
+
+
+async def measure(
+    app: FastAPI, statements: List[int], mode: str, total: int, limit: int, repeat: int
+) -> Dict[str, object]:
+    latencies: List[float] = []
+    counts: List[int] = []
+    rows = 0
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+
+        async def call(cursor: Optional[str] = None) -> httpx.Response:
+            params = {"user_email": EMAIL}
+            if mode != "unbounded":
+                params["limit"] = str(limit)
+            if cursor:
+                params["cursor"] = cursor
+            statements[0] = 0
+            started = time.perf_counter()
+            response = await client.get("/reports", params=params)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+            counts.append(statements[0])
+            return response
+
+        # Cursor halfway through the list, found once up front.
+        middle = await _cursor_after(client, limit, total // (2 * limit)) if mode == "deep-page" else None
+
+        walk_seconds: List[float] = []
+        for _ in range(repeat):
+            if mode == "walk":
+                started = time.perf_counter()
+                cursor, rows = None, 0
+                while True:
+                    response = await call(cursor)
+                    rows += len(response.json())
+                    cursor = response.headers.get(reports.NEXT_CURSOR_HEADER)
+                    if not cursor:
+                        break
+                walk_seconds.append(time.perf_counter() - started)
+            else:
+                rows = len((await call(middle)).json())
+
+    def ms(value: float) -> float:
+        return round(value * 1000, 2)
+
+    result: Dict[str, object] = {
+        "mode": mode,
+        "rows": rows,
+        "requests": len(latencies),
+        "request_ms": {"p50": ms(percentile(latencies, 50)), "p95": ms(percentile(latencies, 95))},
+        "statements_per_request": round(sum(counts) / len(counts), 1),
+    }
+    if walk_seconds:
+        result["walk_ms"] = ms(min(walk_seconds))
+    return result
+
+
+async def _cursor_after(client: httpx.AsyncClient, limit: int, pages: int) -> Optional[str]:
+    cursor: Optional[str] = None
+    for _ in range(max(1, pages)):
+        params = {"user_email": EMAIL, "limit": str(limit), **({"cursor": cursor} if cursor else {})}
+        cursor = (await client.get("/reports", params=params)).headers.get(reports.NEXT_CURSOR_HEADER)
+    return cursor
+
+
+def run(count: int, limit: int, repeat: int, modes: List[str]) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "bench.db"
+        seed(path, count)
+        engine = create_async_engine_from_url(f"sqlite:///{path}")
+        statements = [0]
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _count(*_args) -> None:
+            statements[0] += 1
+
+        factory = create_async_session_factory(engine)
+        apps = {"unbounded": unbounded_app(factory)}
+        apps["first-page"] = apps["deep-page"] = apps["walk"] = paginated_app(factory)
+
+        async def main() -> None:
+            for mode in modes:
+                row = await measure(apps[mode], statements, mode, count, limit, repeat)
+                results.append({"reports": count, "limit": limit, **row})
+            await engine.dispose()
+
+        asyncio.run(main())
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=10_000, help="Reports owned by the user (default: %(default)s).")
+    parser.add_argument("--limit", type=int, default=50, help="Page size for the paginated modes (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per mode (default: %(default)s).")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Modes to run (default: all).")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = run(max(1, args.reports), max(1, args.limit), max(1, args.repeat), args.modes)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        walk = f" walk={row['walk_ms']}ms" if "walk_ms" in row else ""
+        print(
+            f"{row['mode']:<10} reports={row['reports']} rows={row['rows']} requests={row['requests']} "
+            f"p50={row['request_ms']['p50']}ms p95={row['request_ms']['p95']}ms "
+            f"statements/request={row['statements_per_request']}{walk}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Bytes on the wire and CPU per request for compressed report payloads.
+
+Serves two synthetic payloads through ``CompressionMiddleware`` (and, for
+comparison, Starlette's ``GZipMiddleware``) by calling the ASGI app
+directly, so every body message is seen exactly as it would be sent:
+
+- ``reports``: ``GET /reports?include_content=true``-shaped JSON with
+  ``--reports`` reports of ``--content-kib`` markdown each;
+- ``stream``: a ``/generate_report``-shaped NDJSON stream with one event
+  per section plus a final ``complete`` event carrying the whole report.
+
+For each encoding it reports raw and wire bytes, the compression ratio and
+the CPU time per request (process time, including serialization; compare
+against ``identity``). For streams it also counts the events that could be
+decoded as soon as their message was sent, which is what keeps progress
+events progressive.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.middleware.gzip import GZipMiddleware
+
+from backend.api.compression import CompressionMiddleware, available_encodings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+ENCODINGS = ("identity", "gzip", "br", "starlette-gzip")
+
+
+def report_text(rng: random.Random, size: int, vocabulary: List[str]) -> str:
+    """Markdown-ish prose from a fixed vocabulary, so it compresses like real reports."""
+
+    parts: List[str] = []
+    length = 0
+    section = 0
+    while length < size:
+        if length == 0 or rng.random() < 0.02:
+            section += 1
+            heading = f"\n## {section}: {' '.join(rng.choices(vocabulary, k=4)).title()}\n\n"
+            parts.append(heading)
+            length += len(heading)
+        sentence = " ".join(rng.choices(vocabulary, k=rng.randint(8, 24))).capitalize() + ". "
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)[:size]
+
+
+def build_app(encoding: str, listing: List[Dict[str, Any]], events: List[Dict[str, Any]]) -> FastAPI:
+    app = FastAPI()
+    if encoding == "starlette-gzip":
+        app.add_middleware(GZipMiddleware, minimum_size=1024)
+    elif encoding != "identity":
+        app.add_middleware(CompressionMiddleware, encodings=[encoding], minimum_size=1024)
+
+    @app.get("/reports")
+    def reports():
+        return listing
+
+    @app.get("/stream")
+    def stream():
+        async def lines():
+            for event in events:
+                yield (json.dumps(event) + "\n").encode("utf-8")
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return app
+
+
+async def call(app: FastAPI, path: str, accept_encoding: str) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> Dict[str, Any]:
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("bench", 1),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return messages
+
+
+def decoder_for(encoding: str) -> Callable[[bytes], bytes]:
+    if encoding in ("gzip", "starlette-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    if encoding == "br":
+        decompressor = brotli.Decompressor()
+
+        def decode(data: bytes) -> bytes:
+            # The decompressor hands back at most 32 KiB per call.
+            output = chunk = decompressor.process(data)
+            while chunk:
+                chunk = decompressor.process(b"")
+                output += chunk
+            return output
+
+        return decode
+    return lambda data: data
+
+
+def measure(app: FastAPI, encoding: str, path: str, repeat: int) -> Dict[str, Any]:
+    accept = "identity" if encoding == "identity" else ("br" if encoding == "br" else "gzip")
+    cpu: List[float] = []
+    messages: List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        started = time.process_time()
+        messages = asyncio.run(call(app, path, accept))
+        cpu.append(time.process_time() - started)
+    bodies = [message.get("body", b"") for message in messages if message["type"] == "http.response.body"]
+    decode = decoder_for(encoding)
+    raw = b""
+    sent = 0
+    decodable_on_arrival = 0
+    for message in messages[1:]:
+        raw += decode(message.get("body", b""))
+        if message.get("more_body"):
+            # One event per streamed message: it is decodable on arrival when
+            # every line sent so far has come out of the decoder.
+            sent += 1
+            decodable_on_arrival += raw.count(b"\n") >= sent
+    wire = sum(len(body) for body in bodies)
+    result: Dict[str, Any] = {
+        "payload": path.strip("/"),
+        "encoding": encoding,
+        "raw_kib": round(len(raw) / 1024, 1),
+        "wire_kib": round(wire / 1024, 1),
+        "ratio": round(len(raw) / wire, 2) if wire else None,
+        "cpu_ms": round(min(cpu) * 1000, 2),
+    }
+    if path == "/stream":
+        result["events_decodable_on_arrival"] = decodable_on_arrival
+    return result
+
+
+def run(reports: int, content_kib: int, sections: int, repeat: int, encodings: Optional[List[str]]) -> List[Dict[str, Any]]:
+    rng = random.Random(7)
+    vocabulary = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(2, 11))) for _ in range(3000)]
+    listing = [
+        {
+            "id": f"report-{index}",
+            "topic": f"Topic {index}",
+            "title": f"Report {index}",
+            "status": "complete",
+            "summary": report_text(rng, 300, vocabulary),
+            "content": report_text(rng, content_kib * 1024, vocabulary),
+            "created_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-01T00:00:00",
+        }
+        for index in range(reports)
+    ]
+    section_bodies = [report_text(rng, content_kib * 1024 // sections, vocabulary) for _ in range(sections)]
+    events = [{"status": "started"}]
+    events += [{"status": "section_ready", "index": index, "body": body} for index, body in enumerate(section_bodies)]
+    events.append({"status": "complete", "report": "\n\n".join(section_bodies)})
+
+    selected = encodings or [
+        encoding for encoding in ENCODINGS if encoding in ("identity", "starlette-gzip") or available_encodings([encoding])
+    ]
+    results: List[Dict[str, Any]] = []
+    for encoding in selected:
+        app = build_app(encoding, listing, events)
+        for path in ("/reports", "/stream"):
+            results.append(measure(app, encoding, path, repeat))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=50, help="Reports in the listing (default: %(default)s).")
+    parser.add_argument("--content-kib", type=int, default=64, help="Markdown per report (default: %(default)s).")
+    parser.add_argument("--sections", type=int, default=12, help="Section events in the stream (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per measurement (default: %(default)s).")
+    parser.add_argument(
+        "--encodings", nargs="+", choices=ENCODINGS, help="Encodings to run (default: all that are available)."
+    )
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args()
+
+    results = run(max(1, args.reports), max(1, args.content_kib), max(1, args.sections), max(1, args.repeat), args.encodings)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for row in results:
+        stream = (
+            f" decodable_on_arrival={row['events_decodable_on_arrival']}" if "events_decodable_on_arrival" in row else ""
+        )
+        print(
+            f"{row['payload']:<8} {row['encoding']:<15} raw={row['raw_kib']}KiB wire={row['wire_kib']}KiB "
+            f"ratio={row['ratio']} cpu={row['cpu_ms']}ms{stream}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,34 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO
+
+if TYPE_CHECKING:  # pragma: no cover - import-time only
+    import httpx
 
 CLI_DIR = Path(__file__).resolve().parent
 CLIENTS_DIR = CLI_DIR.parent
 GENERATED_REPORTS_DIR = CLI_DIR / 'generated_reports'
 
-try:
-    import httpx
-except ImportError as exception:  # pragma: no cover - dependency check
-    raise SystemExit("httpx is required to run this script (pip install httpx)") from exception
-
 from pydantic import ValidationError
 
 from backend.schemas import GenerateRequest, normalize_subject_list
 
 
+def _require_httpx():
+    # Imported on demand: payload validation and --help should not pay for the HTTP stack.
+    try:
+        import httpx
+    except ImportError as exception:  # pragma: no cover - dependency check
+        raise SystemExit("httpx is required to run this script (pip install httpx)") from exception
+    return httpx
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Call the report generation API to stream a finished report.",
@@ -82,6 +90,11 @@ def parse_args() -> argparse.Namespace:
         "--username",
         help="Username to store for the user when --user-email is provided (required whenever a user email is supplied).",
     )
+    parser.add_argument(
+        "--reference",
+        action="store_true",
+        help="Request return=\"reference\": rebuild the report from streamed sections and verify its hash instead of receiving the full text again.",
+    )
     return parser.parse_args()
 
 
@@ -222,7 +235,10 @@ def _enforce_user_metadata_requirements(
             raise SystemExit("--username must accompany --user-email when override flags are provided.")
 
 
-def _prepare_final_report(final_event: Dict[str, Any]) -> str:
+def _prepare_final_report(
+    final_event: Dict[str, Any],
+    sections: Optional[List[Dict[str, Any]]] = None,
+) -> str:
     status = final_event.get("status")
     if status != "complete":
         detail_parts = [
@@ -238,6 +254,8 @@ def _prepare_final_report(final_event: Dict[str, Any]) -> str:
         detail_parts.append("Final event: " + json.dumps(final_event, indent=2))
         raise SystemExit("\n".join(detail_parts))
     report = final_event.get("report")
+    if report is None and "content_hash" in final_event:
+        return _reassemble_report(final_event, sections or [])
     if not isinstance(report, str):
         raise SystemExit(
             "Final payload did not contain a 'report' field. "
@@ -246,6 +264,23 @@ def _prepare_final_report(final_event: Dict[str, Any]) -> str:
     return report
 
 
+def _reassemble_report(final_event: Dict[str, Any], sections: List[Dict[str, Any]]) -> str:
+    """Rebuild a ``return="reference"`` report from its ``section_complete`` events."""
+
+    ordered = sorted(sections, key=lambda event: event.get("index", 0))
+    blocks = [str(final_event.get("report_title", ""))]
+    blocks.extend(f"{event['section']}\n\n{event['body']}" for event in ordered)
+    text = "\n\n".join(blocks).strip() + "\n"
+    content = text.encode("utf-8")
+    digest = f"sha256:{hashlib.sha256(content).hexdigest()}"
+    if digest != final_event.get("content_hash") or len(content) != final_event.get("byte_size"):
+        raise SystemExit(
+            "Reassembled report does not match the server's content hash; "
+            f"fetch it from content_uri {final_event.get('content_uri')!r} instead."
+        )
+    return text
+
+
 def _write_text_file(path: Path, contents: str, message: str, show_message: bool = True) -> None:
     """Write ``contents`` to ``path`` and optionally log ``message``."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -258,6 +293,7 @@ def _collect_stream_events(
     response: httpx.Response,
     raw_stream_handle: TextIO | None,
     show_progress: bool,
+    sections: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     final_event: Dict[str, Any] | None = None
     for line in response.iter_lines():
@@ -274,10 +310,14 @@ def _collect_stream_events(
             if show_progress:
                 print(line)
             continue
+        if sections is not None and event.get("status") == "section_complete" and "body" in event:
+            sections.append(event)
         if show_progress:
             event_for_display = event
             if event.get("status") == "complete" and "report" in event:
                 event_for_display = {k: v for k, v in event.items() if k != "report"}
+            elif event.get("status") == "section_complete" and "body" in event:
+                event_for_display = {k: v for k, v in event.items() if k != "body"}
             print(json.dumps(event_for_display))
         final_event = event
 
@@ -292,6 +332,7 @@ def _stream_report(
     payload: Dict[str, Any],
     raw_stream: Path | None,
     show_progress: bool,
+    sections: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     raw_stream_handle: TextIO | None = None
     try:
@@ -299,11 +340,12 @@ def _stream_report(
             raw_stream.parent.mkdir(parents=True, exist_ok=True)
             raw_stream_handle = raw_stream.open("w", encoding="utf-8")
 
+        httpx = _require_httpx()
         with httpx.Client(timeout=None) as client:
             with client.stream("POST", url, json=payload) as response:
                 response.raise_for_status()
                 return _collect_stream_events(
-                    response, raw_stream_handle, show_progress
+                    response, raw_stream_handle, show_progress, sections
                 )
     finally:
         if raw_stream_handle:
@@ -337,14 +379,18 @@ def main() -> None:
         else GENERATED_REPORTS_DIR / "report.md"
     )
     outfile = args.outfile or default_outfile
+    if args.reference:
+        payload["return"] = "reference"
+    sections: List[Dict[str, Any]] = []
     final_event = _stream_report(
         args.url,
         payload,
         args.raw_stream,
         args.show_progress,
+        sections,
     )
 
-    report = _prepare_final_report(final_event)
+    report = _prepare_final_report(final_event, sections)
 
     _write_text_file(outfile, report, f"Report generation complete. Saved to {outfile}")
 
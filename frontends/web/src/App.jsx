@@ -23,6 +23,7 @@ import {
   fetchSavedTopics,
   createSavedTopic,
   deleteSavedTopic,
+  fetchSavedReport,
   fetchSavedReports,
   deleteSavedReport,
   cleanHeadingForTopic,
@@ -89,7 +90,7 @@ function App() {
       setSavedReports([]);
       return;
     }
-    const reports = await fetchSavedReports(apiBase, user, { includeContent: true });
+    const reports = await fetchSavedReports(apiBase, user);
     setSavedReports(reports.slice(0, MAX_SAVED_REPORTS));
   }, [apiBase, user]);
 
@@ -354,8 +355,18 @@ function App() {
       });
       closeTopicView();
       setIsHomeView(false);
+      if (!content && reportPayload.saved && reportPayload.id && user.email) {
+        // Saved reports are listed with a snippet only; load the body on open.
+        fetchSavedReport(apiBase, user, reportPayload.id)
+          .then((loaded) =>
+            setActiveReport((current) =>
+              current && current.id === loaded.id ? { ...current, content: loaded.content } : current
+            )
+          )
+          .catch(() => {});
+      }
     },
-    [closeTopicView]
+    [apiBase, closeTopicView, user]
   );
 
   const handleReportClose = useCallback(() => {
@@ -372,24 +372,44 @@ export async function deleteSavedTopic(apiBase, user, topicId) {
     }
 }
 
-export async function fetchSavedReports(apiBase, user, { includeContent = true, signal } = {}) {
+export async function fetchSavedReports(apiBase, user, { includeContent = "snippet", signal } = {}) {
     const query = buildUserQuery(user);
-    const url = includeContent ? `${apiBase}/reports?${query}&include_content=1` : `${apiBase}/reports?${query}`;
-    const response = await fetch(url, { signal });
-    if (!response.ok) {
-        throw new Error(`Failed to load reports (${response.status}).`);
-    }
-    const data = await response.json();
-    if (!Array.isArray(data)) return [];
+    const contentParam = includeContent === "snippet" ? "&include_content=snippet" : includeContent ? "&include_content=1" : "";
+    const baseUrl = `${apiBase}/reports?${query}${contentParam}`;
+    const data = [];
+    let cursor = null;
+    do {
+        const url = cursor ? `${baseUrl}&cursor=${encodeURIComponent(cursor)}` : baseUrl;
+        const response = await fetch(url, { signal });
+        if (!response.ok) {
+            throw new Error(`Failed to load reports (${response.status}).`);
+        }
+        const page = await response.json();
+        if (!Array.isArray(page)) break;
+        data.push(...page);
+        cursor = response.headers.get("X-Next-Cursor");
+    } while (cursor);
     return data.map((report) => ({
         id: report.id,
         topic: report.topic || "",
         title: report.title || report.topic || "Explorer Report",
         content: report.content || "",
-        preview: report.summary || summarizeReport(report.content || report.title || report.topic || ""),
+        preview: report.summary || report.snippet || summarizeReport(report.content || report.title || report.topic || ""),
+        readingMinutes: report.reading_minutes ?? null,
+        saved: true,
     }));
 }
 
+export async function fetchSavedReport(apiBase, user, reportId, { signal } = {}) {
+    const query = buildUserQuery(user);
+    const response = await fetch(`${apiBase}/reports/${reportId}?${query}`, { signal });
+    if (!response.ok) {
+        throw new Error(`Failed to load report (${response.status}).`);
+    }
+    const report = await response.json();
+    return { id: report.id, content: report.content || "" };
+}
+
 export async function deleteSavedReport(apiBase, user, reportId) {
     const query = buildUserQuery(user);
     const response = await fetch(`${apiBase}/reports/${reportId}?${query}`, {
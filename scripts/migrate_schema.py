@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Migrate the Explorer SQLite schema offline, rebuilding legacy tables in resumable batches."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from backend.db import create_engine_from_url, default_database_url
+from backend.db.schema_migrations import DEFAULT_BATCH_ROWS, MIGRATION_MODES, RebuildProgress, ensure_schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Database to migrate (default: EXPLORER_DATABASE_URL or sqlite:///data/reportgen.db).",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=DEFAULT_BATCH_ROWS,
+        help="Rows copied per transaction (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=[mode for mode in MIGRATION_MODES if mode != "off"],
+        default="batched",
+        help="Rebuild strategy for legacy tables (default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    database_url = args.database_url or default_database_url()
+    engine = create_engine_from_url(database_url, migrate=False)
+    started = time.monotonic()
+
+    def report(progress: RebuildProgress) -> None:
+        percent = 100.0 * progress.copied / progress.total if progress.total else 100.0
+        state = "done" if progress.done else f"{percent:5.1f}%"
+        print(
+            f"{progress.table}: {progress.copied}/{progress.total} rows {state} "
+            f"({time.monotonic() - started:.1f}s)",
+            flush=True,
+        )
+
+    try:
+        changed = ensure_schema(engine, mode=args.mode, batch_rows=args.batch_rows, progress=report)
+    except KeyboardInterrupt:
+        print("Interrupted; rerun to resume from the last committed batch.", file=sys.stderr)
+        raise SystemExit(130)
+    finally:
+        engine.dispose()
+    print(f"{database_url}: {'migrated' if changed else 'schema already current'}")
+
+
+if __name__ == "__main__":
+    main()
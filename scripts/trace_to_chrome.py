@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Convert an EXPLORER_TRACE_FILE span log into a Chrome trace (chrome://tracing, Perfetto)."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from backend.utils.tracing import read_spans, to_chrome_trace
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("spans", type=Path, help="JSONL span file written by the API.")
+    parser.add_argument("output", type=Path, help="Destination trace JSON file.")
+    args = parser.parse_args()
+
+    spans = read_spans(args.spans)
+    args.output.write_text(json.dumps(to_chrome_trace(spans)), encoding="utf-8")
+    print(f"Wrote {len(spans)} spans to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.api.app import app
+from backend.api.dependencies import (
+    get_async_session_factory,
+    get_commit_queue,
+    get_outline_prefetcher,
+    get_report_store,
+)
+from backend.db import (
+    Base,
+    CommitQueue,
+    Report,
+    User,
+    async_session_scope,
+    create_async_engine_from_url,
+    create_async_session_factory,
+    create_engine_from_url,
+    create_session_factory,
+)
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.storage import GeneratedReportStore
+
+EMAIL = "reader@example.com"
+
+
+def _seed_store(tmp_path: Path):
+    database_url = f"sqlite+pysqlite:///{tmp_path}/explorer.db"
+    engine = create_engine_from_url(database_url)
+    Base.metadata.create_all(engine)
+    commit_queue = CommitQueue(create_session_factory(engine))
+    store = GeneratedReportStore(
+        base_dir=tmp_path / "reports", session_factory=create_session_factory(engine), commit_queue=commit_queue
+    )
+    outline = Outline(report_title="Tidal Power", sections=[Section(title="1: Basics", subsections=[])])
+    request = GenerateRequest.model_validate(
+        {"topic": "Tidal power", "mode": "generate_report", "user_email": EMAIL, "username": "reader"}
+    )
+    handle = store.prepare_report(request, outline)
+    store.finalize_report(handle, "Tidal Power\n\n1: Basics\n\nTurbines.", [{"title": "1: Basics", "body": "Turbines."}])
+    return store, handle, create_async_session_factory(create_async_engine_from_url(database_url))
+
+
+def _client(store, async_factory) -> TestClient:
+    app.dependency_overrides[get_async_session_factory] = lambda: async_factory
+    app.dependency_overrides[get_commit_queue] = lambda: store._commit_queue
+    app.dependency_overrides[get_report_store] = lambda: store
+    app.dependency_overrides[get_outline_prefetcher] = lambda: None
+    return TestClient(app)
+
+
+def _clear_overrides() -> None:
+    for dependency in (get_async_session_factory, get_commit_queue, get_report_store, get_outline_prefetcher):
+        app.dependency_overrides.pop(dependency, None)
+
+
+def test_create_async_engine_from_url_selects_async_driver():
+    assert create_async_engine_from_url("sqlite:///reports.db").url.drivername == "sqlite+aiosqlite"
+    assert create_async_engine_from_url("sqlite+pysqlite:///:memory:").url.drivername == "sqlite+aiosqlite"
+
+
+def test_async_session_scope_reads_rows_written_by_sync_store(tmp_path: Path):
+    _, handle, async_factory = _seed_store(tmp_path)
+
+    async def load():
+        async with async_session_scope(async_factory) as session:
+            return await session.get(Report, handle.report_id)
+
+    report = asyncio.run(load())
+    assert report is not None
+    assert report.content_uri.endswith("report.md")
+
+
+def test_async_report_routes_list_get_and_delete(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    params = {"user_email": EMAIL}
+    try:
+        with _client(store, async_factory) as client:
+            listed = client.get("/reports", params={**params, "include_content": "true"})
+            fetched = client.get(f"/reports/{handle.report_id}", params=params)
+            missing = client.get(f"/reports/{uuid.uuid4()}", params=params)
+            deleted = client.delete(f"/reports/{handle.report_id}", params=params)
+            after = client.get("/reports", params=params)
+    finally:
+        _clear_overrides()
+
+    assert listed.status_code == 200
+    [row] = listed.json()
+    assert row["topic"] == "Tidal power"
+    assert row["title"] == "Tidal Power"
+    assert row["content"] == "Tidal Power\n\n1: Basics\n\nTurbines.\n"
+    assert fetched.json()["content"] == row["content"]
+    assert missing.status_code == 404
+    assert deleted.status_code == 204
+    assert after.json() == []
+
+
+def test_get_routes_do_not_create_unknown_users(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    params = {"user_email": "stranger@example.com", "username": "stranger"}
+    try:
+        with _client(store, async_factory) as client:
+            reports = client.get("/reports", params=params)
+            topics = client.get("/saved_topics", params=params)
+            report = client.get(f"/reports/{handle.report_id}", params=params)
+    finally:
+        _clear_overrides()
+
+    assert reports.json() == []
+    assert topics.json() == []
+    assert report.status_code == 404
+    with store._session_factory() as session:
+        assert session.query(User).filter(User.email == "stranger@example.com").count() == 0
+
+
+def test_list_reports_snippet_mode_skips_report_files(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    legacy = store.prepare_report(
+        GenerateRequest.model_validate(
+            {"topic": "Wave power", "mode": "generate_report", "user_email": EMAIL, "username": "reader"}
+        ),
+        Outline(report_title="Wave Power", sections=[]),
+    )
+    # A report finalized before listing previews were stored.
+    legacy.narrative_path.write_text("Wave Power\n\nSwells drive buoys.\n", encoding="utf-8")
+    with store._session_factory() as session:
+        session.get(Report, legacy.report_id).content_uri = store._relative_uri(legacy.narrative_path)
+        session.commit()
+    os.remove(handle.narrative_path)
+    try:
+        with _client(store, async_factory) as client:
+            listed = client.get("/reports", params={"user_email": EMAIL, "include_content": "snippet"})
+    finally:
+        _clear_overrides()
+
+    assert listed.status_code == 200
+    rows = {row["title"]: row for row in listed.json()}
+    # The stored preview is served even though the file is gone.
+    assert rows["Tidal Power"]["snippet"] == "Tidal Power 1: Basics Turbines."
+    assert rows["Tidal Power"]["word_count"] == 5
+    assert rows["Tidal Power"]["reading_minutes"] == 1
+    assert rows["Tidal Power"]["content"] is None
+    assert rows["Wave Power"]["snippet"] == "Wave Power Swells drive buoys."
+    assert rows["Wave Power"]["word_count"] == 5
+
+
+def test_list_reports_pages_by_keyset_cursor(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    outline = Outline(report_title="Wave Power", sections=[])
+    for index in range(6):
+        request = GenerateRequest.model_validate(
+            {"topic": f"Wave power {index}", "mode": "generate_report", "user_email": EMAIL, "username": "reader"}
+        )
+        store.prepare_report(request, outline)
+    params = {"user_email": EMAIL, "limit": 3}
+    pages = []
+    try:
+        with _client(store, async_factory) as client:
+            everything = client.get("/reports", params={"user_email": EMAIL}).json()
+            cursor = None
+            while True:
+                page = client.get("/reports", params={**params, **({"cursor": cursor} if cursor else {})})
+                pages.append(page.json())
+                cursor = page.headers.get("X-Next-Cursor")
+                if not cursor:
+                    break
+            invalid = client.get("/reports", params={**params, "cursor": "not-a-cursor"})
+            too_large = client.get("/reports", params={**params, "limit": 1000})
+    finally:
+        _clear_overrides()
+
+    # Seven reports created within the same second or two: ties on created_at
+    # are broken by id, so every report shows up exactly once.
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [row["id"] for page in pages for row in page] == [row["id"] for row in everything]
+    assert len({row["id"] for row in everything}) == 7
+    assert {row["title"] for row in everything} == {"Tidal Power", "Wave Power"}
+    assert invalid.status_code == 400
+    assert too_large.status_code == 422
+
+
+def test_listings_and_reports_answer_if_none_match_with_304(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    params = {"user_email": EMAIL}
+    try:
+        with _client(store, async_factory) as client:
+            reports_page = client.get("/reports", params=params)
+            topics_page = client.get("/saved_topics", params=params)
+            report = client.get(f"/reports/{handle.report_id}", params=params)
+            reports_etag, topics_etag = reports_page.headers["ETag"], topics_page.headers["ETag"]
+            reports_304 = client.get("/reports", params=params, headers={"If-None-Match": reports_etag})
+            snippet_page = client.get(
+                "/reports", params={**params, "include_content": "snippet"}, headers={"If-None-Match": reports_etag}
+            )
+            topics_304 = client.get("/saved_topics", params=params, headers={"If-None-Match": topics_etag})
+            report_304 = client.get(
+                f"/reports/{handle.report_id}",
+                params=params,
+                headers={"If-None-Match": f'"stale", W/{report.headers["ETag"].removeprefix("W/")}'},
+            )
+            client.post("/saved_topics", params=params, json={"title": "Wave power"})
+            reports_after_write = client.get("/reports", params=params, headers={"If-None-Match": reports_etag})
+            topics_after_write = client.get("/saved_topics", params=params, headers={"If-None-Match": topics_etag})
+    finally:
+        _clear_overrides()
+
+    assert reports_page.headers["Cache-Control"] == "private, no-cache"
+    assert "Last-Modified" in reports_page.headers
+    assert reports_304.status_code == 304
+    assert reports_304.content == b""
+    assert reports_304.headers["ETag"] == reports_etag
+    assert snippet_page.status_code == 200
+    assert topics_304.status_code == 304
+    assert report.headers["ETag"] != reports_etag
+    assert report_304.status_code == 304
+    # Saving a topic changes what both listings would return.
+    assert reports_after_write.status_code == 200
+    assert reports_after_write.headers["ETag"] != reports_etag
+    assert topics_after_write.status_code == 200
+    assert {topic["title"] for topic in topics_after_write.json()} == {"Wave power", "Tidal power"}
+
+
+def test_async_topic_routes_create_list_and_delete(tmp_path: Path):
+    store, handle, async_factory = _seed_store(tmp_path)
+    params = {"user_email": EMAIL}
+    try:
+        with _client(store, async_factory) as client:
+            created = client.post("/saved_topics", params=params, json={"title": "Wave farms"})
+            repeated = client.post("/saved_topics", params=params, json={"title": "Wave farms"})
+            listed = client.get("/saved_topics", params=params)
+            existing_id = next(topic["id"] for topic in listed.json() if topic["title"] == "Tidal power")
+            deleted = client.delete(f"/saved_topics/{existing_id}", params=params)
+            reports_after = client.get("/reports", params=params)
+    finally:
+        _clear_overrides()
+
+    assert created.status_code == 201
+    assert created.json()["slug"] == "wave-farms"
+    assert created.json()["created_at"]
+    assert repeated.json()["id"] == created.json()["id"]
+    assert {topic["title"] for topic in listed.json()} == {"Wave farms", "Tidal power"}
+    assert deleted.status_code == 204
+    assert reports_after.json() == []
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from openai import AsyncOpenAI, OpenAI
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from benchmarks.openai_stub import StubConfig, create_stub_app
+from backend.schemas import GenerateRequest, ModelSpec
+from backend.services.report_service import ReportGeneratorService
+from backend.utils.cassette import Cassette, CassetteMissError
+from backend.utils.openai_client import OpenAITextClient
+
+
+def _recording_client(cassette: Cassette, app) -> OpenAITextClient:
+    return OpenAITextClient(
+        sync_client=OpenAI(api_key="stub", base_url="http://stub/v1"),
+        async_client=AsyncOpenAI(
+            api_key="stub",
+            base_url="http://stub/v1",
+            http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub/v1"),
+        ),
+        cassette=cassette,
+    )
+
+
+def _run_report(service: ReportGeneratorService, request: GenerateRequest):
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    return asyncio.run(collect())
+
+
+def test_recorded_run_replays_offline_with_identical_output(tmp_path: Path):
+    cassette_path = tmp_path / "run.jsonl"
+    request = GenerateRequest.model_validate(
+        {"topic": "Tidal power", "mode": "generate_report", "sections": 2}
+    )
+    app = create_stub_app(StubConfig())
+    recorder = Cassette(cassette_path, "record")
+    recorded = _run_report(
+        ReportGeneratorService(text_client=_recording_client(recorder, app), report_store=None),
+        request,
+    )
+
+    entries = recorder.entries()
+    assert len(entries) == 5
+    assert all(entry["latency_seconds"] >= 0 for entry in entries)
+    assert {entry["api"] for entry in entries} == {"chat"}
+
+    replay_client = OpenAITextClient(cassette=Cassette(cassette_path, "replay"))
+    replayed = _run_report(
+        ReportGeneratorService(text_client=replay_client, report_store=None), request
+    )
+
+    assert replayed[-1]["status"] == "complete"
+    assert replayed[-1]["report"] == recorded[-1]["report"]
+    assert app.state.stats.requests == 5
+
+
+def test_replay_raises_for_unrecorded_requests(tmp_path: Path):
+    cassette_path = tmp_path / "empty.jsonl"
+    cassette_path.write_text("", encoding="utf-8")
+    client = OpenAITextClient(cassette=Cassette(cassette_path, "replay"))
+
+    with pytest.raises(CassetteMissError):
+        client.call_text(ModelSpec(model="gpt-4.1-nano"), "system", "never recorded")
+
+
+def test_replay_reproduces_recorded_latency(tmp_path: Path):
+    cassette_path = tmp_path / "slow.jsonl"
+    spec = ModelSpec(model="gpt-4.1-nano")
+    recorder = Cassette(cassette_path, "record")
+    client = OpenAITextClient(sync_client=object(), async_client=object(), cassette=recorder)
+    client._maybe_record(spec, "system", "prompt", None, "answer", time.perf_counter() - 0.05, "chat")
+
+    replay = OpenAITextClient(cassette=Cassette(cassette_path, "replay", replay_latency=True))
+    started = time.perf_counter()
+    text = asyncio.run(replay.call_text_async(spec, "system", "prompt"))
+
+    assert text == "answer"
+    assert time.perf_counter() - started >= 0.04
+    # Exhausted keys keep serving their last recording.
+    assert replay.call_text(spec, "system", "prompt") == "answer"
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+
+from backend.db import Base, CommitQueue, User, create_engine_from_url, create_session_factory
+
+
+def _file_session_factory(tmp_path: Path, **engine_options):
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path}/explorer.db", **engine_options)
+    Base.metadata.create_all(engine)
+    return engine, create_session_factory(engine)
+
+
+def test_production_profile_enables_wal_and_busy_timeout(tmp_path: Path):
+    engine, _ = _file_session_factory(tmp_path)
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_driver_profile_keeps_sqlite_defaults(tmp_path: Path):
+    engine, _ = _file_session_factory(tmp_path, sqlite_profile="driver")
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    with pytest.raises(ValueError):
+        create_engine_from_url("sqlite+pysqlite:///:memory:", sqlite_profile="turbo")
+
+
+def test_commit_queue_group_commits_queued_writes(tmp_path: Path):
+    _, session_factory = _file_session_factory(tmp_path)
+    commit_queue = CommitQueue(session_factory)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocker(session):
+        started.set()
+        release.wait(timeout=5)
+        session.add(User(email="first@example.com"))
+        return "first"
+
+    def add_user(index):
+        def operation(session):
+            session.add(User(email=f"user{index}@example.com"))
+            return index
+
+        return operation
+
+    try:
+        first = commit_queue.submit(blocker)
+        started.wait(timeout=5)
+        futures = [commit_queue.submit(add_user(index)) for index in range(10)]
+        release.set()
+        assert first.result(timeout=5) == "first"
+        assert [future.result(timeout=5) for future in futures] == list(range(10))
+    finally:
+        commit_queue.close()
+
+    assert commit_queue.operations == 11
+    assert commit_queue.batches == 2
+    with session_factory() as session:
+        assert session.scalar(select(func.count()).select_from(User)) == 11
+
+
+def test_commit_queue_isolates_failing_operation(tmp_path: Path):
+    _, session_factory = _file_session_factory(tmp_path)
+    commit_queue = CommitQueue(session_factory)
+    release = threading.Event()
+
+    def fails(session):
+        session.add(User(email="bad@example.com"))
+        raise RuntimeError("boom")
+
+    try:
+        gate = commit_queue.submit(lambda session: release.wait(timeout=5))
+        good = commit_queue.submit(lambda session: session.add(User(email="good@example.com")))
+        bad = commit_queue.submit(fails)
+        release.set()
+        gate.result(timeout=5)
+        good.result(timeout=5)
+        with pytest.raises(RuntimeError, match="boom"):
+            bad.result(timeout=5)
+    finally:
+        commit_queue.close()
+
+    with session_factory() as session:
+        assert session.scalars(select(User.email)).all() == ["good@example.com"]
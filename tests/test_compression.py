@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import zlib
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import FastAPI, Header, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from backend.api.compression import CompressionMiddleware, available_encodings, negotiate_encoding
+from backend.utils.api_helpers import not_modified
+
+EVENTS = [{"status": "section_ready", "index": index, "body": "Tidal turbines spin. " * 40} for index in range(3)]
+
+
+def _app(**options: Any) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/reports")
+    def reports(response: Response):
+        response.headers["ETag"] = '"listing"'
+        return [{"content": "Tidal power report. " * 200}]
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/revalidated/{size}")
+    def revalidated(size: int, response: Response, if_none_match: str = Header(None)):
+        unchanged = not_modified(response, if_none_match, '"version-1"')
+        if unchanged is not None:
+            return unchanged
+        return {"content": "x" * size}
+
+    @app.get("/stream")
+    def stream():
+        async def events():
+            for event in EVENTS:
+                yield (json.dumps(event) + "\n").encode("utf-8")
+
+        return StreamingResponse(events(), media_type="application/x-ndjson")
+
+    return app
+
+
+def test_negotiate_encoding_honours_quality_values():
+    assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("br;q=0, *", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("identity", ("br", "gzip")) is None
+    assert negotiate_encoding("", ("gzip",)) is None
+    assert available_encodings(["zstd", "gzip"]) == ("gzip",)
+
+
+def test_large_json_is_gzipped_and_small_json_is_not():
+    with TestClient(_app(encodings=["gzip"], minimum_size=1024)) as client:
+        compressed = client.get("/reports", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/reports", headers={"Accept-Encoding": "identity"})
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert compressed.headers["ETag"] == 'W/"listing"'
+    assert int(compressed.headers["Content-Length"]) < len(plain.content) / 10
+    assert compressed.json() == plain.json()
+    assert "Content-Encoding" not in plain.headers
+    assert plain.headers["ETag"] == '"listing"'
+    assert "Content-Encoding" not in small.headers
+
+
+def test_not_modified_carries_the_same_etag_as_the_compressed_response():
+    with TestClient(_app(encodings=["gzip"], minimum_size=1024)) as client:
+        for size in (10, 5000):
+            path = f"/revalidated/{size}"
+            fresh = client.get(path, headers={"Accept-Encoding": "gzip"})
+            revalidated = client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": fresh.headers["ETag"]})
+            assert fresh.headers["ETag"] == 'W/"version-1"'
+            assert revalidated.status_code == 304
+            assert revalidated.headers["ETag"] == fresh.headers["ETag"]
+            assert revalidated.headers["Vary"] == "Accept-Encoding"
+        plain = client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": '"version-1"'})
+
+    assert plain.status_code == 304
+    assert plain.headers["ETag"] == '"version-1"'
+
+
+def test_ndjson_stream_flushes_one_decodable_frame_per_event():
+    app = _app(encodings=["gzip"])
+    messages: List[Dict[str, Any]] = []
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> Dict[str, Any]:
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response is complete.
+        await asyncio.Event().wait()
+
+    async def send(message: Dict[str, Any]) -> None:
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    start, *bodies = messages
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in dict(start["headers"])
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    # Each event decodes completely from its own message, before the stream ends.
+    for event, message in zip(EVENTS, bodies):
+        assert json.loads(decoder.decompress(message["body"])) == event
+    wire = b"".join(message["body"] for message in bodies)
+    assert gzip.decompress(wire).decode("utf-8").splitlines() == [json.dumps(event) for event in EVENTS]
+
+
+def test_brotli_is_preferred_when_installed():
+    brotli = pytest.importorskip("brotli")
+    with TestClient(_app()) as client:
+        with client.stream("GET", "/reports", headers={"Accept-Encoding": "gzip, br"}) as response:
+            raw = b"".join(response.iter_raw())
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(raw))[0]["content"].startswith("Tidal power report.")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from backend.storage import ReportContentCache, content_stats
+
+
+def test_content_stats_are_independent_of_chunking():
+    text = "Tidal Power\n\n1: Basics\n\nTurbines  spin\twith the tide, twice a day."
+    whole = content_stats([text], snippet_chars=30)
+
+    assert whole.snippet == "Tidal Power 1: Basics Turbines"
+    assert whole.word_count == 12
+    assert whole.reading_minutes == 1
+    for size in (1, 2, 3, 7):
+        assert content_stats([text[i : i + size] for i in range(0, len(text), size)], snippet_chars=30) == whole
+    assert content_stats([]).reading_minutes == 0
+
+
+def test_cache_serves_hits_and_rereads_rewritten_files(tmp_path: Path):
+    path = tmp_path / "report.md"
+    path.write_text("first version\n", encoding="utf-8")
+    cache = ReportContentCache(max_bytes=1024)
+
+    assert cache.read(path) == "first version\n"
+    assert cache.read(path) == "first version\n"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    path.write_text("second, longer version\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.read(path) == "second, longer version\n"
+    assert cache.stats(path).word_count == 3
+    assert cache.read(tmp_path / "missing.md") is None
+
+
+def test_cache_evicts_least_recently_used_within_byte_budget(tmp_path: Path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"report-{index}.md"
+        path.write_text(str(index) * 40, encoding="utf-8")
+        paths.append(path)
+    big = tmp_path / "big.md"
+    big.write_text("x" * 500, encoding="utf-8")
+    cache = ReportContentCache(max_bytes=100)
+
+    cache.read(paths[0])
+    cache.read(paths[1])
+    cache.read(paths[0])
+    cache.read(paths[2])
+    assert cache.size == 80
+    assert cache.read(big) == "x" * 500
+    assert cache.size == 80
+
+    misses = cache.misses
+    cache.read(paths[0])
+    cache.read(paths[2])
+    assert cache.misses == misses
+    cache.read(paths[1])
+    assert cache.misses == misses + 1
@@ -7,8 +7,16 @@ from pathlib import Path
 os.environ.setdefault("OPENAI_API_KEY", "test-key")
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from backend.utils.formatting import parse_outline_json
-from backend.schemas import Outline
+import pytest
+
+from backend.utils.formatting import (
+    SubsectionHeadingNormalizer,
+    enforce_subsection_headings,
+    parse_outline_json,
+    parse_outline_markdown,
+    parse_outline_tolerant,
+)
+from backend.schemas import GenerateRequest, Outline
 
 
 def test_parse_outline_json_allows_trailing_text() -> None:
@@ -38,3 +46,137 @@ def test_parse_outline_json_allows_prefixed_codeblock_noise() -> None:
     assert isinstance(outline, Outline)
     assert outline.report_title == "Topic"
     assert outline.sections == []
+
+
+def test_parse_outline_tolerant_repairs_common_shape_drift() -> None:
+    text = """Here you go:
+    ```json
+    {"outline": {"title": “Tides”, "sections": [
+        "1: Basics",
+        {"title": "2: Power", "subsections": [{"title": "2.1: Turbines"}, "2.2: Barrages",]},
+    ]}}
+    ```
+    """
+
+    outline = parse_outline_tolerant(text)
+
+    assert outline.report_title == "Tides"
+    assert [section.title for section in outline.sections] == ["1: Basics", "2: Power"]
+    assert outline.sections[1].subsections == ["2.1: Turbines", "2.2: Barrages"]
+
+
+def test_parse_outline_tolerant_rejects_responses_without_an_outline() -> None:
+    with pytest.raises(ValueError):
+        parse_outline_tolerant('I could not do that. {"error": "refused"}')
+
+
+def test_parse_outline_markdown_reads_heading_outlines() -> None:
+    text = """# Tidal Power
+
+## 1. Basics
+Framing prose is ignored.
+### 1.1 Tides
+#### Too deep to keep
+### 1.2. Currents
+## 2) **Economics**
+### Costs
+"""
+
+    outline = parse_outline_markdown(text)
+
+    assert outline.report_title == "Tidal Power"
+    assert [section.title for section in outline.sections] == ["Basics", "Economics"]
+    assert outline.sections[0].subsections == ["Tides", "Currents"]
+    assert outline.sections[1].subsections == ["Costs"]
+
+
+def test_parse_outline_markdown_reads_numbered_and_keyword_lists() -> None:
+    numbered = """Solar Energy
+1. Intro
+   1.1 Background
+       - detail
+   1.2 Scope
+2. Markets
+   a. Asia
+   b. Europe
+"""
+    keyword = """Title: Wind
+Section 1: Intro
+- History
+Section 2 - Outlook
+"""
+
+    first = parse_outline_markdown(numbered)
+    second = parse_outline_markdown(keyword)
+
+    assert first.report_title == "Solar Energy"
+    assert [(s.title, s.subsections) for s in first.sections] == [
+        ("Intro", ["Background", "Scope"]),
+        ("Markets", ["Asia", "Europe"]),
+    ]
+    assert second.report_title == "Wind"
+    assert [(s.title, s.subsections) for s in second.sections] == [
+        ("Intro", ["History"]),
+        ("Outlook", []),
+    ]
+
+
+def test_parse_outline_markdown_falls_back_to_default_title() -> None:
+    outline = parse_outline_markdown("- Intro\n  - Scope\n- Body\n", default_title="Topic")
+    assert outline.report_title == "Topic"
+    assert [section.title for section in outline.sections] == ["Intro", "Body"]
+
+    with pytest.raises(ValueError):
+        parse_outline_markdown("- Intro\n- Body\n")
+    with pytest.raises(ValueError):
+        parse_outline_markdown("Just a sentence.", default_title="Topic")
+
+
+def test_generate_request_accepts_markdown_outline() -> None:
+    request = GenerateRequest(outline_markdown="# Geo\n## Origins\n## Future\n")
+    assert request.outline is not None
+    assert request.outline.report_title == "Geo"
+    assert len(request.outline.sections) == 2
+
+    with pytest.raises(ValueError):
+        GenerateRequest(outline=request.outline, outline_markdown="# Geo\n## Origins\n")
+
+
+def test_heading_normalizer_matches_full_text_for_any_chunking() -> None:
+    text = (
+        "Intro line\r\n### Draft one\r\n  2. Draft two\rBody\u2028"
+        "### Extra heading stays\n\nTail without newline"
+    )
+    titles = ["1.1: First", "1.2: Second"]
+    expected = "\n".join(
+        [
+            "Intro line",
+            "1.1: First",
+            "  1.2: Second",
+            "Body",
+            "### Extra heading stays",
+            "",
+            "Tail without newline",
+        ]
+    )
+
+    assert enforce_subsection_headings(text, titles) == expected
+    for chunk_size in (1, 2, 3, 7, len(text)):
+        normalizer = SubsectionHeadingNormalizer(titles)
+        pieces = [
+            normalizer.feed(text[start : start + chunk_size])
+            for start in range(0, len(text), chunk_size)
+        ]
+        assert "".join(pieces) + normalizer.close() == expected
+
+
+def test_heading_normalizer_emits_lines_as_they_complete() -> None:
+    normalizer = SubsectionHeadingNormalizer(["1.1: First"])
+
+    assert normalizer.feed("### dra") == ""
+    assert normalizer.feed("ft\r") == ""
+    assert normalizer.feed("\nbody") == "1.1: First"
+    assert normalizer.feed("\n") == "\nbody"
+    assert normalizer.close() == ""
+    with pytest.raises(ValueError):
+        normalizer.feed("more")
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.import_time import DEFAULT_TARGETS, loaded_forbidden_modules, measure_import
+
+
+def test_lightweight_entry_points_skip_heavy_dependencies():
+    for target in DEFAULT_TARGETS:
+        _, loaded = measure_import(target.module)
+        assert loaded_forbidden_modules(loaded, target.forbidden_modules) == [], target.module
+
+
+def test_backend_package_resolves_lazy_attributes():
+    import backend
+    from backend.schemas import GenerateRequest
+    from backend.utils import formatting
+
+    assert backend.GenerateRequest is GenerateRequest
+    assert backend.formatting is formatting
+    assert "maybe_add_reasoning" in dir(backend)
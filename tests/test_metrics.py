@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.api.app import app
+from backend.utils.metrics import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    calls = registry.counter("demo_calls_total", "Calls.", ("model",))
+    latency = registry.histogram("demo_latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    active = registry.gauge("demo_active", "Active.")
+
+    calls.inc(model='gpt "quoted"')
+    calls.inc(2, model='gpt "quoted"')
+    latency.observe(0.05, stage="write")
+    latency.observe(0.5, stage="write")
+    active.inc()
+    active.inc()
+    active.dec()
+
+    text = registry.render()
+
+    assert "# TYPE demo_calls_total counter" in text
+    assert 'demo_calls_total{model="gpt \\"quoted\\""} 3' in text
+    assert 'demo_latency_seconds_bucket{stage="write",le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{stage="write",le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{stage="write",le="+Inf"} 2' in text
+    assert 'demo_latency_seconds_count{stage="write"} 2' in text
+    assert 'demo_latency_seconds_sum{stage="write"} 0.55' in text
+    assert "demo_active 1" in text
+
+
+def test_multiprocess_registry_merges_worker_snapshots(tmp_path: Path):
+    registry = MetricsRegistry(multiprocess_dir=tmp_path)
+    calls = registry.counter("demo_calls_total", "Calls.", ("model",))
+    active = registry.gauge("demo_active", "Active.")
+    calls.inc(model="a")
+    active.set(2)
+
+    # Snapshot left behind by a worker that has since exited.
+    dead_worker = {
+        "pid": 2**22 + 12345,
+        "metrics": {
+            "demo_calls_total": {json.dumps(["a"]): 4.0},
+            "demo_active": {json.dumps([]): 7.0},
+        },
+    }
+    (tmp_path / "metrics-dead.json").write_text(json.dumps(dead_worker), encoding="utf-8")
+
+    text = registry.render()
+
+    assert 'demo_calls_total{model="a"} 5' in text
+    assert "demo_active 2" in text
+    assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
+
+
+def test_multiprocess_snapshot_catches_up_with_the_last_update_of_a_burst(tmp_path: Path):
+    registry = MetricsRegistry(multiprocess_dir=tmp_path, flush_interval=0.1)
+    active = registry.gauge("demo_active", "Active.")
+    snapshot = tmp_path / f"metrics-{os.getpid()}.json"
+
+    def written() -> float:
+        return json.loads(snapshot.read_text(encoding="utf-8"))["metrics"]["demo_active"][json.dumps([])]
+
+    active.inc()
+    active.dec()  # Inside the throttle window: not written yet.
+    assert written() == 1
+
+    deadline = time.monotonic() + 2
+    while written() != 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert written() == 0
+
+
+def test_metrics_endpoint_exposes_pipeline_families():
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for family in (
+        "explorer_stage_duration_seconds",
+        "explorer_llm_calls_total",
+        "explorer_llm_errors_total",
+        "explorer_llm_tokens_total",
+        "explorer_generations_active",
+        "explorer_generations_queued",
+        "explorer_db_session_duration_seconds",
+        "explorer_stream_bytes_sent_total",
+    ):
+        assert f"# TYPE {family} " in response.text
+
+
+def test_generate_report_tracks_stream_bytes_and_generation_gauges():
+    from backend.api.dependencies import get_report_service
+    from backend.utils.metrics import GENERATIONS_ACTIVE, GENERATIONS_QUEUED, STREAM_BYTES
+
+    class FakeReportService:
+        async def stream_report(self, generate_request):
+            assert GENERATIONS_ACTIVE.value() == 1
+            yield {"status": "started"}
+            yield {"status": "complete", "report": "Ready"}
+
+    before = STREAM_BYTES.value(endpoint="generate_report")
+    app.dependency_overrides[get_report_service] = lambda: FakeReportService()
+    try:
+        with TestClient(app) as client:
+            response = client.post("/generate_report", json={"topic": "AI", "mode": "generate_report"})
+    finally:
+        app.dependency_overrides.pop(get_report_service, None)
+
+    assert response.status_code == 200
+    assert STREAM_BYTES.value(endpoint="generate_report") - before == len(response.content)
+    assert GENERATIONS_ACTIVE.value() == 0
+    assert GENERATIONS_QUEUED.value() == 0
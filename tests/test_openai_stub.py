@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from benchmarks.load_test import percentile
+from benchmarks.openai_stub import LatencyDistribution, StubConfig, create_stub_app
+from backend.schemas import GenerateRequest, ModelSpec
+from backend.services.report_service import ReportGeneratorService
+from backend.utils.openai_client import OpenAITextClient
+
+
+def _stub_text_client(app) -> OpenAITextClient:
+    transport = httpx.ASGITransport(app=app)
+    return OpenAITextClient(
+        sync_client=OpenAI(api_key="stub", base_url="http://stub/v1"),
+        async_client=AsyncOpenAI(
+            api_key="stub",
+            base_url="http://stub/v1",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=transport, base_url="http://stub/v1"),
+        ),
+    )
+
+
+def test_stub_server_drives_full_report_pipeline():
+    app = create_stub_app(StubConfig(seed=7))
+    service = ReportGeneratorService(text_client=_stub_text_client(app), report_store=None)
+    request = GenerateRequest.model_validate(
+        {"topic": "Urban farming", "mode": "generate_report", "sections": 2}
+    )
+
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    events = asyncio.run(collect())
+
+    assert events[-1]["status"] == "complete"
+    assert events[-1]["report"].startswith("Urban farming Report")
+    assert "1.2: Detail 2" in events[-1]["report"]
+    # One outline call plus a writer and editor call per section.
+    assert app.state.stats.requests == 5
+
+
+def test_stub_server_streams_chat_and_responses():
+    app = create_stub_app(StubConfig(completion_tokens=5))
+    client = AsyncOpenAI(
+        api_key="stub",
+        base_url="http://stub/v1",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub/v1"),
+    )
+
+    async def run():
+        chat_stream = await client.chat.completions.create(
+            model="stub-model",
+            messages=[{"role": "user", "content": "hello"}],
+            stream=True,
+        )
+        chat_text = "".join([chunk.choices[0].delta.content or "" async for chunk in chat_stream])
+        response = await client.responses.create(model="stub-model", input="hello")
+        return chat_text, response.output_text
+
+    chat_text, response_text = asyncio.run(run())
+
+    assert chat_text.split() == ["analysis", "context", "evidence", "practice", "systems."]
+    assert response_text == chat_text
+
+
+def test_stub_server_injects_rate_limits():
+    app = create_stub_app(StubConfig(rate_limit_rate=1.0, retry_after_seconds=2))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://stub") as client:
+            return await client.post(
+                "/v1/chat/completions",
+                json={"model": "stub-model", "messages": [{"role": "user", "content": "hi"}]},
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "2"
+    assert app.state.stats.rate_limited == 1
+
+
+def test_latency_distribution_parsing_and_percentiles():
+    assert LatencyDistribution.parse("uniform:0.1,0.2").params == (0.1, 0.2)
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile([5, 1, 4, 2, 3], 99) == 5
+    assert percentile([], 50) is None
+    deciles = list(range(1, 11))
+    assert percentile(deciles, 50) == 5
+    assert percentile(deciles, 90) == 9
+    assert percentile(deciles, 100) == 10
+    assert percentile(deciles, 0) == 1
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.db import Base, create_engine_from_url, create_session_factory
+from backend.schemas import GenerateRequest, ModelSpec, Outline, OutlineRequest, Section
+from backend.services.outline_cache import OutlineCache, outline_cache_key
+from backend.services.outline_service import OutlineService
+from backend.services.report_service import ReportGeneratorService
+from backend.storage import GeneratedReportStore
+
+OUTLINE = Outline(
+    report_title="Tidal Power",
+    sections=[Section(title="1: Basics", subsections=["1.1: Tides"])],
+)
+
+
+class CountingTextClient:
+    def __init__(self, response: str = json.dumps(OUTLINE.model_dump())):
+        self.response = response
+        self.calls = 0
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        self.calls += 1
+        return self.response
+
+
+def _request(topic="Tidal power", **overrides) -> OutlineRequest:
+    return OutlineService.build_outline_request(topic, "json", **overrides)
+
+
+def test_cache_key_normalizes_topic_and_filters():
+    base = _request(subject_inclusions=["Energy", "Oceans"])
+    assert outline_cache_key(base) == outline_cache_key(
+        _request("  tidal   POWER ", subject_inclusions=["oceans", "energy"])
+    )
+    assert outline_cache_key(base) != outline_cache_key(_request(subject_inclusions=["Energy"]))
+    assert outline_cache_key(base) != outline_cache_key(
+        _request(subject_inclusions=["Energy", "Oceans"], sections=3)
+    )
+    assert outline_cache_key(base) != outline_cache_key(
+        _request(subject_inclusions=["Energy", "Oceans"], model_spec=ModelSpec(model="gpt-4o"))
+    )
+
+
+def test_cache_evicts_least_recently_used_and_persists(tmp_path: Path):
+    cache = OutlineCache(max_entries=2, directory=tmp_path)
+    cache.put("a", OUTLINE)
+    cache.put("b", OUTLINE)
+    assert cache.get("a") == OUTLINE
+    cache.put("c", OUTLINE)
+    assert list(cache._entries) == ["a", "c"]
+
+    restarted = OutlineCache(max_entries=2, directory=tmp_path)
+    assert restarted.get("b") == OUTLINE
+    assert restarted.get("missing") is None
+    assert (restarted.hits, restarted.misses) == (1, 1)
+
+
+def test_cache_entries_expire_after_ttl(tmp_path: Path, monkeypatch):
+    cache = OutlineCache(directory=tmp_path, ttl_seconds=60)
+    cache.put("key", OUTLINE)
+    import backend.services.outline_cache as outline_cache_module
+
+    real_time = outline_cache_module.time.time
+    monkeypatch.setattr(outline_cache_module.time, "time", lambda: real_time() + 120)
+    assert cache.get("key") is None
+
+
+def test_outline_service_serves_repeat_topics_from_cache():
+    client = CountingTextClient()
+    service = OutlineService(text_client=client, cache=OutlineCache())
+
+    first = asyncio.run(service.generate_outline(_request()))
+    second = asyncio.run(service.generate_outline(_request(" tidal power")))
+
+    assert first == second == OUTLINE
+    assert client.calls == 1
+    second.sections.clear()
+    assert asyncio.run(service.generate_outline(_request())) == OUTLINE
+
+
+def test_generation_reuses_saved_topic_outline(tmp_path: Path):
+    engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    store = GeneratedReportStore(
+        base_dir=tmp_path / "reports", session_factory=create_session_factory(engine)
+    )
+    earlier = GenerateRequest(topic="Tidal power", mode="generate_report")
+    handle = store.prepare_report(earlier, OUTLINE)
+    store.finalize_report(handle, "Tidal Power\n\nBody", [])
+
+    client = CountingTextClient(response="Body text.")
+    service = ReportGeneratorService(
+        outline_service=OutlineService(text_client=client),
+        text_client=client,
+        report_store=store,
+    )
+    request = GenerateRequest(topic="Tidal power", mode="generate_report", reuse_saved_outline=True)
+
+    async def collect(generate_request):
+        return [event async for event in service.stream_report(generate_request)]
+
+    events = asyncio.run(collect(request))
+    statuses = [event["status"] for event in events]
+    assert "using_saved_outline" in statuses
+    assert "generating_outline" not in statuses
+    assert events[-1]["status"] == "complete"
+    assert client.calls == 2  # writer + editor for the single section
+
+    mismatched = request.model_copy(update={"sections": 3})
+    assert store.find_latest_outline(mismatched) == OUTLINE
+    statuses = [event["status"] for event in asyncio.run(collect(mismatched))]
+    assert "using_saved_outline" not in statuses
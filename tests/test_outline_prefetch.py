@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.services.outline_cache import OutlineCache
+from backend.services.outline_prefetch import OutlinePrefetcher
+from backend.services.outline_service import OutlineService
+from backend.services.report_service import ReportGeneratorService
+
+
+class SlowOutlineClient:
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.topics = []
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        if system_prompt == "You generate structured outlines.":
+            self.topics.append(user_prompt)
+            await asyncio.sleep(self.delay)
+            outline = Outline(report_title="Prefetched", sections=[Section(title="1: Intro")])
+            return json.dumps(outline.model_dump())
+        return "Body text."
+
+
+def _service(client) -> OutlineService:
+    return OutlineService(text_client=client, cache=OutlineCache())
+
+
+async def _drain(prefetcher: OutlinePrefetcher, outline_service: OutlineService, topics):
+    for _ in range(200):
+        requests = [prefetcher._outline_request(topic) for topic in topics]
+        if all(outline_service.cached_outline(request) for request in requests):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("prefetch did not finish")
+
+
+def test_prefetched_outline_is_ready_in_first_event_after_click():
+    client = SlowOutlineClient()
+    outline_service = _service(client)
+    prefetcher = OutlinePrefetcher(outline_service, top_n=2, sections=None, load=lambda: 0)
+    report_service = ReportGeneratorService(
+        outline_service=outline_service, text_client=client, report_store=None
+    )
+
+    async def scenario():
+        assert prefetcher.submit(["Tidal power", "Wave energy", "Ignored third"]) == 2
+        await _drain(prefetcher, outline_service, ["Tidal power", "Wave energy"])
+        request = GenerateRequest(topic="Tidal power", mode="generate_report")
+        events = [event async for event in report_service.stream_report(request)]
+        await prefetcher.stop()
+        return events
+
+    events = asyncio.run(scenario())
+    assert [event["status"] for event in events[:2]] == ["started", "outline_ready"]
+    assert events[1]["cached"] is True
+    assert events[-1]["status"] == "complete"
+    assert len(client.topics) == 2
+
+
+def test_web_client_default_payload_hits_prefetched_outline():
+    client = SlowOutlineClient()
+    outline_service = _service(client)
+    prefetcher = OutlinePrefetcher(outline_service, load=lambda: 0)
+    report_service = ReportGeneratorService(
+        outline_service=outline_service, text_client=client, report_store=None
+    )
+    # What the web app sends for a plain click: its default section count,
+    # empty subject filters and the default model for every stage.
+    payload = {
+        "topic": "Tidal power",
+        "mode": "generate_report",
+        "return": "report_with_outline",
+        "sections": 3,
+        "models": {stage: {"model": "gpt-4.1-nano"} for stage in ("outline", "writer", "editor")},
+        "user_email": "reader@example.com",
+        "username": "reader",
+        "subject_exclusions": [],
+        "subject_inclusions": [],
+    }
+
+    async def scenario():
+        prefetcher.submit(["Tidal power"])
+        await _drain(prefetcher, outline_service, ["Tidal power"])
+        request = GenerateRequest.model_validate(payload)
+        events = [event async for event in report_service.stream_report(request)]
+        await prefetcher.stop()
+        return events
+
+    events = asyncio.run(scenario())
+    assert events[1]["status"] == "outline_ready"
+    assert events[1]["cached"] is True
+    assert len(client.topics) == 1
+
+
+def test_prefetch_waits_for_interactive_load_and_respects_budget():
+    client = SlowOutlineClient()
+    outline_service = _service(client)
+    load = {"active": 1}
+    prefetcher = OutlinePrefetcher(
+        outline_service,
+        budget_per_hour=1,
+        top_n=5,
+        load=lambda: load["active"],
+        idle_poll_seconds=0.01,
+    )
+
+    async def scenario():
+        prefetcher.submit(["First topic", "Second topic"])
+        await asyncio.sleep(0.1)
+        assert client.topics == []
+        load["active"] = 0
+        await _drain(prefetcher, outline_service, ["First topic"])
+        await asyncio.sleep(0.05)
+        await prefetcher.stop()
+
+    asyncio.run(scenario())
+    assert len(client.topics) == 1
+    assert outline_service.cached_outline(prefetcher._outline_request("Second topic")) is None
+
+
+def test_click_joins_inflight_prefetch_instead_of_calling_again():
+    client = SlowOutlineClient(delay=0.1)
+    outline_service = _service(client)
+    request = OutlineService.build_outline_request("Tidal power", "json")
+
+    async def scenario():
+        return await asyncio.gather(
+            outline_service.generate_outline(request),
+            outline_service.generate_outline(request),
+        )
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    assert first is not second
+    assert len(client.topics) == 1
+
+
+def test_submit_from_worker_thread_hands_off_to_loop():
+    client = SlowOutlineClient()
+    outline_service = _service(client)
+    prefetcher = OutlinePrefetcher(outline_service, load=lambda: 0)
+
+    async def scenario():
+        prefetcher.start()
+        accepted = await asyncio.to_thread(prefetcher.submit, ["Saved topic"])
+        await _drain(prefetcher, outline_service, ["Saved topic"])
+        await prefetcher.stop()
+        return accepted
+
+    assert asyncio.run(scenario()) == 1
+    assert len(client.topics) == 1
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.api.app import app
+from backend.api.dependencies import get_outline_service
+from backend.schemas import Outline, Section
+from backend.services.outline_cache import OutlineCache
+from backend.services.outline_service import OutlineService
+from backend.utils.concurrency import LLMLimiter
+
+
+class DelayedOutlineClient:
+    """Answers outline prompts after a per-topic delay and tracks concurrency."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        topic = next(topic for topic in self.delays if topic in user_prompt)
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays[topic])
+        finally:
+            self.active -= 1
+        if topic == "Broken":
+            return "no outline here"
+        outline = Outline(report_title=topic, sections=[Section(title="1: Intro", subsections=[])])
+        return json.dumps(outline.model_dump())
+
+
+def _client(service: OutlineService) -> TestClient:
+    app.dependency_overrides[get_outline_service] = lambda: service
+    return TestClient(app)
+
+
+def test_outline_endpoint_returns_outline_and_uses_cache():
+    fake = DelayedOutlineClient({"Tidal power": 0})
+    service = OutlineService(text_client=fake, cache=OutlineCache())
+    try:
+        with _client(service) as client:
+            first = client.post("/outline", json={"topic": "Tidal power"})
+            second = client.post("/outline", json={"topic": "tidal  power"})
+    finally:
+        app.dependency_overrides.pop(get_outline_service, None)
+
+    assert first.status_code == 200
+    assert first.json()["report_title"] == "Tidal power"
+    assert second.json() == first.json()
+    assert fake.calls == 1
+
+
+def test_batch_streams_in_completion_order_under_concurrency_cap():
+    delays = {"Slow topic": 0.3, "Broken": 0.05, "Fast topic": 0.01, "Medium topic": 0.1}
+    fake = DelayedOutlineClient(delays)
+    service = OutlineService(text_client=fake, cache=OutlineCache(), repair_attempts=0)
+    payload = {"topics": list(delays), "concurrency": 2}
+    try:
+        with _client(service) as client:
+            response = client.post("/outlines/batch", json=payload)
+    finally:
+        app.dependency_overrides.pop(get_outline_service, None)
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event.get("topic") for event in events[:-1]] == [
+        "Broken",
+        "Fast topic",
+        "Medium topic",
+        "Slow topic",
+    ]
+    assert events[0]["status"] == "error"
+    assert events[1]["result"]["report_title"] == "Fast topic"
+    assert events[-1] == {"status": "done", "total": 4, "failed": 1}
+    assert fake.peak == 2
+
+
+def test_batch_rejects_blank_topics():
+    with TestClient(app) as client:
+        response = client.post("/outlines/batch", json={"topics": ["ok", "  "]})
+    assert response.status_code == 422
+
+
+def test_llm_limiter_caps_concurrent_calls():
+    limiter = LLMLimiter(limit=2)
+    state = {"active": 0, "peak": 0}
+
+    async def call():
+        async with limiter.acquire():
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+    asyncio.run(scenario())  # a fresh loop gets its own semaphore
+    assert state["peak"] == 2
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.schemas import ModelSpec
+from backend.services.outline_service import OutlineParsingError, OutlineService
+from backend.utils.metrics import OUTLINE_PARSE_RETRIES
+from backend.utils.model_utils import supports_structured_output
+from backend.utils.openai_client import _build_chat_kwargs, _build_response_kwargs
+
+VALID_OUTLINE = json.dumps({"report_title": "Tides", "sections": [{"title": "1: Basics", "subsections": []}]})
+
+
+class ScriptedTextClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        self.calls.append({"model": model_spec, "prompt": user_prompt, "response_format": response_format})
+        return self.responses.pop(0)
+
+
+def _generate(client, model="gpt-4.1-nano", **kwargs):
+    service = OutlineService(text_client=client, **kwargs)
+    request = OutlineService.build_outline_request(
+        "Tides", "json", model_spec=ModelSpec(model=model, reasoning_effort="high")
+    )
+    return asyncio.run(service.generate_outline(request))
+
+
+def test_structured_output_schema_is_requested_when_supported(monkeypatch):
+    client = ScriptedTextClient([VALID_OUTLINE, VALID_OUTLINE])
+    _generate(client)
+    response_format = client.calls[0]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["strict"] is True
+
+    _generate(client, model="gpt-3.5-turbo")
+    assert client.calls[1]["response_format"] is None
+
+    monkeypatch.setenv("EXPLORER_STRUCTURED_OUTPUTS", "0")
+    assert not supports_structured_output("gpt-4.1-nano")
+
+
+def test_response_format_is_translated_for_both_apis():
+    spec = ModelSpec(model="gpt-4.1-nano")
+    response_format = {"type": "json_schema", "json_schema": {"name": "x", "schema": {}, "strict": True}}
+    assert _build_chat_kwargs(spec, "s", "u", None, response_format)["response_format"] == response_format
+    assert _build_response_kwargs(spec, "s", "u", None, response_format)["text"] == {
+        "format": {"type": "json_schema", "name": "x", "schema": {}, "strict": True}
+    }
+    assert "text" not in _build_response_kwargs(spec, "s", "u", None)
+
+
+def test_unparseable_outline_is_repaired_with_a_cheap_reask():
+    before = OUTLINE_PARSE_RETRIES.value(strategy="reask", outcome="success")
+    client = ScriptedTextClient(["not json at all", VALID_OUTLINE])
+
+    outline = _generate(client)
+
+    assert outline.report_title == "Tides"
+    assert len(client.calls) == 2
+    reask = client.calls[1]
+    assert "not json at all" in reask["prompt"]
+    assert reask["model"].reasoning_effort is None
+    assert OUTLINE_PARSE_RETRIES.value(strategy="reask", outcome="success") == before + 1
+
+
+def test_tolerant_extraction_runs_after_failed_reasks():
+    drifted = '```json\n{"title": "Tides", "sections": ["1: Basics",]}\n```'
+    client = ScriptedTextClient([drifted, "still broken"])
+
+    outline = _generate(client)
+
+    assert [section.title for section in outline.sections] == ["1: Basics"]
+    assert len(client.calls) == 2
+
+
+def test_outline_errors_once_repair_budget_is_spent():
+    client = ScriptedTextClient(["nope", "still nope", "never asked"])
+
+    with pytest.raises(OutlineParsingError):
+        _generate(client, repair_attempts=1)
+    assert len(client.calls) == 2
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.api.app import app
+from backend.api.dependencies import get_report_service
+from backend.db import Base, create_engine_from_url, create_session_factory
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.services.report_service import ReportGeneratorService
+from backend.storage import GeneratedReportStore
+from backend.utils.profiling import SamplingProfiler
+
+
+class SleepyTextClient:
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        await asyncio.sleep(0.05)
+        return "Body text."
+
+
+def test_sampling_profiler_separates_idle_loop_from_python_work():
+    async def workload():
+        await asyncio.sleep(0.1)
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+
+    profiler = SamplingProfiler(interval=0.002).start()
+    asyncio.run(workload())
+    result = profiler.stop()
+
+    breakdown = result.breakdown()
+    assert breakdown["samples"] > 10
+    assert 10 < breakdown["loop_idle_pct"] < 90
+    assert "test_profiling.py:workload" in result.folded()
+
+
+def test_sampling_profiler_counts_uvloop_wait_as_idle():
+    uvloop = pytest.importorskip("uvloop")
+
+    async def workload():
+        profiler = SamplingProfiler(interval=0.002).start()
+        await asyncio.sleep(0.2)
+        return profiler.stop()
+
+    breakdown = uvloop.run(workload()).breakdown()
+    assert breakdown["samples"] > 10
+    assert breakdown["loop_idle_pct"] > 90
+
+
+def test_profiled_run_saves_profile_next_to_report(tmp_path: Path):
+    engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    store = GeneratedReportStore(
+        base_dir=tmp_path / "reports", session_factory=create_session_factory(engine)
+    )
+    service = ReportGeneratorService(
+        outline_service=object(), text_client=SleepyTextClient(), report_store=store
+    )
+    request = GenerateRequest(
+        topic="Profiling",
+        mode="generate_report",
+        outline=Outline(report_title="Profiling", sections=[Section(title="1: Intro", subsections=[])]),
+    )
+
+    async def collect():
+        return [event async for event in service.stream_report(request, profile=True)]
+
+    final = asyncio.run(collect())[-1]
+    assert final["status"] == "complete"
+    profile = final["profile"]
+    assert profile["samples"] > 0
+    assert profile["llm_wait_ms"] >= 100
+    summary_path = store.base_dir / profile["uri"]
+    assert summary_path.name == "profile.json"
+    assert json.loads(summary_path.read_text())["loop_idle_pct"] == profile["loop_idle_pct"]
+    assert (store.base_dir / profile["folded_uri"]).read_text().strip()
+
+
+def test_profile_option_requires_admin_token(monkeypatch):
+    class FakeReportService:
+        def __init__(self):
+            self.profile_flags = []
+
+        async def stream_report(self, generate_request, *, profile=False):
+            self.profile_flags.append(profile)
+            yield {"status": "complete"}
+
+    fake = FakeReportService()
+    monkeypatch.setenv("EXPLORER_ADMIN_TOKEN", "secret")
+    app.dependency_overrides[get_report_service] = lambda: fake
+    payload = {"topic": "Anything", "mode": "generate_report"}
+    try:
+        with TestClient(app) as client:
+            denied = client.post("/generate_report?profile=true", json=payload)
+            wrong = client.post(
+                "/generate_report?profile=true",
+                json=payload,
+                headers={"X-Explorer-Admin-Token": "nope"},
+            )
+            allowed = client.post(
+                "/generate_report?profile=true",
+                json=payload,
+                headers={"X-Explorer-Admin-Token": "secret"},
+            )
+    finally:
+        app.dependency_overrides.pop(get_report_service, None)
+
+    assert denied.status_code == 403
+    assert wrong.status_code == 403
+    assert allowed.status_code == 200
+    assert fake.profile_flags == [True]
@@ -32,7 +32,7 @@ class StubTextClient:
         self._responses = list(responses)
         self.calls = []
 
-    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None):
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
         self.calls.append((model_spec.model, system_prompt, user_prompt))
         if not self._responses:
             raise AssertionError("No more stubbed responses available")
@@ -61,7 +61,7 @@ class NoopReportStore:
     def prepare_report(self, request, outline):
         return self._handle
 
-    def finalize_report(self, handle, narration, written_sections, summary=None):
+    def finalize_report(self, handle, narration, written_sections, summary=None, timings=None):
         return None
 
     def discard_report(self, handle):
@@ -289,6 +289,46 @@ def test_report_generator_processes_multiple_sections_with_minimal_outline():
     assert len(stub_text_client.calls) == max_sections * 2
 
 
+def test_report_generator_events_carry_timing_trace():
+    outline = Outline(
+        report_title="Insights",
+        sections=[
+            Section(title="Background", subsections=["Overview"]),
+            Section(title="Outlook", subsections=["Next steps"]),
+        ],
+    )
+    stub_text_client = StubTextClient(
+        [
+            "### Overview\nWriter body",
+            "### Overview\nEdited body",
+            "### Next steps\nWriter body",
+            "### Next steps\nEdited body",
+        ]
+    )
+    service = ReportGeneratorService(
+        outline_service=DummyOutlineService(),
+        text_client=stub_text_client,
+        report_store=NoopReportStore(),
+    )
+    request = GenerateRequest.model_validate({"outline": outline.model_dump()})
+
+    async def collect_events():
+        return [event async for event in service.stream_report(request)]
+
+    events = asyncio.run(collect_events())
+
+    elapsed = [event["elapsed_ms"] for event in events]
+    assert elapsed == sorted(elapsed)
+    timings = events[-1]["timings"]
+    assert set(timings["stages"]) == {"prepare_storage_ms", "sections_ms", "persist_ms"}
+    assert [section["title"] for section in timings["sections"]] == ["1: Background", "2: Outlook"]
+    for section in timings["sections"]:
+        assert section["write_attempts"] == 1
+        assert section["llm_ms"] == pytest.approx(section["write_ms"] + section["edit_ms"], abs=0.01)
+        assert section["queue_wait_ms"] >= 0
+    assert timings["total_ms"] >= timings["stages"]["sections_ms"]
+
+
 def test_generate_report_endpoint_streams_events():
     class FakeReportGeneratorService:
         def __init__(self, events, delay_between_events=0.0):
@@ -415,3 +455,55 @@ def test_report_generator_streams_with_live_openai():
     outline_used = final_event["outline_used"]
     assert outline_used["report_title"] == final_event["report_title"]
     assert len(outline_used["sections"]) <= max_sections
+
+
+def test_reference_return_streams_sections_and_matches_stored_report(tmp_path: Path):
+    from backend.db import Base, create_engine_from_url, create_session_factory
+    from backend.storage import GeneratedReportStore
+    from cli.stream_report import _prepare_final_report
+
+    engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    store = GeneratedReportStore(
+        base_dir=tmp_path / "reports", session_factory=create_session_factory(engine)
+    )
+    outline = Outline(
+        report_title="Insights",
+        sections=[
+            Section(title="Background", subsections=["Overview"]),
+            Section(title="Outlook", subsections=[]),
+        ],
+    )
+    service = ReportGeneratorService(
+        outline_service=DummyOutlineService(),
+        text_client=StubTextClient(
+            ["### Overview\nDraft", "### Overview\nEdited café", "Draft two", "Edited two"]
+        ),
+        report_store=store,
+    )
+    request = GenerateRequest.model_validate(
+        {"outline": outline.model_dump(), "return": "reference"}
+    )
+
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    events = asyncio.run(collect())
+    sections = [event for event in events if event["status"] == "section_complete"]
+    final = events[-1]
+
+    assert [(event["index"], event["body"]) for event in sections] == [
+        (1, "1.1: Overview\nEdited café"),
+        (2, "Edited two"),
+    ]
+    assert final["status"] == "complete"
+    assert "report" not in final
+    stored = (store.base_dir / final["content_uri"]).read_bytes()
+    assert final["byte_size"] == len(stored)
+    assert final["report_id"]
+    assert final["content_hash"].startswith("sha256:")
+    assert _prepare_final_report(final, list(reversed(sections))).encode("utf-8") == stored
+
+    tampered = dict(sections[0], body="changed")
+    with pytest.raises(SystemExit):
+        _prepare_final_report(final, [tampered, sections[1]])
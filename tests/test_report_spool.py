@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.db import Base, Report, create_engine_from_url, create_session_factory
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.services.report_service import ReportGeneratorService
+from backend.services.report_state import ReportAssembly
+from backend.storage import GeneratedReportStore, ReportSpool, encode_report_content
+
+
+class EchoTextClient:
+    def __init__(self, fail_on_call: int | None = None):
+        self.calls = 0
+        self.fail_on_call = fail_on_call
+
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("editor boom")
+        return f"Body {self.calls} — naïve"
+
+
+def _store(tmp_path: Path) -> GeneratedReportStore:
+    engine = create_engine_from_url("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return GeneratedReportStore(
+        base_dir=tmp_path / "reports",
+        session_factory=create_session_factory(engine),
+        spool_sections=True,
+    )
+
+
+def test_spool_matches_in_memory_assembly_bytes(tmp_path: Path):
+    sections = [("1: Intro", "Body — one"), ("2: Empty", ""), ("3: Last", "Tail\n\nparagraph"), ("4: Blank", "")]
+    spool = ReportSpool(tmp_path / "report.md", "  Title  ")
+    memory = ReportAssembly("  Title  ")
+    for title, body in sections:
+        spooled = spool.append(title, body)
+        memory.append(title, body)
+        assert spool.read_body(spooled) == body
+
+    assert spool.partial_path.exists()
+    spool.commit()
+
+    expected = encode_report_content(memory.text())
+    assert (tmp_path / "report.md").read_bytes() == expected
+    assert not spool.partial_path.exists()
+    assert spool.byte_size == len(expected)
+    assert [section.body for section in spool] == [body for _, body in sections]
+    assert spool.text() == memory.text().strip()
+
+
+def test_spool_discard_removes_partial_file(tmp_path: Path):
+    spool = ReportSpool(tmp_path / "report.md", "Title")
+    spool.append("1: Intro", "Body")
+    spool.discard()
+    assert not spool.partial_path.exists()
+    assert not (tmp_path / "report.md").exists()
+
+
+def test_runner_spools_sections_and_stores_offsets(tmp_path: Path):
+    store = _store(tmp_path)
+    service = ReportGeneratorService(
+        outline_service=object(), text_client=EchoTextClient(), report_store=store
+    )
+    outline = Outline(
+        report_title="Spooled",
+        sections=[Section(title="Intro", subsections=[]), Section(title="Outlook", subsections=[])],
+    )
+    request = GenerateRequest(outline=outline)
+
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    final = asyncio.run(collect())[-1]
+
+    assert final["status"] == "complete"
+    with store._session_factory() as session:
+        report = session.query(Report).one()
+        content_path = store.base_dir / report.content_uri
+        written = [
+            (section.title, section.byte_offset, section.byte_size, section.body)
+            for section in report.written_sections
+        ]
+    content = content_path.read_bytes()
+    assert content == encode_report_content(final["report"])
+    assert [title for title, *_ in written] == ["1: Intro", "2: Outlook"]
+    _, offset, length, body = written[0]
+    assert content[offset : offset + length].decode("utf-8") == "Body 2 — naïve"
+    assert body is None
+    assert not list(store.base_dir.rglob("*.partial"))
+
+
+def test_runner_failure_leaves_no_partial_file(tmp_path: Path):
+    store = _store(tmp_path)
+    service = ReportGeneratorService(
+        outline_service=object(), text_client=EchoTextClient(fail_on_call=4), report_store=store
+    )
+    outline = Outline(
+        report_title="Spooled",
+        sections=[Section(title="Intro", subsections=[]), Section(title="Outlook", subsections=[])],
+    )
+
+    async def collect():
+        return [event async for event in service.stream_report(GenerateRequest(outline=outline))]
+
+    events = asyncio.run(collect())
+
+    assert events[-1]["status"] == "error"
+    assert not list(store.base_dir.rglob("*.partial"))
+    assert not list(store.base_dir.rglob("report.md"))
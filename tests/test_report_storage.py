@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from backend.db import (
     Base,
@@ -56,7 +56,10 @@ def test_generated_report_store_persists_artifacts(tmp_path: Path):
         assert stored.status is ReportStatus.COMPLETE
         assert stored.summary is None
         assert stored.content_uri.endswith("report.md")
-        assert stored.sections["written"][0]["title"] == "1: Introduction"
+        assert [(section.title, section.body) for section in stored.written_sections] == [
+            ("1: Introduction", "1.1: Framing")
+        ]
+        assert stored.written_sections[0].byte_size == len("1.1: Framing")
 
 
 def test_generated_report_store_discards_failed_reports(tmp_path: Path):
@@ -223,3 +226,24 @@ def test_prepare_report_limits_outline_title_length(tmp_path: Path):
     handle = store.prepare_report(request, outline)
     topic = _fetch_saved_topic(session_factory, handle.report_id)
     assert topic.title == long_title[:255]
+
+
+def test_finalize_report_persists_queryable_timing_trace(tmp_path: Path):
+    session_factory = _session_factory()
+    store = GeneratedReportStore(base_dir=tmp_path / "reports", session_factory=session_factory)
+    outline = Outline(report_title="Timed", sections=[])
+    request = GenerateRequest.model_validate({"topic": "Timed topic", "mode": "generate_report"})
+
+    handle = store.prepare_report(request, outline)
+    timings = {"total_ms": 1234.5, "stages": {"outline_ms": 200.0}, "sections": []}
+    store.finalize_report(handle, "Timed\n\nBody", [], timings=timings)
+
+    with session_scope(session_factory) as session:
+        stored = session.get(Report, handle.report_id)
+        assert stored.timings["stages"]["outline_ms"] == 200.0
+        assert stored.timings["stages"]["persist_ms"] >= 0
+        total = session.execute(
+            text("SELECT json_extract(timings, '$.total_ms') FROM reports WHERE id = :id"),
+            {"id": str(handle.report_id)},
+        ).scalar_one()
+        assert total == 1234.5
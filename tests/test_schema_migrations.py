@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import json
+import re
 import uuid
 from pathlib import Path
 
-from sqlalchemy import inspect, text
+import pytest
+from sqlalchemy import inspect, select, text
 
-from backend.db.models import Base
-from backend.db.schema_migrations import ensure_lightweight_schema
-from backend.db.session import create_engine_from_url
+from backend.db import schema_migrations
+from backend.db.models import Base, Report, ReportSection
+from backend.db.schema_migrations import RebuildProgress, ensure_lightweight_schema, ensure_schema, schema_version
+from backend.db.session import create_engine_from_url, dispose_engines, get_engine
 
 
 def _legacy_sqlite_url(db_path: Path) -> str:
@@ -37,6 +41,8 @@ def test_ensure_lightweight_schema_rebuilds_legacy_tables(tmp_path: Path):
         "status",
         "last_login_at",
         "usage_counters",
+        "content_version",
+        "content_changed_at",
         "created_at",
         "updated_at",
     ]
@@ -51,7 +57,10 @@ def test_ensure_lightweight_schema_rebuilds_legacy_tables(tmp_path: Path):
         "language",
         "output_format",
         "content_uri",
+        "content_hash",
         "summary",
+        "snippet",
+        "word_count",
         "sections",
         "source_references",
         "model_versions",
@@ -64,6 +73,7 @@ def test_ensure_lightweight_schema_rebuilds_legacy_tables(tmp_path: Path):
         "token_count",
         "generated_started_at",
         "generated_completed_at",
+        "timings",
         "published_at",
         "last_accessed_at",
         "created_at",
@@ -76,6 +86,153 @@ def test_ensure_lightweight_schema_rebuilds_legacy_tables(tmp_path: Path):
         assert row.username == row.full_name == "Legacy Owner"
 
 
+def test_ensure_schema_migrates_legacy_tables_and_stamps_version(tmp_path: Path, monkeypatch):
+    engine = create_engine_from_url(_legacy_sqlite_url(tmp_path / "legacy.db"))
+    _create_legacy_schema(engine)
+
+    assert ensure_schema(engine) is True
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == schema_version()
+        assert conn.execute(text("SELECT username FROM users")).scalar() == "Legacy Owner"
+    assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+
+    def fail_inspection(_engine):
+        raise AssertionError("stamped schemas must not be inspected")
+
+    monkeypatch.setattr(schema_migrations, "_migrate_legacy_tables", fail_inspection)
+    assert ensure_schema(engine) is False
+    ensure_lightweight_schema(engine)
+
+
+def test_get_engine_shares_one_engine_per_url(tmp_path: Path):
+    url = _legacy_sqlite_url(tmp_path / "shared.db")
+    try:
+        engine = get_engine(url)
+        assert get_engine(url) is engine
+        assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+    finally:
+        dispose_engines()
+    assert get_engine(url) is not engine
+    dispose_engines()
+
+
+def test_batched_rebuild_resumes_after_interruption_and_mirrors_writes(tmp_path: Path):
+    engine = create_engine_from_url(_legacy_sqlite_url(tmp_path / "legacy.db"))
+    _create_legacy_schema(engine)
+    _add_legacy_users(engine, 6)
+    events = []
+
+    def interrupt_after_first_batch(update: RebuildProgress):
+        events.append(update)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        ensure_schema(engine, mode="batched", batch_rows=2, progress=interrupt_after_first_batch)
+    assert events == [RebuildProgress(table="users", copied=2, total=7)]
+    with engine.begin() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == 0
+        # Writes to the legacy table during the copy reach the new table through triggers.
+        conn.execute(
+            text(
+                "UPDATE users SET full_name = 'Renamed' WHERE id = "
+                "(SELECT id FROM users WHERE email LIKE 'user%' ORDER BY id LIMIT 1)"
+            )
+        )
+        # Highest key of the added users, so the row has not been copied yet.
+        conn.execute(
+            text(
+                "DELETE FROM users WHERE id = "
+                "(SELECT id FROM users WHERE email LIKE 'user%' ORDER BY id DESC LIMIT 1)"
+            )
+        )
+
+    # A later start resumes the batched rebuild even though the default mode is inline.
+    events.clear()
+    assert ensure_schema(engine, batch_rows=2, progress=events.append) is True
+
+    assert [event.copied for event in events if event.table == "users"] == [4, 6, 6]
+    assert events[-1].done
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == schema_version()
+        assert conn.execute(text("SELECT count(*) FROM users")).scalar() == 6
+        assert conn.execute(text("SELECT count(*) FROM _schema_rebuild_progress")).scalar() == 0
+        renamed = conn.execute(text("SELECT full_name, username FROM users WHERE full_name = 'Renamed'")).all()
+    assert [tuple(row) for row in renamed] == [("Renamed", "Renamed")]
+    assert "users__rebuild" not in inspect(engine).get_table_names()
+    assert {index["name"] for index in inspect(engine).get_indexes("users")} == {"ix_users_status"}
+    assert [column["name"] for column in inspect(engine).get_columns("reports")][-1] == "is_deleted"
+
+
+def test_migration_mode_off_leaves_legacy_tables_unstamped(tmp_path: Path):
+    engine = create_engine_from_url(_legacy_sqlite_url(tmp_path / "legacy.db"))
+    _create_legacy_schema(engine)
+
+    assert ensure_schema(engine, mode="off") is True
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == 0
+    assert "username" not in {column["name"] for column in inspect(engine).get_columns("users")}
+
+
+def test_inline_rebuild_replaces_indexes_of_the_legacy_table(tmp_path: Path):
+    engine = create_engine_from_url(_legacy_sqlite_url(tmp_path / "legacy.db"))
+    _create_legacy_schema(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE INDEX ix_users_status ON users (status)")
+
+    ensure_lightweight_schema(engine, mode="inline")
+
+    assert {index["name"] for index in inspect(engine).get_indexes("users")} == {"ix_users_status"}
+    assert "username" in {column["name"] for column in inspect(engine).get_columns("users")}
+
+
+def test_ensure_schema_moves_written_sections_out_of_reports(tmp_path: Path):
+    engine = create_engine_from_url(_legacy_sqlite_url(tmp_path / "legacy.db"), migrate=False)
+    _create_legacy_schema(engine)
+    outline = {"report_title": "Legacy", "sections": [{"title": "1: Intro", "subsections": []}]}
+    written = [{"title": "1: Intro", "body": "Body — one"}, {"title": "2: Spooled", "offset": 40, "length": 12}]
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE reports SET sections = :sections"),
+            {"sections": json.dumps({"outline": outline, "written": written})},
+        )
+
+    assert ensure_schema(engine) is True
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text('SELECT "index", title, body, byte_offset, byte_size FROM report_sections ORDER BY "index"')
+        ).all()
+        sections, snapshot = conn.execute(text("SELECT sections, outline_snapshot FROM reports")).one()
+        report_sql = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'reports'")).scalar()
+    assert [tuple(row) for row in rows] == [
+        (0, "1: Intro", "Body — one", None, len("Body — one".encode("utf-8"))),
+        (1, "2: Spooled", None, 40, 12),
+    ]
+    assert json.loads(sections) == {}
+    assert json.loads(snapshot) == outline
+    assert "__legacy" not in report_sql
+
+
+def test_report_listing_query_skips_large_columns():
+    loaded = set(re.findall(r"reports\.(\w+)", str(select(Report))))
+
+    assert "outline_snapshot" in loaded
+    assert loaded.isdisjoint({"sections", "timings", "embedding", "source_references"})
+    assert "report_sections.body" not in str(select(ReportSection))
+
+
+def _add_legacy_users(engine, count):
+    with engine.begin() as conn:
+        for index in range(count):
+            conn.exec_driver_sql(
+                """
+                INSERT INTO users (id, email, full_name, status, created_at, updated_at, is_deleted)
+                VALUES (?, ?, ?, 'active', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+                """,
+                (str(uuid.uuid4()), f"user{index}@example.com", f"User {index}"),
+            )
+
+
 def _create_legacy_schema(engine):
     user_id = str(uuid.uuid4())
     topic_id = str(uuid.uuid4())
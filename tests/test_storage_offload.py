@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.db import Base, create_engine_from_url, create_session_factory
+from backend.schemas import GenerateRequest, Outline, Section
+from backend.services.report_service import ReportGeneratorService
+from backend.storage import GeneratedReportStore, StorageExecutor
+
+STORAGE_DELAY = 0.15
+
+
+class SlowDiskReportStore(GeneratedReportStore):
+    """Every store operation blocks its thread, like a saturated disk or DB."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def _slow(self):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(STORAGE_DELAY)
+
+    def prepare_report(self, request, outline):
+        self._slow()
+        return super().prepare_report(request, outline)
+
+    def open_spool(self, handle, report_title):
+        self._slow()
+        return super().open_spool(handle, report_title)
+
+    def finalize_spooled_report(self, handle, spool, summary=None, timings=None):
+        self._slow()
+        return super().finalize_spooled_report(handle, spool, summary=summary, timings=timings)
+
+
+class QuickTextClient:
+    async def call_text_async(self, model_spec, system_prompt, user_prompt, style_hint=None, response_format=None):
+        await asyncio.sleep(0.005)
+        return "Body text."
+
+
+def test_slow_storage_does_not_stall_other_streams(tmp_path: Path):
+    engine = create_engine_from_url(f"sqlite+pysqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    store = SlowDiskReportStore(
+        base_dir=tmp_path / "reports",
+        session_factory=create_session_factory(engine),
+        spool_sections=True,
+    )
+    executor = StorageExecutor(max_workers=4)
+    service = ReportGeneratorService(
+        outline_service=object(),
+        text_client=QuickTextClient(),
+        report_store=store,
+        storage_executor=executor,
+    )
+    outline = Outline(
+        report_title="Lag",
+        sections=[Section(title="Intro", subsections=[]), Section(title="Outlook", subsections=[])],
+    )
+    request = GenerateRequest(outline=outline)
+    streams = 8
+
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    async def scenario():
+        lags = []
+        done = asyncio.Event()
+
+        async def ticker():
+            while not done.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - started - 0.01)
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(collect() for _ in range(streams)))
+        done.set()
+        await ticking
+        return results, lags
+
+    # A full collection of earlier tests' garbage would otherwise land in the lag window.
+    gc.collect()
+    started = time.perf_counter()
+    try:
+        results, lags = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+    elapsed = time.perf_counter() - started
+
+    assert all(events[-1]["status"] == "complete" for events in results)
+    # 8 streams x 3 slow calls would block the loop for 3.6 s if run inline.
+    assert max(lags) < STORAGE_DELAY / 2
+    assert elapsed < streams * 3 * STORAGE_DELAY
+    assert store.threads and all(name.startswith("explorer-storage") for name in store.threads)
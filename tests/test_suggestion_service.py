@@ -33,13 +33,12 @@ def test_load_report_headings_collects_all_subsections():
             saved_topic=topic,
             owner=user,
             status=ReportStatus.COMPLETE,
-            sections={
-                "outline": {
-                    "sections": [
-                        {"title": "Section One", "subsections": ["First A", "First B"]},
-                        {"title": "Section Two", "subsections": ["Second A"]},
-                    ]
-                }
+            outline_snapshot={
+                "report_title": "Seeded",
+                "sections": [
+                    {"title": "Section One", "subsections": ["First A", "First B"]},
+                    {"title": "Section Two", "subsections": ["Second A"]},
+                ],
             },
         )
         session.add(report)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from benchmarks.openai_stub import StubConfig, create_stub_app
+from backend.schemas import GenerateRequest
+from backend.services.report_service import ReportGeneratorService
+from backend.utils import tracing
+from backend.utils.openai_client import OpenAITextClient
+from backend.utils.tracing import (
+    NOOP_SPAN,
+    JsonlSpanExporter,
+    Tracer,
+    read_spans,
+    to_chrome_trace,
+)
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path):
+    path = tmp_path / "spans.jsonl"
+    tracing.set_tracer(Tracer(JsonlSpanExporter(path)))
+    try:
+        yield path
+    finally:
+        tracing.set_tracer(None)
+
+
+def _stub_client() -> OpenAITextClient:
+    app = create_stub_app(StubConfig())
+    return OpenAITextClient(
+        sync_client=None,
+        async_client=AsyncOpenAI(
+            api_key="stub",
+            base_url="http://stub/v1",
+            http_client=httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://stub/v1"
+            ),
+        ),
+    )
+
+
+def test_generation_run_exports_nested_spans(trace_file: Path):
+    request = GenerateRequest.model_validate(
+        {"topic": "Tidal power", "mode": "generate_report", "sections": 2}
+    )
+    service = ReportGeneratorService(text_client=_stub_client(), report_store=None)
+
+    async def collect():
+        return [event async for event in service.stream_report(request)]
+
+    events = asyncio.run(collect())
+    assert events[-1]["status"] == "complete"
+
+    spans = read_spans(trace_file)
+    by_id = {span["span_id"]: span for span in spans}
+    names = [span["name"] for span in spans]
+    assert names.count("report.generate") == 1
+    assert names.count("report.section") == 2
+    assert names.count("llm.call") == 5
+    assert len({span["trace_id"] for span in spans}) == 1
+
+    def parent_name(span):
+        return by_id[span["parent_span_id"]]["name"]
+
+    root = next(span for span in spans if span["name"] == "report.generate")
+    assert root["parent_span_id"] is None
+    assert root["attributes"]["sections_written"] == 2
+    for span in spans:
+        if span["name"] == "llm.call":
+            assert parent_name(span) in {
+                "outline.generate",
+                "report.section.write",
+                "report.section.edit",
+            }
+            assert span["attributes"]["prompt_bytes"] > 0
+            assert span["attributes"]["cache_hit"] is False
+            assert span["attributes"]["retry_count"] == 0
+            assert span["attributes"]["completion_tokens"] > 0
+        elif span["name"] in {"report.section.write", "report.section.edit"}:
+            assert parent_name(span) == "report.section"
+        elif span["name"] == "outline.generate":
+            assert parent_name(span) == "report.outline"
+        elif span["name"] in {"report.outline", "report.section"}:
+            assert parent_name(span) == "report.generate"
+
+    chrome = to_chrome_trace(spans)
+    assert len(chrome["traceEvents"]) == len(spans)
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in chrome["traceEvents"])
+
+
+def test_spans_record_errors_and_restore_context(trace_file: Path):
+    tracer = tracing.get_tracer()
+    with pytest.raises(RuntimeError):
+        with tracer.span("outer"):
+            with tracer.span("inner", attempt=1):
+                raise RuntimeError("boom")
+    assert tracing.current_span() is NOOP_SPAN
+
+    inner, outer = read_spans(trace_file)
+    assert inner["parent_span_id"] == outer["span_id"]
+    assert inner["status"] == "error"
+    assert inner["attributes"]["exception.message"] == "boom"
+
+
+def test_disabled_tracer_hands_out_noop_spans(monkeypatch):
+    monkeypatch.delenv("EXPLORER_TRACE_FILE", raising=False)
+    tracer = Tracer.from_env()
+    assert not tracer.enabled
+    assert tracer.span("anything", key="value") is NOOP_SPAN
+    with tracer.start_span("open") as span:
+        span.set_attribute("ignored", True)
+    assert tracing.current_span() is NOOP_SPAN